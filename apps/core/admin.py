@@ -1,3 +1,50 @@
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 
-# Register your models here.
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator for the admin changelists of large tables.
+
+    An unfiltered changelist on PostgreSQL takes its row count from the
+    planner statistics (pg_class.reltuples) instead of running COUNT(*)
+    over the whole table, once the estimate exceeds ``exact_count_limit``.
+    Filtered lists and small tables are still counted exactly.
+    """
+    exact_count_limit = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not queryset.query.where:
+            estimate = estimated_row_count(queryset.model, queryset.db)
+            if estimate is not None and estimate > self.exact_count_limit:
+                return estimate
+        return super().count
+
+
+def estimated_row_count(model, using):
+    """The planner's row estimate for ``model``'s table, or None if unknown."""
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", [model._meta.db_table])
+        row = cursor.fetchone()
+    # reltuples is -1 for a table that has never been vacuumed or analyzed.
+    if row is None or row[0] < 0:
+        return None
+    return row[0]
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """
+    Base for admins of tables that grow to millions of rows: estimated
+    counts, no second COUNT(*) for "N of M" on filtered lists, and
+    subclasses are expected to set list_select_related and
+    autocomplete_fields for every foreign key they show or edit.
+    """
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
@@ -1,6 +1,12 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.core'
+
+    def ready(self):
+        from . import checks  # noqa: F401
+        from .middleware import install_query_recorder
+        connection_created.connect(install_query_recorder, dispatch_uid="core-query-recorder")
@@ -0,0 +1,131 @@
+"""
+Generation-based invalidation for cached API responses.
+
+Every model label (or other label, such as one event's agenda) has a
+generation number stored in the shared cache. Cached payloads embed the
+generations of the labels they were built from,
+so bumping a generation makes every dependent entry unreachable at once,
+in every worker; orphaned entries simply age out through the backend's
+own TTL/culling. The payloads themselves may live in a per-process cache
+(API_CACHE_ALIAS); only the generations have to be shared.
+"""
+import time
+from contextlib import nullcontext
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+
+from .db_router import primary_reads
+
+
+def response_cache():
+    return caches[settings.API_CACHE_ALIAS]
+
+
+def generation_cache():
+    return caches[settings.SHARED_CACHE_ALIAS]
+
+
+# Backends whose add() and incr() are atomic. LocMemCache only within one
+# process, so counters kept there are per worker.
+ATOMIC_COUNTER_BACKENDS = (
+    "apps.core.cache_backends.DatabaseCounterCache",
+    "django.core.cache.backends.redis.RedisCache",
+    "django.core.cache.backends.memcached.PyMemcacheCache",
+    "django.core.cache.backends.memcached.PyLibMCCache",
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django_redis.cache.RedisCache",
+)
+
+
+def counter_cache(alias):
+    """
+    The cache ``alias`` for counters built on add()/incr(). The file,
+    database and dummy backends implement incr() as get-then-set, which
+    loses increments under concurrency, so they are refused.
+    """
+    backend = settings.CACHES[alias]["BACKEND"]
+    if backend not in ATOMIC_COUNTER_BACKENDS:
+        raise ImproperlyConfigured(
+            f"The {alias!r} cache holds counters and needs a backend with atomic incr() "
+            f"(e.g. Redis); {backend} is not one."
+        )
+    return caches[alias]
+
+
+def _generation_key(label):
+    return f"generation:{label}"
+
+
+def _fresh_generation():
+    # Seed from the clock rather than 1 so a generation key that got evicted
+    # can never come back with a value an old cache entry was built with.
+    return time.time_ns()
+
+
+def get_generations(labels):
+    cache = generation_cache()
+    keys = [_generation_key(label) for label in labels]
+    generations = cache.get_many(keys)
+    for key in keys:
+        if key not in generations:
+            cache.add(key, _fresh_generation(), timeout=None)
+            generations[key] = cache.get(key)
+    return [generations[key] for key in keys]
+
+
+def bump_generation(label):
+    # A plain set of a new clock value rather than incr(): no
+    # read-modify-write, so it is safe on backends without atomic incr.
+    generation_cache().set(_generation_key(label), _fresh_generation(), timeout=None)
+
+
+def versioned_key(label):
+    """
+    Return ``(key, generation)``: ``label`` with its current generation
+    appended. Read it before the rows a cached value is built from: once
+    invalidate_labels() bumps the generation, a value stored under the old
+    key by a slower reader can no longer be found.
+    """
+    generation, = get_generations([label])
+    return f"{label}:{generation}", generation
+
+
+def fill_reads(generations):
+    """
+    Context for the reads that build a cache entry keyed by ``generations``.
+    Generations are bump timestamps: while one is younger than
+    READ_YOUR_WRITES_SECONDS a replica may not have replayed the write yet,
+    and an entry built from its rows would be served under the new
+    generation, so the reads go to the primary.
+    """
+    horizon = time.time_ns() - settings.READ_YOUR_WRITES_SECONDS * 1_000_000_000
+    if any(generation > horizon for generation in generations):
+        return primary_reads()
+    return nullcontext()
+
+
+def invalidate_labels(labels):
+    """
+    Bump the generations of ``labels`` now and again once the surrounding
+    transaction commits, so a concurrent reader cannot re-cache the old rows
+    between the write and the commit.
+    """
+    labels = set(labels)
+    if not labels:
+        return
+    for label in labels:
+        bump_generation(label)
+    transaction.on_commit(lambda: [bump_generation(label) for label in labels])
+
+
+def invalidate_model(model):
+    """Invalidate every cached response built from ``model``'s rows."""
+    invalidate_labels([model._meta.label_lower])
+
+
+def bump_cache_generation(sender, **kwargs):
+    """post_save/post_delete receiver invalidating cached responses for ``sender``."""
+    invalidate_model(sender)
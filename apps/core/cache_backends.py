@@ -0,0 +1,101 @@
+"""
+A cache backend for counters, kept in the primary database.
+
+Django's file and database backends implement incr() as get-then-set, so
+they lose increments under concurrency. This one stores integers only, in
+the Counter table, and every write is a single conditional statement:
+add() is an INSERT that fails on an existing key, incr()/decr() an
+``UPDATE ... SET value = value + delta`` whose row lock holds until the new
+value has been read back. That makes it a counter store shared by all
+workers (see ``apps.core.cache.counter_cache``) without running Redis, at
+the cost of a few queries per call.
+
+Expired rows are treated as missing and deleted now and then: about one
+insert in ``OPTIONS["CULL_EVERY"]`` (default 100) sweeps them.
+"""
+import random
+import time
+from datetime import datetime, timezone as dt_timezone
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.db import IntegrityError, router, transaction
+from django.db.models import F, Q
+
+
+def _now():
+    # The clock BaseCache.get_backend_timeout() computes expiry times with.
+    return datetime.fromtimestamp(time.time(), tz=dt_timezone.utc)
+
+
+class DatabaseCounterCache(BaseCache):
+    def __init__(self, location, params):
+        super().__init__(params)
+        self._location = location
+        self._cull_every = params.get("OPTIONS", {}).get("CULL_EVERY", 100)
+
+    def _key(self, key, version=None):
+        return f"{self._location}:{self.make_and_validate_key(key, version)}"
+
+    def _objects(self):
+        from .models import Counter
+
+        return Counter.objects.using(router.db_for_write(Counter))
+
+    def _live(self, key):
+        return Q(key=key) & (Q(expires__isnull=True) | Q(expires__gt=_now()))
+
+    def _expires(self, timeout):
+        expiry = self.get_backend_timeout(timeout)
+        return None if expiry is None else datetime.fromtimestamp(expiry, tz=dt_timezone.utc)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self._key(key, version)
+        expires = self._expires(timeout)
+        objects = self._objects()
+        # Take over an expired row; concurrent callers re-check the WHERE
+        # once the first has updated it, so only one of them succeeds.
+        if objects.filter(key=key, expires__lte=_now()).update(value=value, expires=expires):
+            return True
+        try:
+            with transaction.atomic(using=objects.db):
+                objects.create(key=key, value=value, expires=expires)
+        except IntegrityError:
+            return False
+        if random.randrange(self._cull_every) == 0:
+            self._cull()
+        return True
+
+    def get(self, key, default=None, version=None):
+        value = self._objects().filter(self._live(self._key(key, version))).values_list("value", flat=True).first()
+        return default if value is None else value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self._objects().update_or_create(
+            key=self._key(key, version), defaults={"value": value, "expires": self._expires(timeout)}
+        )
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return bool(self._objects().filter(self._live(self._key(key, version))).update(expires=self._expires(timeout)))
+
+    def incr(self, key, delta=1, version=None):
+        stored_key = self._key(key, version)
+        objects = self._objects()
+        with transaction.atomic(using=objects.db):
+            if not objects.filter(self._live(stored_key)).update(value=F("value") + delta):
+                raise ValueError(f"Key '{key}' not found")
+            # The UPDATE keeps the row locked until commit, so this is the
+            # value our own increment produced.
+            return objects.filter(key=stored_key).values_list("value", flat=True).get()
+
+    def delete(self, key, version=None):
+        deleted, _ = self._objects().filter(key=self._key(key, version)).delete()
+        return bool(deleted)
+
+    def has_key(self, key, version=None):
+        return self._objects().filter(self._live(self._key(key, version))).exists()
+
+    def clear(self):
+        self._objects().filter(key__startswith=f"{self._location}:").delete()
+
+    def _cull(self):
+        self._objects().filter(expires__lte=_now()).delete()
@@ -0,0 +1,53 @@
+"""
+System checks for the cache aliases that hold counters (see
+``apps.core.cache.counter_cache``) and for the shared cache.
+"""
+from django.conf import settings
+from django.core.checks import Error, Tags, Warning, register
+
+from .cache import ATOMIC_COUNTER_BACKENDS
+
+LOCMEM_BACKEND = "django.core.cache.backends.locmem.LocMemCache"
+
+
+def counter_cache_aliases():
+    return (settings.THROTTLE_CACHE_ALIAS, settings.ADMISSION_CACHE_ALIAS)
+
+
+@register(Tags.caches)
+def check_counter_caches(app_configs, **kwargs):
+    errors = []
+    for alias in counter_cache_aliases():
+        backend = settings.CACHES[alias]["BACKEND"]
+        if backend not in ATOMIC_COUNTER_BACKENDS:
+            errors.append(Error(
+                f"The {alias!r} cache uses {backend}, whose incr() is not atomic.",
+                hint="Point it at Redis or memcached.",
+                id="core.E001",
+            ))
+    return errors
+
+
+@register(Tags.caches, deploy=True)
+def check_counter_caches_shared(app_configs, **kwargs):
+    return [
+        Warning(
+            f"The {alias!r} cache is per process, so its limits apply per worker.",
+            hint="Point it at Redis or memcached shared by all workers.",
+            id="core.W001",
+        )
+        for alias in counter_cache_aliases()
+        if settings.CACHES[alias]["BACKEND"] == LOCMEM_BACKEND
+    ]
+
+
+@register(Tags.caches, deploy=True)
+def check_shared_cache(app_configs, **kwargs):
+    if settings.CACHES[settings.SHARED_CACHE_ALIAS]["BACKEND"] != LOCMEM_BACKEND:
+        return []
+    return [Warning(
+        f"The {settings.SHARED_CACHE_ALIAS!r} cache is per process, so cache invalidations, "
+        "read-your-writes pins and seat counts do not reach other workers.",
+        hint="Point SHARED_CACHE_URL at Redis or memcached shared by all workers.",
+        id="core.W002",
+    )]
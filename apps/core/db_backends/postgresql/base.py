@@ -0,0 +1,8 @@
+"""PostgreSQL backend that records connection checkouts in apps.core.db_metrics."""
+from django.db.backends.postgresql import base
+
+from apps.core.db_metrics import InstrumentedConnectionMixin
+
+
+class DatabaseWrapper(InstrumentedConnectionMixin, base.DatabaseWrapper):
+    pass
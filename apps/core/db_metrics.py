@@ -0,0 +1,122 @@
+"""
+Per-worker database connection metrics.
+
+The project's database backend (apps.core.db_backends.postgresql) times
+every connection checkout: a fresh connect when connections are persistent,
+a ``getconn()`` from the psycopg pool when DATABASE_POOL is on. Failed
+checkouts and connections dropped by a failed health check are counted
+too. Counters live in process memory, so each gunicorn worker reports its
+own numbers.
+"""
+import os
+import threading
+import time
+
+from django.db import connections
+
+
+class ConnectionMetrics:
+    """Checkout counters per database alias, shared by the threads of one process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._aliases = {}
+
+    def _entry(self, alias):
+        return self._aliases.setdefault(alias, {
+            "checkouts": 0,
+            "checkout_failures": 0,
+            "health_check_failures": 0,
+            "wait_ms_total": 0.0,
+            "wait_ms_max": 0.0,
+        })
+
+    def record_checkout(self, alias, seconds, failed=False):
+        wait_ms = seconds * 1000
+        with self._lock:
+            entry = self._entry(alias)
+            if failed:
+                entry["checkout_failures"] += 1
+            else:
+                entry["checkouts"] += 1
+            entry["wait_ms_total"] += wait_ms
+            entry["wait_ms_max"] = max(entry["wait_ms_max"], wait_ms)
+
+    def record_health_check_failure(self, alias):
+        with self._lock:
+            self._entry(alias)["health_check_failures"] += 1
+
+    def snapshot(self, aliases=()):
+        with self._lock:
+            for alias in aliases:
+                self._entry(alias)
+            result = {}
+            for alias, entry in self._aliases.items():
+                attempts = entry["checkouts"] + entry["checkout_failures"]
+                result[alias] = {
+                    **entry,
+                    "wait_ms_total": round(entry["wait_ms_total"], 2),
+                    "wait_ms_max": round(entry["wait_ms_max"], 2),
+                    "wait_ms_avg": round(entry["wait_ms_total"] / attempts, 2) if attempts else 0.0,
+                }
+            return result
+
+    def reset(self):
+        with self._lock:
+            self._aliases.clear()
+
+
+metrics = ConnectionMetrics()
+
+
+class InstrumentedConnectionMixin:
+    """DatabaseWrapper mixin feeding ``metrics``."""
+
+    def get_new_connection(self, conn_params):
+        start = time.perf_counter()
+        try:
+            connection = super().get_new_connection(conn_params)
+        except Exception:
+            metrics.record_checkout(self.alias, time.perf_counter() - start, failed=True)
+            raise
+        metrics.record_checkout(self.alias, time.perf_counter() - start)
+        return connection
+
+    def close_if_health_check_failed(self):
+        was_open = self.connection is not None
+        super().close_if_health_check_failed()
+        if was_open and self.connection is None:
+            metrics.record_health_check_failure(self.alias)
+
+
+def _pool_stats(connection):
+    pool = getattr(connection, "pool", None)
+    if pool is None:
+        return None
+    # psycopg_pool counters: pool_size/pool_available are current values,
+    # requests_* and connections_* are cumulative since the pool started.
+    return pool.get_stats()
+
+
+def _mode(connection, pool):
+    if pool is not None:
+        return "pool"
+    # CONN_MAX_AGE=None keeps connections open indefinitely.
+    return "per-request" if connection.settings_dict["CONN_MAX_AGE"] == 0 else "persistent"
+
+
+def database_metrics():
+    """Everything the metrics endpoint reports for this worker."""
+    checkouts = metrics.snapshot(connections)
+    databases = {}
+    for alias in connections:
+        connection = connections[alias]
+        pool = _pool_stats(connection)
+        databases[alias] = {
+            "mode": _mode(connection, pool),
+            "conn_max_age": connection.settings_dict["CONN_MAX_AGE"],
+            "health_checks": connection.settings_dict["CONN_HEALTH_CHECKS"],
+            **checkouts[alias],
+            "pool": pool,
+        }
+    return {"pid": os.getpid(), "databases": databases}
@@ -0,0 +1,153 @@
+"""
+Primary/replica database routing with read-your-writes stickiness.
+
+ReplicaRoutingMiddleware marks safe-method requests as eligible for
+replica reads; PrimaryReplicaRouter then sends all their reads to one of
+DATABASE_REPLICAS, picked once per request so a response never mixes rows
+from replicas at different positions. Everything else, including every
+write, uses the primary. A successful unsafe request pins its user to the primary for
+READ_YOUR_WRITES_SECONDS through a key in the shared cache, so the user's
+next reads see what they just wrote even if the replicas lag.
+
+Whether a user is pinned is decided at the request's first read, after
+DRF has authenticated it; reads that happen before the user is known go
+to the primary. Code that fills a shared cache can send its reads to the
+primary with ``primary_reads()``.
+"""
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.functional import SimpleLazyObject, empty
+from rest_framework.permissions import SAFE_METHODS
+
+_routing = ContextVar("db_read_routing", default=None)
+
+_UNKNOWN = object()
+
+
+def _pin_key(user_id):
+    return f"db:pin:{user_id}"
+
+
+def _user_id(request):
+    """The authenticated user's pk, None when anonymous, _UNKNOWN if not authenticated yet."""
+    user = request.__dict__.get("user")
+    if isinstance(user, SimpleLazyObject):
+        # AuthenticationMiddleware's lazy session user; resolving it would
+        # itself query the database.
+        if user._wrapped is empty:
+            return _UNKNOWN
+        user = user._wrapped
+    if user is None:
+        return _UNKNOWN
+    return user.pk if user.is_authenticated else None
+
+
+def pin_to_primary(user_id):
+    caches[settings.SHARED_CACHE_ALIAS].set(_pin_key(user_id), True, settings.READ_YOUR_WRITES_SECONDS)
+
+
+class ReadRouting:
+    """Per-request state: may reads of this request go to a replica?"""
+
+    def __init__(self, request):
+        self.request = request
+        self.pinned = None
+        self.replica = None
+
+    def use_replica(self):
+        if self.pinned is None:
+            user_id = _user_id(self.request)
+            if user_id is _UNKNOWN:
+                return False
+            self.pinned = user_id is not None and bool(
+                caches[settings.SHARED_CACHE_ALIAS].get(_pin_key(user_id))
+            )
+        return not self.pinned
+
+    def read_alias(self):
+        """This request's replica, or None for the primary."""
+        if not self.use_replica():
+            return None
+        if self.replica is None:
+            self.replica = random.choice(settings.DATABASE_REPLICAS)
+        return self.replica
+
+
+@contextmanager
+def primary_reads():
+    """Send the reads made inside the block to the primary."""
+    token = _routing.set(None)
+    try:
+        yield
+    finally:
+        _routing.reset(token)
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        routing = _routing.get()
+        if routing is None or not settings.DATABASE_REPLICAS:
+            return None
+        return routing.read_alias()
+
+    def db_for_write(self, model, **hints):
+        routing = _routing.get()
+        if routing is not None:
+            # A write inside a read request: read the rest of it from the primary.
+            routing.pinned = True
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db not in settings.DATABASE_REPLICAS
+
+
+class ReplicaRoutingMiddleware:
+    """Enable replica reads for safe requests and pin users after writes."""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = _routing.set(self._routing_for(request))
+        try:
+            response = self.get_response(request)
+        finally:
+            _routing.reset(token)
+        self._finish(request, response)
+        return response
+
+    async def __acall__(self, request):
+        token = _routing.set(self._routing_for(request))
+        try:
+            response = await self.get_response(request)
+        finally:
+            _routing.reset(token)
+        self._finish(request, response)
+        return response
+
+    def _routing_for(self, request):
+        if settings.DATABASE_REPLICAS and request.method in SAFE_METHODS:
+            return ReadRouting(request)
+        return None
+
+    def _finish(self, request, response):
+        if not settings.DATABASE_REPLICAS or request.method in SAFE_METHODS or response.status_code >= 400:
+            return
+        user_id = _user_id(request)
+        if user_id is not _UNKNOWN and user_id is not None:
+            pin_to_primary(user_id)
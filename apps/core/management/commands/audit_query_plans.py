@@ -0,0 +1,163 @@
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.core.mixins import CachedResponseMixin
+from apps.events.models import Event, Session, Speaker, Track, Venue
+from apps.events.upcoming import build_upcoming_feed
+from apps.events.views import EventViewSet, SessionViewSet, SpeakerViewSet, TrackViewSet, VenueViewSet
+from apps.registrations.models import Registration, WaitlistEntry
+from apps.registrations.testing import seed_dataset
+from apps.registrations.views import RegistrationViewSet
+from apps.users.testing import UserFactory
+
+
+class Command(BaseCommand):
+    help = (
+        "Run EXPLAIN on the queries the API viewsets (and the hot model checks) "
+        "issue and fail if any plan contains a sequential scan. Everything runs "
+        "in a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seed", action="store_true", help="Seed a synthetic dataset first.")
+        parser.add_argument("--events", type=int, default=50)
+        parser.add_argument("--sessions", type=int, default=2000)
+        parser.add_argument("--registrations", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        if connection.vendor not in ("postgresql", "sqlite"):
+            raise CommandError(f"Plan audit is not supported on {connection.vendor}.")
+
+        with transaction.atomic():
+            try:
+                failures = self._audit(options)
+            finally:
+                transaction.set_rollback(True)
+
+        if failures:
+            raise CommandError(f"{failures} query plan(s) with sequential scans")
+        self.stdout.write(self.style.SUCCESS("No sequential scans found"))
+
+    def _audit(self, options):
+        if options["seed"]:
+            seed_dataset(
+                events=options["events"],
+                sessions=options["sessions"],
+                registrations=options["registrations"],
+            )
+        if not Session.objects.exists() or not Registration.objects.exists():
+            raise CommandError("No sessions or registrations to audit; run with --seed.")
+        if connection.vendor == "postgresql":
+            # Small tables are cheaper to scan, so ask the planner to avoid
+            # scans whenever an index can serve the query: a sequential scan
+            # left in the plan then means no usable index exists.
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+
+        failures = 0
+        for name, run in self._cases():
+            statements = []
+
+            def record(execute, sql, params, many, context):
+                statements.append((sql, params))
+                return execute(sql, params, many, context)
+
+            with connection.execute_wrapper(record):
+                run()
+
+            scans = sorted({table for sql, params in statements for table in self._sequential_scans(sql, params)})
+            if scans:
+                failures += 1
+                self.stdout.write(self.style.ERROR(f"SEQ SCAN {name}: {', '.join(scans)}"))
+            else:
+                self.stdout.write(f"ok       {name} ({len(statements)} queries)")
+        return failures
+
+    def _cases(self):
+        session = Session.objects.select_related("track").order_by("pk").first()
+        event_id = session.track.event_id
+        venue_id = Event.objects.values_list("venue_id", flat=True).get(pk=event_id)
+        registration = Registration.objects.order_by("pk").first()
+        organizer = UserFactory(is_organizer=True)
+        attendee = registration.attendee
+        WaitlistEntry.objects.create(attendee=organizer, event_id=event_id)
+
+        def view(viewset, action, params=None, user=None, **kwargs):
+            return lambda: self._call_view(viewset, action, params or {}, user, kwargs)
+
+        return [
+            ("venue list", view(VenueViewSet, "list")),
+            ("venue detail", view(VenueViewSet, "retrieve", pk=Venue.objects.values_list("pk", flat=True).first())),
+            ("event list", view(EventViewSet, "list")),
+            ("event list ?expand=venue", view(EventViewSet, "list", {"expand": "venue"})),
+            ("event list ?upcoming", view(EventViewSet, "list", {"upcoming": "true"})),
+            ("event list ?ongoing", view(EventViewSet, "list", {"ongoing": "true"})),
+            ("event list ?venue", view(EventViewSet, "list", {"venue": venue_id})),
+            ("event list ?start_after&start_before", view(
+                EventViewSet, "list", {"start_after": "2025-01-01", "start_before": "2025-02-01"},
+            )),
+            ("upcoming feed", build_upcoming_feed),
+            ("event detail", view(EventViewSet, "retrieve", pk=event_id)),
+            ("track list ?expand=event", view(TrackViewSet, "list", {"expand": "event"})),
+            ("track detail", view(TrackViewSet, "retrieve", pk=session.track_id)),
+            ("speaker list", view(SpeakerViewSet, "list")),
+            ("speaker detail", view(SpeakerViewSet, "retrieve", pk=Speaker.objects.values_list("pk", flat=True).first())),
+            ("session list", view(SessionViewSet, "list")),
+            ("session list ?event", view(SessionViewSet, "list", {"event": event_id})),
+            ("session list ?track", view(SessionViewSet, "list", {"track": session.track_id})),
+            ("session detail", view(SessionViewSet, "retrieve", pk=session.pk)),
+            ("registration list (organizer)", view(RegistrationViewSet, "list", user=organizer)),
+            ("registration list (attendee)", view(RegistrationViewSet, "list", user=attendee)),
+            ("session track overlap check", lambda: Session.objects.filter(
+                track_id=session.track_id, start_time__lt=session.end_time, end_time__gt=session.start_time,
+            ).exclude(pk=session.pk).exists()),
+            ("event registration count", lambda: Registration.objects.filter(event_id=event_id).count()),
+            ("waitlist head", lambda: WaitlistEntry.objects.filter(event_id=event_id).order_by("id").first()),
+        ]
+
+    def _call_view(self, viewset, action, params, user, kwargs):
+        # Call the handler directly: no throttling, and below the response cache.
+        host = next((host.lstrip(".") for host in settings.ALLOWED_HOSTS if host != "*"), "localhost")
+        request = APIRequestFactory().get("/", params, HTTP_HOST=host)
+        if user is not None:
+            force_authenticate(request, user=user)
+        view = viewset(action=action, action_map={"get": action}, args=(), kwargs=kwargs, format_kwarg=None)
+        view.request = view.initialize_request(request)
+        view.headers = {}
+        handler = getattr(view, action)
+        if isinstance(view, CachedResponseMixin):
+            handler = getattr(super(CachedResponseMixin, view), action)
+        response = handler(view.request, **kwargs)
+        if response.status_code != 200:
+            raise CommandError(f"{viewset.__name__}.{action} returned {response.status_code}")
+
+    def _sequential_scans(self, sql, params):
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+                plan = cursor.fetchone()[0]
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                return list(_postgres_seq_scans(plan[0]["Plan"]))
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            scans = [
+                detail.split()[1]
+                for *_, detail in cursor.fetchall()
+                if detail.startswith("SCAN ") and " USING " not in detail
+            ]
+            # SQLite tables are clustered on the integer primary key, so a
+            # "SCAN" that walks it in key order (keyset pagination by id) is
+            # the equivalent of a primary key index scan.
+            return [table for table in scans if f'ORDER BY "{table}"."id" ASC' not in sql]
+
+
+def _postgres_seq_scans(node):
+    if node.get("Node Type") == "Seq Scan":
+        yield node["Relation Name"]
+    for child in node.get("Plans", ()):
+        yield from _postgres_seq_scans(child)
@@ -0,0 +1,129 @@
+import json
+import logging
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+slow_request_logger = logging.getLogger("apps.slow_requests")
+
+# Stats of the request being served. A ContextVar (rather than a per-request
+# execute_wrapper) also reaches the worker threads the async ORM runs in.
+_current_stats = ContextVar("query_stats", default=None)
+
+
+class QueryStats:
+    """Counts, times and fingerprints every statement of one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        # SQL is still parameterized here (params are passed separately), so
+        # identical text means the same statement shape: an N+1 fingerprint.
+        self.statements = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.count += 1
+            self.duration += elapsed
+            entry = self.statements.setdefault(sql, [0, 0.0])
+            entry[0] += 1
+            entry[1] += elapsed
+
+    def repeated(self, threshold):
+        return [
+            {"sql": sql, "count": count}
+            for sql, (count, _) in self.statements.items()
+            if count >= threshold
+        ]
+
+    def top(self, limit=5):
+        ranked = sorted(self.statements.items(), key=lambda item: item[1][1], reverse=True)
+        return [
+            {"sql": sql, "count": count, "total_ms": round(total * 1000, 2)}
+            for sql, (count, total) in ranked[:limit]
+        ]
+
+
+def record_query(execute, sql, params, many, context):
+    """execute_wrapper installed on every connection; a no-op outside requests."""
+    stats = _current_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    return stats(execute, sql, params, many, context)
+
+
+def install_query_recorder(sender, connection, **kwargs):
+    """connection_created receiver attaching record_query once per connection."""
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+class QueryInstrumentationMiddleware:
+    """
+    Adds a ``Server-Timing`` header with database and total time to every
+    response and writes requests slower than SLOW_REQUEST_THRESHOLD_MS to
+    the ``apps.slow_requests`` logger as JSON, including the most expensive
+    statements and any statement repeated N_PLUS_ONE_THRESHOLD times or
+    more.
+
+    Works for both sync and async views. Queries issued while a streaming
+    response is being consumed happen after the middleware returns and are
+    not counted.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        stats = QueryStats()
+        token = _current_stats.set(stats)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_stats.reset(token)
+        return self._finish(request, response, stats, start)
+
+    async def __acall__(self, request):
+        stats = QueryStats()
+        token = _current_stats.set(stats)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_stats.reset(token)
+        return self._finish(request, response, stats, start)
+
+    def _finish(self, request, response, stats, start):
+        total_ms = (time.perf_counter() - start) * 1000
+        db_ms = stats.duration * 1000
+
+        timing = f'db;dur={db_ms:.1f};desc="{stats.count} queries", app;dur={total_ms:.1f}'
+        if response.has_header("Server-Timing"):
+            timing = f"{response['Server-Timing']}, {timing}"
+        response["Server-Timing"] = timing
+
+        if total_ms >= settings.SLOW_REQUEST_THRESHOLD_MS:
+            slow_request_logger.warning(json.dumps({
+                "method": request.method,
+                "path": request.get_full_path(),
+                "status": response.status_code,
+                "duration_ms": round(total_ms, 2),
+                "db_ms": round(db_ms, 2),
+                "queries": stats.count,
+                "n_plus_one": stats.repeated(settings.N_PLUS_ONE_THRESHOLD),
+                "top_statements": stats.top(),
+            }))
+        return response
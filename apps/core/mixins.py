@@ -0,0 +1,101 @@
+import hashlib
+
+from django.conf import settings
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from .cache import fill_reads, get_generations, response_cache
+from .compiled import compile_serializer
+from .serializers import optimize_queryset, parse_list_param
+
+
+class CachedResponseMixin:
+    """
+    Cache the serialized payload of ``list`` and ``retrieve``.
+
+    Keys include the full request URL (so query params such as search,
+    ordering and cursor are honoured) and the current generation of every
+    model label in ``cache_dependencies``; saving or deleting any of those
+    models bumps its generation and therefore invalidates the entry. Misses
+    shortly after a bump are built from the primary (see fill_reads).
+    """
+    cache_dependencies = ()
+
+    def list(self, request, *args, **kwargs):
+        return self._cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached_response(super().retrieve, request, *args, **kwargs)
+
+    def get_response_cache_key(self, request):
+        generations = self.cache_generations = get_generations(self.cache_dependencies)
+        url = request.build_absolute_uri()
+        digest = hashlib.sha256(url.encode()).hexdigest()
+        return ":".join(["response", self.basename, self.action, digest, *map(str, generations)])
+
+    def _cached_response(self, handler, request, *args, **kwargs):
+        cache = response_cache()
+        key = self.get_response_cache_key(request)
+        data = cache.get(key)
+        if data is not None:
+            response = Response(data)
+            response["X-Cache"] = "HIT"
+            return response
+
+        with fill_reads(self.cache_generations):
+            response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, response.data, settings.API_CACHE_TIMEOUT)
+        response["X-Cache"] = "MISS"
+        return response
+
+
+class ExpandableQuerysetMixin:
+    """
+    Pair with ExpandableFieldsMixin serializers: reads select only the
+    relations the client expanded and, with ``?fields=``, only the columns
+    it asked for (plus whatever the paginator orders by).
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request.method not in SAFE_METHODS:
+            return queryset
+        ordering = list(getattr(self.pagination_class, "ordering", ()))
+        ordering += parse_list_param(self.request.query_params.get(api_settings.ORDERING_PARAM))
+        return optimize_queryset(
+            queryset,
+            self.get_serializer_class(),
+            self.request,
+            extra_fields=[field.lstrip("-") for field in ordering],
+        )
+
+
+class CompiledListMixin:
+    """
+    Serve ``list`` through a compiled serializer over ``values()`` rows
+    instead of model instances (see apps.core.compiled). The JSON is
+    byte-identical; set ``compiled_list = False`` to switch it off, and
+    serializers that cannot be compiled fall back automatically.
+    """
+    compiled_list = True
+
+    def list(self, request, *args, **kwargs):
+        compiled = compile_serializer(self.get_serializer()) if self.compiled_list else None
+        if compiled is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        columns = list(compiled.columns)
+        paginator = self.paginator
+        if paginator is not None:
+            # Cursor pagination reads its position from the row dicts.
+            ordering = paginator.get_ordering(request, queryset, self)
+            columns += [field.lstrip("-") for field in ordering]
+        rows = queryset.values(*dict.fromkeys(columns))
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(compiled.render_many(page))
+        return Response(compiled.render_many(rows))
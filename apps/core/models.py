@@ -1,3 +1,15 @@
 from django.db import models
 
-# Create your models here.
+
+class Counter(models.Model):
+    """
+    One integer of a DatabaseCounterCache (apps.core.cache_backends). The
+    key carries the cache's LOCATION, so several aliases share the table.
+    """
+    key = models.CharField(max_length=255, primary_key=True)
+    value = models.BigIntegerField()
+    # Null never expires.
+    expires = models.DateTimeField(null=True, db_index=True)
+
+    def __str__(self):
+        return f"{self.key} = {self.value}"
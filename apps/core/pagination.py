@@ -0,0 +1,70 @@
+import base64
+import binascii
+import json
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework import pagination
+from rest_framework.settings import api_settings
+
+
+class CursorPagination(pagination.CursorPagination):
+    """
+    Keyset pagination over an indexed ordering. Every page is a range scan
+    starting from the cursor position, so deep pages cost the same as the
+    first one and no COUNT(*) is ever issued.
+    """
+    ordering = ("id",)
+    page_size_query_param = "page_size"
+    max_page_size = settings.API_MAX_PAGE_SIZE
+
+    def get_ordering(self, request, queryset, view):
+        if "search_rank" in queryset.query.annotations and not request.query_params.get(api_settings.ORDERING_PARAM):
+            # Full-text results are paginated by relevance unless the client
+            # asked for an explicit ordering.
+            ordering = ("-search_rank",)
+        else:
+            ordering = super().get_ordering(request, queryset, view)
+        # Always end with the primary key so client supplied orderings
+        # (?ordering=title) stay unique and stable across pages.
+        if not any(field.lstrip("-") in ("id", "pk") for field in ordering):
+            ordering += ("id",)
+        return ordering
+
+
+def encode_keyset_cursor(instance, ordering):
+    """Opaque cursor holding the ordering values of ``instance``."""
+    values = [getattr(instance, field.lstrip("-")) for field in ordering]
+    # Full-precision isoformat; DjangoJSONEncoder would truncate microseconds.
+    payload = json.dumps([value.isoformat() if hasattr(value, "isoformat") else value for value in values])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_keyset_cursor(cursor, model, ordering):
+    """Inverse of encode_keyset_cursor(); raises ValueError on a bad cursor."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(ordering):
+            raise ValueError("cursor does not match the ordering")
+        return [
+            model._meta.get_field(field.lstrip("-")).to_python(value)
+            for field, value in zip(ordering, values)
+        ]
+    except (TypeError, binascii.Error, json.JSONDecodeError, ValidationError) as exc:
+        raise ValueError("invalid cursor") from exc
+
+
+def keyset_filter(ordering, position):
+    """
+    Q object selecting rows strictly after ``position`` in ``ordering``,
+    e.g. for ("-start_date", "id"): start_date < s OR (start_date = s AND id > i).
+    """
+    condition = Q()
+    equal = Q()
+    for field, value in zip(ordering, position):
+        name = field.lstrip("-")
+        lookup = "lt" if field.startswith("-") else "gt"
+        condition |= equal & Q(**{f"{name}__{lookup}": value})
+        equal &= Q(**{name: value})
+    return condition
@@ -4,4 +4,8 @@ class IsOrganizerOrReadOnly(permissions.BasePermission):
     def has_permission(self, request, view):
         if request.method in permissions.SAFE_METHODS:
             return True
-        return request.user and request.user.is_authenticated and request.user.is_organizer
\ No newline at end of file
+        return request.user and request.user.is_authenticated and request.user.is_organizer
+
+class IsOrganizer(permissions.BasePermission):
+    def has_permission(self, request, view):
+        return bool(request.user and request.user.is_authenticated and request.user.is_organizer)
@@ -0,0 +1,61 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connections
+from django.db.models import FloatField
+from django.db.models.functions import Cast
+from rest_framework import filters
+
+SEARCH_CONFIG = "english"
+SEARCH_WEIGHTS = ("A", "B", "C", "D")
+
+
+def search_vector(*fields):
+    """
+    Weighted tsvector over ``fields``; the first field ranks highest.
+
+    GIN expression indexes must be declared with this same helper and the
+    same field order as the view's ``search_fields`` so that PostgreSQL can
+    match the query expression against the index.
+    """
+    vector = None
+    for position, field in enumerate(fields):
+        weight = SEARCH_WEIGHTS[min(position, len(SEARCH_WEIGHTS) - 1)]
+        part = SearchVector(field, weight=weight, config=SEARCH_CONFIG)
+        vector = part if vector is None else vector + part
+    return vector
+
+
+def prefix_query(terms):
+    """Match every word as a prefix, so partial input from a search box hits."""
+    words = re.findall(r"\w+", " ".join(terms))
+    if not words:
+        return None
+    return SearchQuery(" & ".join(f"{word}:*" for word in words), search_type="raw", config=SEARCH_CONFIG)
+
+
+class FullTextSearchFilter(filters.SearchFilter):
+    """
+    Drop-in replacement for SearchFilter driven by the same ``search_fields``.
+
+    On PostgreSQL the search runs against a GIN-indexed tsvector and results
+    are annotated with ``search_rank``; other databases fall back to the
+    regular ``icontains`` search.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        search_fields = self.get_search_fields(view, request)
+        search_terms = self.get_search_terms(request)
+        if not search_fields or not search_terms:
+            return queryset
+        if connections[queryset.db].vendor != "postgresql":
+            return super().filter_queryset(request, queryset, view)
+
+        query = prefix_query(search_terms)
+        if query is None:
+            return queryset
+        vector = search_vector(*(field.lstrip("^=@$") for field in search_fields))
+        return queryset.alias(search_document=vector).filter(search_document=query).annotate(
+            # ts_rank() returns a real; cast so the cursor position round-trips exactly.
+            search_rank=Cast(SearchRank(vector, query), FloatField())
+        )
@@ -0,0 +1,114 @@
+from rest_framework import serializers
+
+
+def parse_list_param(value):
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+
+def parse_expand(value):
+    """Turn ``"track.event.venue,speaker"`` into ``{"track": {"event": {"venue": {}}}, "speaker": {}}``."""
+    tree = {}
+    for path in parse_list_param(value):
+        node = tree
+        for name in path.split("."):
+            node = node.setdefault(name, {})
+    return tree
+
+
+def prune_expand(serializer_class, tree):
+    """Drop expansions the serializer (or its nested serializers) does not offer."""
+    expandable = getattr(serializer_class, "expandable_fields", {})
+    return {
+        name: prune_expand(expandable[name], subtree)
+        for name, subtree in tree.items()
+        if name in expandable
+    }
+
+
+class ExpandableFieldsMixin:
+    """
+    Sparse fieldsets and opt-in nesting for ModelSerializers.
+
+    Relations listed in ``expandable_fields`` render as primary keys unless
+    the request asks for them with ``?expand=`` (dotted paths nest further,
+    e.g. ``?expand=track.event.venue``). ``?fields=`` limits the top-level
+    output to the given names. Only the root serializer reads the query
+    string; nested serializers receive their part of the expansion tree.
+    """
+    expandable_fields = {}
+
+    def __init__(self, *args, **kwargs):
+        self._expand = kwargs.pop("expand", None)
+        super().__init__(*args, **kwargs)
+
+    def get_requested_fields(self):
+        request = self.context.get("request")
+        if self._expand is not None or request is None:
+            return None
+        return set(parse_list_param(request.query_params.get("fields"))) or None
+
+    def get_expand(self):
+        if self._expand is not None:
+            return self._expand
+        request = self.context.get("request")
+        if request is None:
+            return {}
+        return prune_expand(type(self), parse_expand(request.query_params.get("expand")))
+
+    def get_fields(self):
+        fields = super().get_fields()
+        expand = self.get_expand()
+        for name, serializer_class in self.expandable_fields.items():
+            if name in fields and name in expand:
+                fields[name] = serializer_class(read_only=True, expand=expand[name])
+
+        requested = self.get_requested_fields()
+        if requested:
+            for name in list(fields):
+                if name not in requested and not fields[name].write_only:
+                    del fields[name]
+        return fields
+
+
+def optimize_queryset(queryset, serializer_class, request, extra_fields=()):
+    """
+    Shape ``queryset`` after what ``serializer_class`` will render for
+    ``request``: select_related() exactly the expanded relations and, when
+    ``?fields=`` is given, only() the columns those fields read.
+    ``extra_fields`` are always loaded (e.g. the pagination ordering).
+    """
+    expand = prune_expand(serializer_class, parse_expand(request.query_params.get("expand")))
+    paths = list(_relation_paths(expand))
+    if paths:
+        queryset = queryset.select_related(*paths)
+
+    requested = set(parse_list_param(request.query_params.get("fields")))
+    if requested:
+        model = queryset.model
+        concrete = {field.name for field in model._meta.concrete_fields}
+        declared = serializer_class().fields
+        columns = {"pk", *[name for name in extra_fields if name in concrete]}
+        for name in requested:
+            field = declared.get(name)
+            if field is not None and field.source in concrete:
+                columns.add(field.source)
+        columns.update(_expanded_columns(model, expand))
+        queryset = queryset.only(*columns)
+    return queryset
+
+
+def _relation_paths(tree, prefix=""):
+    for name, subtree in tree.items():
+        path = f"{prefix}{name}"
+        children = list(_relation_paths(subtree, f"{path}__"))
+        yield from children or [path]
+
+
+def _expanded_columns(model, tree, prefix=""):
+    # Nested serializers render every field, so expanded relations are loaded whole.
+    for name, subtree in tree.items():
+        related = model._meta.get_field(name).related_model
+        path = f"{prefix}{name}"
+        yield path
+        yield from (f"{path}__{field.name}" for field in related._meta.concrete_fields)
+        yield from _expanded_columns(related, subtree, f"{path}__")
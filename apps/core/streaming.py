@@ -0,0 +1,44 @@
+"""
+Helpers for streaming large exports with StreamingHttpResponse.
+"""
+import csv
+
+# Rows are joined into chunks of about this many characters so the server
+# does not issue one write per row.
+CHUNK_SIZE = 64 * 1024
+
+
+class Echo:
+    """File-like object whose write() returns the value, for csv.writer."""
+
+    def write(self, value):
+        return value
+
+
+def buffered(pieces, size=CHUNK_SIZE):
+    """
+    Regroup an iterable of strings into chunks of roughly ``size``. The
+    first piece is passed through on its own so the first byte goes out
+    before the rest of the export has been produced.
+    """
+    pieces = iter(pieces)
+    for first in pieces:
+        yield first
+        break
+    batch, length = [], 0
+    for piece in pieces:
+        batch.append(piece)
+        length += len(piece)
+        if length >= size:
+            yield "".join(batch)
+            batch, length = [], 0
+    if batch:
+        yield "".join(batch)
+
+
+def csv_lines(header, rows):
+    """Yield ``header`` and then each row as CSV-encoded lines."""
+    writer = csv.writer(Echo())
+    yield writer.writerow(header)
+    for row in rows:
+        yield writer.writerow(row)
@@ -0,0 +1,132 @@
+"""
+Sliding-window rate throttles backed by the throttle cache.
+
+DRF's SimpleRateThrottle keeps a list of request timestamps per client in
+the default (per-process) cache and rewrites it on every request. These
+throttles keep one integer counter per fixed window in the
+THROTTLE_CACHE_ALIAS cache instead, and approximate a sliding window by
+weighting the previous window's count by how much of it still overlaps:
+
+    estimate = previous * (1 - elapsed / duration) + current
+
+Each request costs one ``incr`` plus one ``get``. The alias must have an
+atomic incr() (see ``apps.core.cache.counter_cache``) and be shared by all
+workers (Redis or memcached) for the rates to hold across them.
+
+``throttled`` applies the same DEFAULT_THROTTLE_CLASSES to plain Django
+views (sync or async) that do not go through APIView.
+"""
+import math
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.http import JsonResponse
+from rest_framework import throttling
+from rest_framework.exceptions import APIException, Throttled
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from .cache import counter_cache
+
+
+class SlidingWindowMixin:
+    def __init__(self):
+        super().__init__()
+        self.cache = counter_cache(settings.THROTTLE_CACHE_ALIAS)
+        self.wait_seconds = None
+
+    def _increment(self, key):
+        try:
+            return self.cache.incr(key)
+        except ValueError:
+            # First hit in this window. add() is atomic, so if another worker
+            # created the key in the meantime fall back to incr().
+            if self.cache.add(key, 1, 2 * self.duration):
+                return 1
+            return self.cache.incr(key)
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        now = self.timer()
+        window, offset = divmod(now, self.duration)
+        window = int(window)
+        current_key = f"{self.key}:{window}"
+
+        current = self._increment(current_key)
+        previous = self.cache.get(f"{self.key}:{window - 1}", 0)
+        overlap = 1 - offset / self.duration
+        if previous * overlap + current <= self.num_requests:
+            return True
+
+        # Rejected requests do not use up the budget.
+        self.cache.decr(current_key)
+        current -= 1
+        if current >= self.num_requests or not previous:
+            self.wait_seconds = self.duration - offset
+        else:
+            # Time until enough of the previous window has slid out.
+            needed = self.duration * (1 - (self.num_requests - current - 1) / previous)
+            self.wait_seconds = max(needed - offset, 0)
+        return False
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class AnonRateThrottle(SlidingWindowMixin, throttling.AnonRateThrottle):
+    pass
+
+
+class UserRateThrottle(SlidingWindowMixin, throttling.UserRateThrottle):
+    pass
+
+
+def _throttle_response(request):
+    """
+    APIView.check_throttles for a plain Django request: authenticate it the
+    way the sync API does, so tokens get the user rate, and run every
+    DEFAULT_THROTTLE_CLASSES throttle. Returns the error response or None.
+    """
+    drf_request = Request(request, authenticators=[auth() for auth in api_settings.DEFAULT_AUTHENTICATION_CLASSES])
+    try:
+        waits = [
+            throttle.wait()
+            for throttle in (throttle_class() for throttle_class in api_settings.DEFAULT_THROTTLE_CLASSES)
+            if not throttle.allow_request(drf_request, None)
+        ]
+    except APIException as exc:
+        return JsonResponse({"detail": exc.detail}, status=exc.status_code)
+    if not waits:
+        return None
+    exc = Throttled(max((wait for wait in waits if wait is not None), default=None))
+    response = JsonResponse({"detail": exc.detail}, status=exc.status_code)
+    if exc.wait is not None:
+        response["Retry-After"] = str(math.ceil(exc.wait))
+    return response
+
+
+def throttled(view):
+    """Throttle a plain (sync or async) function view like the DRF views."""
+    if iscoroutinefunction(view):
+        @wraps(view)
+        async def async_wrapper(request, *args, **kwargs):
+            response = await sync_to_async(_throttle_response)(request)
+            if response is not None:
+                return response
+            return await view(request, *args, **kwargs)
+        return async_wrapper
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        response = _throttle_response(request)
+        if response is not None:
+            return response
+        return view(request, *args, **kwargs)
+    return wrapper
@@ -1,3 +1,16 @@
-from django.shortcuts import render
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-# Create your views here.
+from .db_metrics import database_metrics
+
+
+class DatabaseMetricsView(APIView):
+    """Connection checkout and pool metrics of the worker serving the request."""
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(responses=OpenApiTypes.OBJECT)
+    def get(self, request):
+        return Response(database_metrics())
@@ -1,33 +1,90 @@
 from django.contrib import admin
+from django.urls import reverse
+from django.utils.html import format_html
+
+from apps.core.admin import LargeTableAdmin
 from .models import Venue, Event, Track, Speaker, Session
 
+
+class EventFilter(admin.SimpleListFilter):
+    """
+    Filter by event that offers only the most recent events as links
+    instead of every event in the database; any event can still be
+    selected with ``?event=<id>`` (e.g. from the event changelist).
+    """
+    title = "event"
+    parameter_name = "event"
+    field_path = "event"
+    choices_limit = 20
+
+    def lookups(self, request, model_admin):
+        events = Event.objects.order_by("-start_date", "id").values_list("id", "title")[: self.choices_limit]
+        choices = [(str(pk), title) for pk, title in events]
+        selected = self.value()
+        if selected and selected.isdigit() and selected not in dict(choices):
+            title = Event.objects.filter(pk=selected).values_list("title", flat=True).first()
+            if title is not None:
+                choices.insert(0, (selected, title))
+        return choices
+
+    def queryset(self, request, queryset):
+        value = self.value()
+        if value and value.isdigit():
+            return queryset.filter(**{f"{self.field_path}_id": value})
+        return queryset
+
+
+class SessionEventFilter(EventFilter):
+    field_path = "track__event"
+
+
 @admin.register(Venue)
 class VenueAdmin(admin.ModelAdmin):
     list_display = ("name", "capacity")
     search_fields = ("name", "address")
 
 @admin.register(Event)
-class EventAdmin(admin.ModelAdmin):
-    list_display = ("title", "slug", "venue", "capacity", "start_date", "end_date")
+class EventAdmin(LargeTableAdmin):
+    list_display = ("title", "slug", "venue", "capacity", "seats", "start_date", "end_date")
     list_filter = ("venue",)
+    list_select_related = ("venue",)
+    autocomplete_fields = ("venue",)
     prepopulated_fields = {"slug": ("title",)}
     search_fields = ("title", "slug", "description")
 
+    @admin.display(description="registrations", ordering="seats_taken")
+    def seats(self, obj):
+        # The denormalized counter: no per-row COUNT over registrations.
+        url = reverse("admin:registrations_registration_changelist")
+        return format_html('<a href="{}?event={}">{}</a>', url, obj.pk, obj.seats_taken)
+
 
 @admin.register(Track)
-class TrackAdmin(admin.ModelAdmin):
+class TrackAdmin(LargeTableAdmin):
     list_display = ("title", "event")
+    list_filter = (EventFilter,)
+    list_select_related = ("event",)
+    autocomplete_fields = ("event",)
     search_fields = ("title", "description")
 
+    def get_queryset(self, request):
+        # Also covers the track autocomplete, whose labels include the event title.
+        return super().get_queryset(request).select_related("event")
+
 
 @admin.register(Speaker)
-class SpeakerAdmin(admin.ModelAdmin):
+class SpeakerAdmin(LargeTableAdmin):
     list_display = ("name", "user")
+    list_select_related = ("user",)
+    autocomplete_fields = ("user",)
     search_fields = ("name", "bio")
 
 
 @admin.register(Session)
-class SessionAdmin(admin.ModelAdmin):
+class SessionAdmin(LargeTableAdmin):
     list_display = ("title", "track", "start_time", "end_time", "room")
-    list_filter = ("track__event",)
+    list_filter = (SessionEventFilter,)
+    # Track.__str__ reads its event's title.
+    list_select_related = ("track__event",)
+    autocomplete_fields = ("track", "speaker")
     search_fields = ("title", "description", "room")
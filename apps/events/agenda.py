@@ -0,0 +1,68 @@
+"""
+Precomputed full-agenda document for one event.
+
+The agenda (event and venue, tracks, their sessions and speakers) is built
+from three queries and cached as rendered JSON bytes under a versioned key
+per event, so serving it is two cache reads (generation, then document).
+Signals in ``apps.events.signals`` bump the event's generation when
+anything the agenda contains changes.
+"""
+from django.conf import settings
+from django.db.models import Prefetch
+from rest_framework.renderers import JSONRenderer
+
+from apps.core.cache import fill_reads, invalidate_labels, response_cache, versioned_key
+from .models import Event, Session, Track
+from .serializers import EventSerializer, SessionSerializer, TrackSerializer
+
+
+def agenda_cache_key(event_id):
+    return f"agenda:{event_id}"
+
+
+def build_agenda(event_id):
+    """Return the agenda as a dict, or None if the event does not exist."""
+    sessions = Session.objects.select_related("speaker").order_by("start_time", "id")
+    event = (
+        Event.objects.select_related("venue")
+        .prefetch_related(
+            Prefetch("tracks", queryset=Track.objects.order_by("id").prefetch_related(
+                Prefetch("sessions", queryset=sessions)
+            ))
+        )
+        .filter(pk=event_id)
+        .first()
+    )
+    if event is None:
+        return None
+
+    data = EventSerializer(event, expand={"venue": {}}).data
+    # Seat counts change with every registration; they are not part of the agenda.
+    data.pop("registration_count", None)
+    data["tracks"] = []
+    for track in event.tracks.all():
+        track_data = TrackSerializer(track, expand={}).data
+        track_data["sessions"] = SessionSerializer(track.sessions.all(), many=True, expand={"speaker": {}}).data
+        data["tracks"].append(track_data)
+    return data
+
+
+def get_agenda_json(event_id):
+    """Rendered agenda bytes and whether they came from the cache; (None, False) if missing."""
+    cache = response_cache()
+    key, generation = versioned_key(agenda_cache_key(event_id))
+    content = cache.get(key)
+    if content is not None:
+        return content, True
+    with fill_reads([generation]):
+        data = build_agenda(event_id)
+    if data is None:
+        return None, False
+    content = JSONRenderer().render(data)
+    cache.set(key, content, settings.API_CACHE_TIMEOUT)
+    return content, False
+
+
+def invalidate_agenda(event_ids):
+    """Retire the cached agendas of ``event_ids`` (see apps.core.cache.invalidate_labels)."""
+    invalidate_labels(agenda_cache_key(event_id) for event_id in event_ids if event_id is not None)
@@ -0,0 +1,140 @@
+"""
+Native async read endpoints for the catalog.
+
+They mirror the list/retrieve output of EventViewSet, SessionViewSet and
+SpeakerViewSet (same serializers, ?fields= and ?expand=) but run on
+Django's async ORM, so under an ASGI server one worker can hold many slow
+clients without a thread each. Lists use keyset pagination on the same
+orderings as the sync viewsets and return ``{"next": ..., "results": [...]}``.
+They are read-only and public, but go through the same throttles as the
+sync API (see ``apps.core.throttling.throttled``).
+"""
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from apps.core.pagination import decode_keyset_cursor, encode_keyset_cursor, keyset_filter
+from apps.core.serializers import optimize_queryset
+from apps.core.throttling import throttled
+from .availability import availability_events, get_availability
+from .models import Event, Session, Speaker
+from .pagination import EventCursorPagination, SessionCursorPagination, SpeakerCursorPagination
+from .serializers import EventSerializer, SessionSerializer, SpeakerSerializer
+
+
+def _page_size(request):
+    try:
+        size = int(request.GET.get("page_size", api_settings.PAGE_SIZE))
+    except ValueError:
+        size = api_settings.PAGE_SIZE
+    return max(1, min(size, settings.API_MAX_PAGE_SIZE))
+
+
+def _render(data, status=200):
+    return HttpResponse(JSONRenderer().render(data), status=status, content_type="application/json")
+
+
+async def _list(request, queryset, serializer_class, ordering):
+    drf_request = Request(request)
+    queryset = optimize_queryset(
+        queryset, serializer_class, drf_request, extra_fields=[field.lstrip("-") for field in ordering]
+    ).order_by(*ordering)
+
+    cursor = request.GET.get("cursor")
+    if cursor:
+        try:
+            position = decode_keyset_cursor(cursor, queryset.model, ordering)
+        except ValueError:
+            return JsonResponse({"detail": "Invalid cursor"}, status=404)
+        queryset = queryset.filter(keyset_filter(ordering, position))
+
+    page_size = _page_size(request)
+    rows = [obj async for obj in queryset[: page_size + 1].aiterator()]
+    next_url = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        params = request.GET.copy()
+        params["cursor"] = encode_keyset_cursor(rows[-1], ordering)
+        next_url = request.build_absolute_uri(f"{request.path}?{params.urlencode()}")
+
+    results = serializer_class(rows, many=True, context={"request": drf_request}).data
+    return _render({"next": next_url, "results": results})
+
+
+async def _retrieve(request, queryset, serializer_class, pk):
+    drf_request = Request(request)
+    queryset = optimize_queryset(queryset, serializer_class, drf_request)
+    try:
+        instance = await queryset.aget(pk=pk)
+    except queryset.model.DoesNotExist:
+        return JsonResponse({"detail": "Not found."}, status=404)
+    return _render(serializer_class(instance, context={"request": drf_request}).data)
+
+
+@require_GET
+@throttled
+async def event_list(request):
+    return await _list(request, Event.objects.all(), EventSerializer, EventCursorPagination.ordering)
+
+
+@require_GET
+@throttled
+async def event_detail(request, pk):
+    return await _retrieve(request, Event.objects.all(), EventSerializer, pk)
+
+
+@require_GET
+@throttled
+async def session_list(request):
+    queryset = Session.objects.all()
+    track_id = request.GET.get("track")
+    event_id = request.GET.get("event")
+    if track_id:
+        queryset = queryset.filter(track_id=track_id)
+    elif event_id:
+        queryset = queryset.filter(track__event_id=event_id)
+    return await _list(request, queryset, SessionSerializer, SessionCursorPagination.ordering)
+
+
+@require_GET
+@throttled
+async def session_detail(request, pk):
+    return await _retrieve(request, Session.objects.all(), SessionSerializer, pk)
+
+
+@require_GET
+@throttled
+async def speaker_list(request):
+    return await _list(request, Speaker.objects.all(), SpeakerSerializer, SpeakerCursorPagination.ordering)
+
+
+@require_GET
+@throttled
+async def speaker_detail(request, pk):
+    return await _retrieve(request, Speaker.objects.all(), SpeakerSerializer, pk)
+
+
+@require_GET
+@throttled
+async def event_availability_stream(request, pk):
+    """
+    Server-sent events pushing an event's seats remaining whenever they
+    change. Needs the ASGI server; a WSGI worker would be tied up for the
+    whole stream.
+    """
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse({"detail": "Streaming requires the ASGI server."}, status=501)
+    data, _ = await sync_to_async(get_availability)(pk)
+    if data is None:
+        return JsonResponse({"detail": "Not found."}, status=404)
+
+    response = StreamingHttpResponse(availability_events(pk), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    # Stop nginx from buffering the stream.
+    response["X-Accel-Buffering"] = "no"
+    return response
@@ -0,0 +1,139 @@
+"""
+Seats remaining per event, for ticket pages that poll or stream it.
+
+The counter lives in the shared cache under a versioned key per event,
+so a poll is two cache reads and never touches EventSerializer or the
+venue. Every seat change (Event.claim_seat/release_seat) and every event
+save bumps the event's generation, now and on commit. Streams are fanned out by one poller per event
+and worker: however many clients watch an event, the worker reads its
+counter once per POLL_INTERVAL.
+"""
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+
+from apps.core.cache import fill_reads, invalidate_labels, versioned_key
+from .models import Event
+
+
+def availability_cache_key(event_id):
+    return f"availability:{event_id}"
+
+
+def _cache():
+    return caches[settings.SHARED_CACHE_ALIAS]
+
+
+def get_availability(event_id):
+    """
+    Return ``(data, hit)``; data is None if the event does not exist.
+    """
+    cache = _cache()
+    key, generation = versioned_key(availability_cache_key(event_id))
+    data = cache.get(key)
+    if data is not None:
+        return data, True
+
+    with fill_reads([generation]):
+        row = Event.objects.filter(pk=event_id).values("capacity", "seats_taken").first()
+    if row is None:
+        return None, False
+    data = {
+        "event": event_id,
+        "capacity": row["capacity"],
+        "seats_taken": row["seats_taken"],
+        "seats_remaining": max(row["capacity"] - row["seats_taken"], 0),
+    }
+    cache.set(key, data, settings.AVAILABILITY["CACHE_TIMEOUT"])
+    return data, False
+
+
+def invalidate_availability(event_id):
+    """Retire the cached counter (see apps.core.cache.invalidate_labels)."""
+    invalidate_labels([availability_cache_key(event_id)])
+
+
+def availability_etag(data):
+    return f'"{data["event"]}-{data["capacity"]}-{data["seats_taken"]}"'
+
+
+class AvailabilityBroadcaster:
+    """
+    Per-worker fan-out of availability changes to connected streams.
+    Each subscriber gets a one-slot queue holding the latest value; a slow
+    client skips intermediate counts rather than buffering them.
+    """
+
+    def __init__(self):
+        self._subscribers = {}
+        self._pollers = {}
+        self._latest = {}
+
+    def subscribe(self, event_id):
+        queue = asyncio.Queue(maxsize=1)
+        self._subscribers.setdefault(event_id, set()).add(queue)
+        if event_id in self._latest:
+            self._offer(queue, self._latest[event_id])
+        poller = self._pollers.get(event_id)
+        if poller is None or poller.done() or poller.get_loop() is not asyncio.get_running_loop():
+            self._pollers[event_id] = asyncio.create_task(self._poll(event_id))
+        return queue
+
+    def unsubscribe(self, event_id, queue):
+        subscribers = self._subscribers.get(event_id, set())
+        subscribers.discard(queue)
+        if not subscribers:
+            self._subscribers.pop(event_id, None)
+            self._latest.pop(event_id, None)
+            poller = self._pollers.pop(event_id, None)
+            if poller is not None:
+                poller.cancel()
+
+    @staticmethod
+    def _offer(queue, data):
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(data)
+
+    async def _poll(self, event_id):
+        while True:
+            data, _ = await sync_to_async(get_availability)(event_id)
+            if data != self._latest.get(event_id, ...):
+                self._latest[event_id] = data
+                for queue in self._subscribers.get(event_id, ()):
+                    self._offer(queue, data)
+            if data is None:
+                return
+            await asyncio.sleep(settings.AVAILABILITY["POLL_INTERVAL"])
+
+
+broadcaster = AvailabilityBroadcaster()
+
+
+async def availability_events(event_id):
+    """
+    Server-sent event stream for one event: an ``availability`` event per
+    change, keepalive comments in between, and a ``gone`` event if the
+    event is deleted. Closes after STREAM_TIMEOUT seconds.
+    """
+    options = settings.AVAILABILITY
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + options["STREAM_TIMEOUT"]
+    queue = broadcaster.subscribe(event_id)
+    try:
+        yield "retry: 5000\n\n"
+        while (remaining := deadline - loop.time()) > 0:
+            try:
+                data = await asyncio.wait_for(queue.get(), min(remaining, options["KEEPALIVE"]))
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if data is None:
+                yield "event: gone\ndata: {}\n\n"
+                return
+            yield f"event: availability\ndata: {json.dumps(data)}\n\n"
+    finally:
+        broadcaster.unsubscribe(event_id, queue)
@@ -0,0 +1,88 @@
+"""
+Event-wide speaker and room conflict detection.
+
+An event's sessions are loaded once and grouped by speaker and by room;
+each group is swept with ``find_overlaps``, so a full analysis costs one
+query plus O(n log n + k) for n sessions and k conflicts. Writes can be
+held to the same rules with the SCHEDULE_STRICT_CONFLICTS setting.
+"""
+from collections import defaultdict
+
+from django.db.models import Q
+
+from .models import Session
+from .scheduling import find_overlaps
+
+SESSION_FIELDS = ("id", "title", "track_id", "speaker_id", "room", "start_time", "end_time")
+
+
+def normalize_room(room):
+    """Rooms match case-insensitively and ignoring extra whitespace; blank means unassigned."""
+    return " ".join((room or "").split()).casefold()
+
+
+def resource_keys(speaker_id, room):
+    """The shared resources a session occupies, as ("speaker"|"room", value) keys."""
+    keys = []
+    if speaker_id is not None:
+        keys.append(("speaker", speaker_id))
+    room = normalize_room(room)
+    if room:
+        keys.append(("room", room))
+    return keys
+
+
+def find_conflicts(sessions):
+    """
+    Return speaker and room conflicts among ``sessions`` (dicts with
+    SESSION_FIELDS), ordered by resource and then by session ids.
+    """
+    by_id = {session["id"]: session for session in sessions}
+    groups = defaultdict(list)
+    for session in sessions:
+        for key in resource_keys(session["speaker_id"], session["room"]):
+            groups[key].append((session["start_time"], session["end_time"], session["id"]))
+
+    conflicts = {"speaker": [], "room": []}
+    for (kind, resource), intervals in groups.items():
+        for first, second in find_overlaps(intervals):
+            a, b = sorted((by_id[first], by_id[second]), key=lambda session: session["id"])
+            conflicts[kind].append({
+                kind: resource,
+                "sessions": [a["id"], b["id"]],
+                "overlap_start": max(a["start_time"], b["start_time"]),
+                "overlap_end": min(a["end_time"], b["end_time"]),
+            })
+    for kind, items in conflicts.items():
+        items.sort(key=lambda conflict: (str(conflict[kind]), conflict["sessions"]))
+    return conflicts
+
+
+def event_conflicts(event_id):
+    sessions = list(Session.objects.filter(track__event_id=event_id).values(*SESSION_FIELDS))
+    return find_conflicts(sessions)
+
+
+def session_conflict_errors(event_id, start_time, end_time, speaker_id=None, room="", exclude_pk=None):
+    """
+    Messages for a single session that would double-book its speaker or
+    room within the event; one indexed query, used by strict mode on write.
+    """
+    resources = Q()
+    for kind, value in resource_keys(speaker_id, room):
+        resources |= Q(speaker_id=value) if kind == "speaker" else Q(room__iexact=value)
+    if not resources:
+        return []
+
+    clashes = (
+        Session.objects.filter(resources, track__event_id=event_id, start_time__lt=end_time, end_time__gt=start_time)
+        .exclude(pk=exclude_pk)
+        .values_list("speaker_id", "room")
+    )
+    errors = set()
+    for other_speaker_id, other_room in clashes:
+        if speaker_id is not None and other_speaker_id == speaker_id:
+            errors.add("Speaker is already presenting another session at this time")
+        if normalize_room(room) and normalize_room(other_room) == normalize_room(room):
+            errors.add("Room is already booked for another session at this time")
+    return sorted(errors)
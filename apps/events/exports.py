@@ -0,0 +1,105 @@
+"""
+Streaming schedule exports. Sessions are read with values() over a
+chunked iterator (a server-side cursor on PostgreSQL), so memory stays
+flat regardless of how many sessions the event has.
+"""
+from datetime import timezone as dt_timezone
+
+from .models import Session
+
+ITERATOR_CHUNK_SIZE = 2000
+
+SCHEDULE_FIELDS = (
+    "id",
+    "title",
+    "track__title",
+    "speaker__name",
+    "start_time",
+    "end_time",
+    "room",
+    "description",
+    "updated_at",
+)
+
+CSV_HEADER = ["id", "title", "track", "speaker", "start_time", "end_time", "room", "description"]
+
+
+def schedule_rows(event_id):
+    return (
+        Session.objects.filter(track__event_id=event_id)
+        .order_by("start_time", "id")
+        .values(*SCHEDULE_FIELDS)
+        .iterator(chunk_size=ITERATOR_CHUNK_SIZE)
+    )
+
+
+def csv_schedule(rows):
+    for row in rows:
+        yield [
+            row["id"],
+            row["title"],
+            row["track__title"],
+            row["speaker__name"] or "",
+            row["start_time"].isoformat(),
+            row["end_time"].isoformat(),
+            row["room"],
+            row["description"],
+        ]
+
+
+def _ical_datetime(value):
+    return value.astimezone(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _ical_text(value):
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _ical_line(name, value):
+    """A content line folded at 75 octets as RFC 5545 requires."""
+    line = f"{name}:{value}".encode()
+    parts = []
+    while len(line) > 75:
+        cut = 75 if not parts else 74
+        # Do not split a multi-byte UTF-8 sequence.
+        while cut and (line[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(line[:cut].decode())
+        line = line[cut:]
+    parts.append(line.decode())
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def ical_schedule(event, rows, host):
+    yield (
+        "BEGIN:VCALENDAR\r\n"
+        "VERSION:2.0\r\n"
+        "PRODID:-//Event Management API//Schedule//EN\r\n"
+        "CALSCALE:GREGORIAN\r\n"
+        + _ical_line("X-WR-CALNAME", _ical_text(event["title"]))
+    )
+    for row in rows:
+        location = ", ".join(part for part in (row["track__title"], row["room"]) if part)
+        lines = [
+            "BEGIN:VEVENT\r\n",
+            _ical_line("UID", f"session-{row['id']}@{host}"),
+            _ical_line("DTSTAMP", _ical_datetime(row["updated_at"])),
+            _ical_line("DTSTART", _ical_datetime(row["start_time"])),
+            _ical_line("DTEND", _ical_datetime(row["end_time"])),
+            _ical_line("SUMMARY", _ical_text(row["title"])),
+        ]
+        if location:
+            lines.append(_ical_line("LOCATION", _ical_text(location)))
+        if row["description"]:
+            lines.append(_ical_line("DESCRIPTION", _ical_text(row["description"])))
+        if row["speaker__name"]:
+            lines.append(_ical_line("X-SPEAKER", _ical_text(row["speaker__name"])))
+        lines.append("END:VEVENT\r\n")
+        yield "".join(lines)
+    yield "END:VCALENDAR\r\n"
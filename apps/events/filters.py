@@ -0,0 +1,79 @@
+from datetime import datetime, time
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework import filters
+from rest_framework.exceptions import ValidationError
+
+# Query parameter -> lookup. "after" bounds are inclusive, "before" bounds exclusive.
+DATE_RANGE_PARAMS = {
+    "start_after": "start_date__gte",
+    "start_before": "start_date__lt",
+    "end_after": "end_date__gte",
+    "end_before": "end_date__lt",
+}
+
+# Filters whose result depends on the current time.
+RELATIVE_PARAMS = ("upcoming", "ongoing")
+
+TRUE_VALUES = ("1", "true", "yes")
+
+
+def parse_moment(value):
+    """An ISO 8601 datetime, or a date meaning its midnight in the current time zone."""
+    moment = parse_datetime(value)
+    if moment is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValueError(value)
+        moment = datetime.combine(day, time.min)
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def is_relative(request):
+    return any(request.query_params.get(param, "").lower() in TRUE_VALUES for param in RELATIVE_PARAMS)
+
+
+class EventFilter(filters.BaseFilterBackend):
+    """
+    Server-side event filters:
+
+    * ``?start_after=`` / ``?start_before=`` / ``?end_after=`` / ``?end_before=``
+      take an ISO 8601 datetime or date;
+    * ``?upcoming=true``: not started yet;
+    * ``?ongoing=true``: started and not finished;
+    * ``?venue=<id>``.
+
+    Each is backed by an index on Event (see its Meta).
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        params = request.query_params
+        lookups = {}
+        errors = {}
+        for param, lookup in DATE_RANGE_PARAMS.items():
+            if params.get(param):
+                try:
+                    lookups[lookup] = parse_moment(params[param])
+                except ValueError:
+                    errors[param] = "Enter a valid date or ISO 8601 datetime."
+        venue = params.get("venue")
+        if venue:
+            if venue.isdigit():
+                lookups["venue_id"] = int(venue)
+            else:
+                errors["venue"] = "Enter a venue id."
+        if errors:
+            raise ValidationError(errors)
+
+        now = timezone.now()
+        if params.get("upcoming", "").lower() in TRUE_VALUES:
+            lookups["start_date__gt"] = now
+        if params.get("ongoing", "").lower() in TRUE_VALUES:
+            # end_date first: only current and future events pass it, which
+            # keeps the index range small however many past events exist.
+            lookups["end_date__gt"] = now
+            lookups["start_date__lte"] = now
+        return queryset.filter(**lookups)
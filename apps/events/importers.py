@@ -0,0 +1,125 @@
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+
+from apps.core.cache import invalidate_model
+from .agenda import invalidate_agenda
+from .conflicts import resource_keys
+from .models import Event, Session, Speaker
+from .scheduling import find_overlaps
+from .serializers import SessionImportRowSerializer
+
+MAX_IMPORT_ROWS = 5000
+
+OVERLAP_SCOPES = {
+    "track": "in the same track",
+    "speaker": "for the same speaker",
+    "room": "in the same room",
+}
+
+
+def import_sessions(event, rows):
+    """
+    Validate and insert a batch of sessions for one event.
+
+    The event's tracks and existing sessions are loaded once and every row is
+    checked in memory: field validation, event window bounds, speaker
+    existence and per-track overlaps (against existing sessions and the rest
+    of the batch) via a sorted sweep; with SCHEDULE_STRICT_CONFLICTS the
+    speaker and room double-bookings are swept too. Nothing is written
+    unless every row is valid; the whole batch then goes in with one
+    bulk_create.
+
+    Returns ``(sessions, errors)`` where ``errors`` is a list of
+    ``{"row": <1-based row number>, "errors": ...}`` dicts.
+    """
+    if len(rows) > MAX_IMPORT_ROWS:
+        return [], [{"row": None, "errors": [f"At most {MAX_IMPORT_ROWS} sessions can be imported at once"]}]
+
+    errors = defaultdict(list)
+    with transaction.atomic():
+        # Lock the event so two imports into the same event cannot interleave.
+        event = Event.objects.select_for_update().get(pk=event.pk)
+        tracks = {track.pk: track for track in event.tracks.all()}
+        tracks_by_title = {track.title: track for track in tracks.values()}
+
+        sessions = {}
+        for index, row in enumerate(rows):
+            serializer = SessionImportRowSerializer(data=row)
+            if not serializer.is_valid():
+                errors[index].append(serializer.errors)
+                continue
+            data = serializer.validated_data
+
+            if "track_id" in data:
+                track = tracks.get(data["track_id"])
+                field = "track_id"
+            else:
+                track = tracks_by_title.get(data["track"])
+                field = "track"
+            if track is None:
+                errors[index].append({field: "Track does not belong to this event"})
+                continue
+
+            if not (event.start_date <= data["start_time"] and data["end_time"] <= event.end_date):
+                errors[index].append("Session must be within parent event start_date and end_date")
+                continue
+
+            sessions[index] = Session(
+                track=track,
+                title=data["title"],
+                description=data["description"],
+                speaker_id=data["speaker_id"],
+                start_time=data["start_time"],
+                end_time=data["end_time"],
+                room=data["room"],
+            )
+
+        speaker_ids = {session.speaker_id for session in sessions.values() if session.speaker_id is not None}
+        known_speakers = set(Speaker.objects.filter(pk__in=speaker_ids).values_list("pk", flat=True))
+        for index, session in sessions.items():
+            if session.speaker_id is not None and session.speaker_id not in known_speakers:
+                errors[index].append({"speaker_id": "Speaker does not exist"})
+
+        # Per-track overlaps always count; in strict mode the speaker and
+        # room of every session are swept the same way.
+        strict = settings.SCHEDULE_STRICT_CONFLICTS
+        intervals = defaultdict(list)
+        existing = Session.objects.filter(track__event=event).values_list(
+            "pk", "track_id", "speaker_id", "room", "start_time", "end_time"
+        )
+        for pk, track_id, speaker_id, room, start_time, end_time in existing:
+            for resource in _resources(track_id, speaker_id, room, strict):
+                intervals[resource].append((start_time, end_time, ("session", pk)))
+        for index, session in sessions.items():
+            for resource in _resources(session.track_id, session.speaker_id, session.room, strict):
+                intervals[resource].append((session.start_time, session.end_time, ("row", index)))
+        for (kind, _), resource_intervals in intervals.items():
+            for first, second in find_overlaps(resource_intervals):
+                for (key_kind, index), other in ((first, second), (second, first)):
+                    if key_kind == "row":
+                        errors[index].append(f"Session overlaps with {_describe(other)} {OVERLAP_SCOPES[kind]}")
+
+        if errors:
+            return [], [{"row": index + 1, "errors": row_errors} for index, row_errors in sorted(errors.items())]
+
+        created = Session.objects.bulk_create([sessions[index] for index in sorted(sessions)], batch_size=500)
+        # bulk_create sends no post_save signals.
+        invalidate_model(Session)
+        invalidate_agenda([event.pk])
+    return created, []
+
+
+def _resources(track_id, speaker_id, room, strict):
+    resources = [("track", track_id)]
+    if strict:
+        resources.extend(resource_keys(speaker_id, room))
+    return resources
+
+
+def _describe(key):
+    kind, value = key
+    if kind == "row":
+        return f"row {value + 1}"
+    return f"session {value}"
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.events.conflicts import event_conflicts
+from apps.events.models import Event
+
+
+class Command(BaseCommand):
+    help = "Report speakers and rooms double-booked across the tracks of an event."
+
+    def add_arguments(self, parser):
+        parser.add_argument("event_ids", nargs="*", type=int, help="Events to check (default: all).")
+        parser.add_argument(
+            "--fail", action="store_true", help="Exit with an error if any conflict is found."
+        )
+
+    def handle(self, *args, **options):
+        events = Event.objects.order_by("id").values_list("id", "title")
+        if options["event_ids"]:
+            events = events.filter(pk__in=options["event_ids"])
+
+        total = 0
+        for event_id, title in events.iterator():
+            conflicts = event_conflicts(event_id)
+            count = len(conflicts["speaker"]) + len(conflicts["room"])
+            total += count
+            if not count:
+                continue
+            self.stdout.write(f"Event {event_id} ({title}): {count} conflict(s)")
+            for kind in ("speaker", "room"):
+                for conflict in conflicts[kind]:
+                    first, second = conflict["sessions"]
+                    self.stdout.write(
+                        f"  {kind} {conflict[kind]}: sessions {first} and {second} overlap "
+                        f"{conflict['overlap_start']:%Y-%m-%d %H:%M}-{conflict['overlap_end']:%H:%M}"
+                    )
+
+        if total and options["fail"]:
+            raise CommandError(f"{total} conflict(s) found")
+        self.stdout.write(self.style.SUCCESS(f"{total} conflict(s) found"))
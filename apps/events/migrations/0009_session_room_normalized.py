@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:40
+
+import apps.events.models
+from django.db import migrations
+
+
+def normalize_rooms(apps, schema_editor):
+    # Rooms saved before RoomField may carry stray whitespace.
+    Session = apps.get_model('events', 'Session')
+    for pk, room in Session.objects.exclude(room='').values_list('pk', 'room').iterator():
+        normalized = ' '.join(room.split())
+        if normalized != room:
+            Session.objects.filter(pk=pk).update(room=normalized)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0008_venue_track_search_indexes'),
+    ]
+
+    operations = [
+        # Same column type: only the state changes (and SQLite would otherwise
+        # rebuild the table with the PostgreSQL-only search index).
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='session',
+                    name='room',
+                    field=apps.events.models.RoomField(blank=True, max_length=100),
+                ),
+            ],
+        ),
+        migrations.RunPython(normalize_rooms, migrations.RunPython.noop),
+    ]
@@ -1,8 +1,11 @@
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 from django.db import models, transaction
 from django.utils import timezone
 
+from apps.core.search import search_vector
+
 USER_MODEL = settings.AUTH_USER_MODEL
 
 
@@ -20,6 +23,9 @@ class Venue(models.Model):
     
     class Meta:
         ordering = ["name"]
+        indexes = [
+            GinIndex(search_vector("name", "address"), name="venue_search_gin"),
+        ]
 
     def __str__(self):
         return self.name
@@ -36,12 +42,22 @@ class Event(models.Model):
     capacity = models.PositiveIntegerField()
     start_date = models.DateTimeField()
     end_date = models.DateTimeField()
+    # Denormalized registration counter, only ever changed through
+    # claim_seat()/release_seat() so admission is a single-row UPDATE.
+    seats_taken = models.PositiveIntegerField(default=0, editable=False)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["-start_date"]
+        indexes = [
+            models.Index(fields=["-start_date", "id"], name="event_start_date_id_idx"),
+            # ?venue= in the default ordering, and ?ongoing= / ?end_*= ranges.
+            models.Index(fields=["venue", "-start_date", "id"], name="event_venue_start_idx"),
+            models.Index(fields=["end_date", "start_date"], name="event_end_start_idx"),
+            GinIndex(search_vector("title", "slug", "description"), name="event_search_gin"),
+        ]
         constraints = [
             models.CheckConstraint(check=models.Q(capacity__gte=1), name="event_capacity_positive"),
             models.CheckConstraint(check=models.Q(end_date__gt=models.F("start_date")), name="event_end_after_start"),
@@ -54,17 +70,51 @@ class Event(models.Model):
             raise ValidationError({"capacity": "capacity must be at least 1"})
         if self.venue and self.capacity > self.venue.capacity:
             raise ValidationError({"capacity": "Event capacity cannot exceed venue capacity"})
+        if self.capacity < self.seats_taken:
+            raise ValidationError({"capacity": "Event capacity cannot be lower than seats already taken"})
+
+    def save(self, *args, **kwargs):
+        # Never write back a possibly stale in-memory seats_taken; the
+        # counter is owned by claim_seat()/release_seat().
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                f.name for f in self._meta.concrete_fields
+                if not f.primary_key and f.name != "seats_taken"
+            ]
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return self.title
 
+    @classmethod
+    def claim_seat(cls, event_id):
+        """
+        Atomically take one seat. The conditional UPDATE locks the event row,
+        so concurrent callers can never push seats_taken past capacity.
+        Returns False when the event is full.
+        """
+        from .availability import invalidate_availability
+
+        updated = cls.objects.filter(
+            pk=event_id, seats_taken__lt=models.F("capacity")
+        ).update(seats_taken=models.F("seats_taken") + 1)
+        if updated:
+            invalidate_availability(event_id)
+        return updated == 1
+
+    @classmethod
+    def release_seat(cls, event_id):
+        from .availability import invalidate_availability
+
+        updated = cls.objects.filter(pk=event_id, seats_taken__gt=0).update(
+            seats_taken=models.F("seats_taken") - 1
+        )
+        if updated:
+            invalidate_availability(event_id)
+
     @property
     def registration_count(self):
-        try:
-            from apps.registrations.models import Registration
-        except Exception:
-            return None
-        return Registration.objects.filter(event=self).count()
+        return self.seats_taken
 
 
 class Track(models.Model):
@@ -81,6 +131,9 @@ class Track(models.Model):
     class Meta:
         unique_together = ("event", "title")
         ordering = ["title"]
+        indexes = [
+            GinIndex(search_vector("title", "description"), name="track_search_gin"),
+        ]
 
     def __str__(self):
         return f"{self.event.title} — {self.title}"
@@ -100,11 +153,31 @@ class Speaker(models.Model):
 
     class Meta:
         ordering = ["name"]
+        indexes = [
+            models.Index(fields=["name", "id"], name="speaker_name_id_idx"),
+            GinIndex(search_vector("name", "bio"), name="speaker_search_gin"),
+        ]
 
     def __str__(self):
         return self.name
 
 
+class RoomField(models.CharField):
+    """
+    Room name stored with surrounding and repeated whitespace collapsed, on
+    every write path (save, bulk_create, update) and in lookups, so the
+    database can compare rooms the way ``conflicts.normalize_room`` does
+    with a plain case-insensitive match.
+    """
+
+    def to_python(self, value):
+        value = super().to_python(value)
+        return " ".join(value.split()) if isinstance(value, str) else value
+
+    def get_prep_value(self, value):
+        return self.to_python(super().get_prep_value(value))
+
+
 class Session(models.Model):
     """
     A session/talk inside a Track. Prevent overlapping sessions within the SAME track.
@@ -116,13 +189,19 @@ class Session(models.Model):
     speaker = models.ForeignKey(Speaker, null=True, blank=True, on_delete=models.SET_NULL)
     start_time = models.DateTimeField()
     end_time = models.DateTimeField()
-    room = models.CharField(max_length=100, blank=True)
+    room = RoomField(max_length=100, blank=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["start_time"]
+        indexes = [
+            models.Index(fields=["start_time", "id"], name="session_start_time_id_idx"),
+            # Per-track overlap checks and per-track schedules (?track=, ?event=).
+            models.Index(fields=["track", "start_time", "end_time"], name="session_track_start_end_idx"),
+            GinIndex(search_vector("title", "description", "room"), name="session_search_gin"),
+        ]
         constraints = [
             models.CheckConstraint(check=models.Q(end_time__gt=models.F("start_time")), name="session_end_after_start"),
         ]
@@ -144,10 +223,25 @@ class Session(models.Model):
         if qs.exists():
             raise ValidationError("Session overlaps with another session in the same track")
 
-    def save(self, *args, **kwargs):
-        with transaction.atomic():
-            self.full_clean()
-            super().save(*args, **kwargs)
+        if settings.SCHEDULE_STRICT_CONFLICTS and getattr(self, "_check_conflicts", True):
+            from .conflicts import session_conflict_errors
+
+            errors = session_conflict_errors(
+                event.pk, self.start_time, self.end_time, self.speaker_id, self.room, exclude_pk=self.pk
+            )
+            if errors:
+                raise ValidationError(errors)
+
+    def save(self, *args, check_conflicts=True, **kwargs):
+        # check_conflicts=False skips the strict-mode speaker/room check for
+        # callers that already ran it (SessionSerializer.validate).
+        self._check_conflicts = check_conflicts
+        try:
+            with transaction.atomic():
+                self.full_clean()
+                super().save(*args, **kwargs)
+        finally:
+            del self._check_conflicts
 
     def __str__(self):
         return f"{self.title} — {self.track}"
@@ -0,0 +1,13 @@
+from apps.core.pagination import CursorPagination
+
+
+class EventCursorPagination(CursorPagination):
+    ordering = ("-start_date", "id")
+
+
+class SessionCursorPagination(CursorPagination):
+    ordering = ("start_time", "id")
+
+
+class SpeakerCursorPagination(CursorPagination):
+    ordering = ("name", "id")
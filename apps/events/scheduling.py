@@ -0,0 +1,28 @@
+"""
+In-memory interval checks for a whole event schedule.
+
+Each helper works on plain values loaded once per event, so validating a
+batch of sessions costs a sort plus a sweep instead of one overlap query
+per row.
+"""
+import heapq
+
+
+def find_overlaps(intervals):
+    """
+    Return ``(key_a, key_b)`` pairs of intervals that overlap, in O(n log n + k).
+
+    ``intervals`` is an iterable of ``(start, end, key)`` tuples belonging to
+    the same resource (a track, a speaker, a room). Touching intervals
+    (one ends exactly when the next starts) do not overlap, matching
+    Session.clean().
+    """
+    overlaps = []
+    active = []  # min-heap of (end, seq, key) for intervals still open
+    ordered = sorted(intervals, key=lambda interval: (interval[0], interval[1]))
+    for seq, (start, end, key) in enumerate(ordered):
+        while active and active[0][0] <= start:
+            heapq.heappop(active)
+        overlaps.extend((active_key, key) for _, _, active_key in active)
+        heapq.heappush(active, (end, seq, key))
+    return overlaps
@@ -1,21 +1,25 @@
 from rest_framework import serializers
+from django.conf import settings
 from django.utils import timezone
+
+from apps.core.serializers import ExpandableFieldsMixin
+from .conflicts import session_conflict_errors
 from .models import Venue, Event, Track, Speaker, Session
 
 
-class VenueSerializer(serializers.ModelSerializer):
+class VenueSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Venue
         fields = ["id", "name", "address", "capacity", "created_at", "updated_at"]
         read_only_fields = ["id", "created_at", "updated_at"]
 
 
-class EventSerializer(serializers.ModelSerializer):
-    venue = VenueSerializer(read_only=True)
+class EventSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
+    expandable_fields = {"venue": VenueSerializer}
     venue_id = serializers.PrimaryKeyRelatedField(
         queryset=Venue.objects.all(), source="venue", write_only=True
     )
-    registration_count = serializers.IntegerField(read_only=True)
+    registration_count = serializers.IntegerField(source="seats_taken", read_only=True)
 
     class Meta:
         model = Event
@@ -33,7 +37,7 @@ class EventSerializer(serializers.ModelSerializer):
             "updated_at",
             "registration_count",
         ]
-        read_only_fields = ["id", "created_at", "updated_at", "registration_count"]
+        read_only_fields = ["id", "venue", "created_at", "updated_at", "registration_count"]
 
     def validate(self, attrs):
         venue = attrs.get("venue") or getattr(self.instance, "venue", None)
@@ -47,34 +51,36 @@ class EventSerializer(serializers.ModelSerializer):
         if venue and capacity and capacity > venue.capacity:
             raise serializers.ValidationError({"capacity": "Event capacity cannot exceed venue capacity"})
 
+        if self.instance and capacity and capacity < self.instance.seats_taken:
+            raise serializers.ValidationError({"capacity": "Event capacity cannot be lower than seats already taken"})
+
         return attrs
 
 
-class TrackSerializer(serializers.ModelSerializer):
+class TrackSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
+    expandable_fields = {"event": EventSerializer}
     event_id = serializers.PrimaryKeyRelatedField(
         source="event", queryset=Event.objects.all(), write_only=True
     )
-    event = EventSerializer(read_only=True)
 
     class Meta:
         model = Track
         fields = ["id", "title", "description", "event", "event_id", "created_at"]
-        read_only_fields = ["id", "created_at"]
+        read_only_fields = ["id", "event", "created_at"]
 
 
-class SpeakerSerializer(serializers.ModelSerializer):
+class SpeakerSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Speaker
         fields = ["id", "name", "bio", "website", "twitter", "user", "created_at"]
         read_only_fields = ["id", "created_at"]
 
 
-class SessionSerializer(serializers.ModelSerializer):
+class SessionSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
+    expandable_fields = {"track": TrackSerializer, "speaker": SpeakerSerializer}
     track_id = serializers.PrimaryKeyRelatedField(
         source="track", queryset=Track.objects.all(), write_only=True
     )
-    track = TrackSerializer(read_only=True)
-    speaker = SpeakerSerializer(read_only=True)
     speaker_id = serializers.PrimaryKeyRelatedField(
         source="speaker", queryset=Speaker.objects.all(), write_only=True, required=False, allow_null=True
     )
@@ -95,7 +101,7 @@ class SessionSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
-        read_only_fields = ["id", "created_at", "updated_at"]
+        read_only_fields = ["id", "track", "speaker", "created_at", "updated_at"]
 
     def validate(self, attrs):
         track = attrs.get("track") or getattr(self.instance, "track", None)
@@ -120,4 +126,55 @@ class SessionSerializer(serializers.ModelSerializer):
             if s and e and not (event.start_date <= s and e <= event.end_date):
                 raise serializers.ValidationError("Session must be within parent event start_date and end_date")
 
+        if settings.SCHEDULE_STRICT_CONFLICTS and track and start_time and end_time:
+            speaker = attrs["speaker"] if "speaker" in attrs else getattr(self.instance, "speaker", None)
+            room = attrs["room"] if "room" in attrs else getattr(self.instance, "room", "")
+            errors = session_conflict_errors(
+                track.event_id, start_time, end_time, getattr(speaker, "pk", None), room,
+                exclude_pk=getattr(self.instance, "pk", None),
+            )
+            if errors:
+                raise serializers.ValidationError(errors)
+
+        return attrs
+
+    # validate() has already run the strict conflict check; don't let
+    # Session.clean() repeat it on save.
+    def create(self, validated_data):
+        instance = Session(**validated_data)
+        instance.save(check_conflicts=False)
+        return instance
+
+    def update(self, instance, validated_data):
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(check_conflicts=False)
+        return instance
+
+
+class SessionImportRowSerializer(serializers.Serializer):
+    """
+    One row of a bulk agenda import. The track is referenced either by
+    ``track_id`` or by its ``track`` title within the imported event.
+    """
+    title = serializers.CharField(max_length=255)
+    description = serializers.CharField(required=False, allow_blank=True, default="")
+    track_id = serializers.IntegerField(required=False)
+    track = serializers.CharField(required=False)
+    speaker_id = serializers.IntegerField(required=False, allow_null=True, default=None)
+    start_time = serializers.DateTimeField()
+    end_time = serializers.DateTimeField()
+    room = serializers.CharField(max_length=100, required=False, allow_blank=True, default="")
+
+    def to_internal_value(self, data):
+        # CSV cells are always strings; treat empty optional cells as missing.
+        if hasattr(data, "items"):
+            data = {key: value for key, value in data.items() if value not in ("", None) or key in ("description", "room")}
+        return super().to_internal_value(data)
+
+    def validate(self, attrs):
+        if attrs["end_time"] <= attrs["start_time"]:
+            raise serializers.ValidationError({"end_time": "end_time must be after start_time"})
+        if "track_id" not in attrs and "track" not in attrs:
+            raise serializers.ValidationError({"track_id": "track_id or track is required"})
         return attrs
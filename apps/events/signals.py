@@ -0,0 +1,75 @@
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from apps.core.cache import bump_cache_generation
+from .agenda import invalidate_agenda
+from .availability import invalidate_availability
+from .upcoming import invalidate_upcoming
+from .models import Venue, Event, Track, Speaker, Session
+
+for model in (Venue, Event, Track, Speaker, Session):
+    post_save.connect(bump_cache_generation, sender=model, dispatch_uid=f"cache-{model._meta.label_lower}-save")
+    post_delete.connect(bump_cache_generation, sender=model, dispatch_uid=f"cache-{model._meta.label_lower}-delete")
+
+
+def _track_event_ids(*track_ids):
+    return Track.objects.filter(pk__in=[pk for pk in track_ids if pk]).values_list("event_id", flat=True)
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def drop_event_agenda(sender, instance, **kwargs):
+    invalidate_agenda([instance.pk])
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def drop_event_availability(sender, instance, **kwargs):
+    # Capacity changes alter the seats remaining too.
+    invalidate_availability(instance.pk)
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def drop_upcoming_feed(sender, instance, **kwargs):
+    invalidate_upcoming()
+
+
+@receiver(post_save, sender=Venue)
+def drop_venue_agendas(sender, instance, created, **kwargs):
+    if not created:
+        invalidate_agenda(Event.objects.filter(venue_id=instance.pk).values_list("id", flat=True))
+        invalidate_upcoming()
+
+
+@receiver(post_save, sender=Track)
+@receiver(post_delete, sender=Track)
+def drop_track_agenda(sender, instance, **kwargs):
+    invalidate_agenda([instance.event_id])
+
+
+@receiver(pre_save, sender=Session)
+def remember_session_track(sender, instance, raw=False, **kwargs):
+    # A session moved to another track (possibly of another event) has to
+    # invalidate the agenda it left as well.
+    if instance.pk and not raw:
+        instance._previous_track_id = (
+            Session.objects.filter(pk=instance.pk).values_list("track_id", flat=True).first()
+        )
+
+
+@receiver(post_save, sender=Session)
+@receiver(post_delete, sender=Session)
+def drop_session_agenda(sender, instance, **kwargs):
+    invalidate_agenda(_track_event_ids(instance.track_id, getattr(instance, "_previous_track_id", None)))
+
+
+@receiver(post_save, sender=Speaker)
+@receiver(pre_delete, sender=Speaker)
+def drop_speaker_agendas(sender, instance, **kwargs):
+    # pre_delete: once the speaker is gone its sessions are already unlinked.
+    if kwargs.get("created"):
+        return
+    invalidate_agenda(
+        Session.objects.filter(speaker_id=instance.pk).values_list("track__event_id", flat=True).distinct()
+    )
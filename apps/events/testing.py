@@ -0,0 +1,62 @@
+"""
+Test and benchmark factories for the event catalog (factory-boy/faker).
+"""
+from datetime import timedelta
+from uuid import uuid4
+
+import factory
+from django.utils import timezone
+from factory.django import DjangoModelFactory
+
+from .models import Venue, Event, Track, Speaker, Session
+
+
+class VenueFactory(DjangoModelFactory):
+    class Meta:
+        model = Venue
+
+    name = factory.Faker("company")
+    address = factory.Faker("address")
+    capacity = 1_000_000
+
+
+class EventFactory(DjangoModelFactory):
+    class Meta:
+        model = Event
+
+    title = factory.Faker("catch_phrase")
+    slug = factory.LazyFunction(lambda: f"event-{uuid4().hex[:12]}")
+    description = factory.Faker("paragraph")
+    venue = factory.SubFactory(VenueFactory)
+    capacity = 1_000_000
+    start_date = factory.Sequence(lambda n: timezone.now() + timedelta(days=n))
+    end_date = factory.LazyAttribute(lambda event: event.start_date + timedelta(days=1))
+
+
+class TrackFactory(DjangoModelFactory):
+    class Meta:
+        model = Track
+
+    event = factory.SubFactory(EventFactory)
+    title = factory.Sequence(lambda n: f"Track {n}")
+    description = factory.Faker("sentence")
+
+
+class SpeakerFactory(DjangoModelFactory):
+    class Meta:
+        model = Speaker
+
+    name = factory.Faker("name")
+    bio = factory.Faker("paragraph")
+    website = factory.Faker("url")
+    twitter = factory.Faker("user_name")
+
+
+class SessionFactory(DjangoModelFactory):
+    class Meta:
+        model = Session
+
+    track = factory.SubFactory(TrackFactory)
+    title = factory.Faker("sentence", nb_words=5)
+    description = factory.Faker("paragraph")
+    room = factory.Faker("bothify", text="Room ##")
@@ -0,0 +1,56 @@
+"""
+Precomputed feed of the next UPCOMING_FEED_SIZE events for the home page.
+
+The feed is rendered once and cached as JSON bytes under a versioned key.
+Signals in ``apps.events.signals`` bump its generation when an event or
+venue changes, and its
+timeout never outlives the start of the first event in it, so a started
+event leaves the feed without any write.
+"""
+from django.conf import settings
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from apps.core.cache import fill_reads, invalidate_labels, response_cache, versioned_key
+from .models import Event
+from .serializers import EventSerializer
+
+UPCOMING_FEED_KEY = "events:upcoming"
+
+
+def build_upcoming_feed():
+    """Return ``(data, seconds until the first listed event starts)``."""
+    now = timezone.now()
+    events = list(
+        Event.objects.select_related("venue")
+        .filter(start_date__gt=now)
+        .order_by("start_date", "id")[: settings.UPCOMING_FEED_SIZE]
+    )
+    data = EventSerializer(events, many=True, expand={"venue": {}}).data
+    for item in data:
+        # Seat counts change with every registration; see the availability endpoint.
+        item.pop("registration_count", None)
+    starts_in = (events[0].start_date - now).total_seconds() if events else None
+    return data, starts_in
+
+
+def get_upcoming_json():
+    """Rendered feed bytes and whether they came from the cache."""
+    cache = response_cache()
+    key, generation = versioned_key(UPCOMING_FEED_KEY)
+    content = cache.get(key)
+    if content is not None:
+        return content, True
+    with fill_reads([generation]):
+        data, starts_in = build_upcoming_feed()
+    content = JSONRenderer().render(data)
+    timeout = settings.API_CACHE_TIMEOUT
+    if starts_in is not None:
+        timeout = max(1, min(timeout, int(starts_in)))
+    cache.set(key, content, timeout)
+    return content, False
+
+
+def invalidate_upcoming():
+    """Retire the cached feed (see apps.core.cache.invalidate_labels)."""
+    invalidate_labels([UPCOMING_FEED_KEY])
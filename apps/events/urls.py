@@ -1,6 +1,9 @@
-from django.urls import path, include
+from django.urls import path, include, re_path
 from rest_framework.routers import DefaultRouter
-from .views import VenueViewSet, EventViewSet, TrackViewSet, SpeakerViewSet, SessionViewSet
+from . import async_views
+from .views import (
+    VenueViewSet, EventViewSet, TrackViewSet, SpeakerViewSet, SessionViewSet, event_availability, schedule_export,
+)
 
 router = DefaultRouter()
 router.register(r"venues", VenueViewSet, basename="venue")
@@ -10,5 +13,14 @@ router.register(r"speakers", SpeakerViewSet, basename="speaker")
 router.register(r"sessions", SessionViewSet, basename="session")
 
 urlpatterns = [
+    path("async/events/", async_views.event_list, name="async-event-list"),
+    path("async/events/<int:pk>/", async_views.event_detail, name="async-event-detail"),
+    path("async/sessions/", async_views.session_list, name="async-session-list"),
+    path("async/sessions/<int:pk>/", async_views.session_detail, name="async-session-detail"),
+    path("async/speakers/", async_views.speaker_list, name="async-speaker-list"),
+    path("async/speakers/<int:pk>/", async_views.speaker_detail, name="async-speaker-detail"),
+    path("events/<int:pk>/availability/", event_availability, name="event-availability"),
+    path("events/<int:pk>/availability/stream/", async_views.event_availability_stream, name="event-availability-stream"),
+    re_path(r"^events/(?P<pk>[0-9]+)/schedule\.(?P<fmt>ics|csv)$", schedule_export, name="event-schedule-export"),
     path("", include(router.urls)),
 ]
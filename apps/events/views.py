@@ -1,8 +1,33 @@
-from rest_framework import viewsets, filters
+import csv
+import io
+import time
+
+from rest_framework import viewsets, filters, status
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from rest_framework.response import Response
+from django.http import Http404, HttpResponse, HttpResponseNotModified, JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.conf import settings
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
+from django.views.decorators.http import require_GET
+
+from apps.core.permissions import IsOrganizer
+from apps.core.mixins import CachedResponseMixin, CompiledListMixin, ExpandableQuerysetMixin
+from apps.core.search import FullTextSearchFilter
+from apps.core.streaming import buffered, csv_lines
+from apps.core.throttling import throttled
+
+from .agenda import get_agenda_json
+from .availability import availability_etag, get_availability
+from .conflicts import event_conflicts
+from .exports import CSV_HEADER, csv_schedule, ical_schedule, schedule_rows
+from .filters import EventFilter, is_relative
 
+from .importers import import_sessions
 from .models import Venue, Event, Track, Speaker, Session
+from .pagination import EventCursorPagination, SessionCursorPagination, SpeakerCursorPagination
 from .serializers import (
     VenueSerializer,
     EventSerializer,
@@ -10,6 +35,7 @@ from .serializers import (
     SpeakerSerializer,
     SessionSerializer,
 )
+from .upcoming import get_upcoming_json
 
 try:
     from apps.core.permissions import IsOrganizerOrReadOnly
@@ -18,47 +44,143 @@ except Exception:
     DEFAULT_WRITE_PERMISSION = IsAuthenticatedOrReadOnly
 
 
-class VenueViewSet(viewsets.ModelViewSet):
+class VenueViewSet(CachedResponseMixin, ExpandableQuerysetMixin, viewsets.ModelViewSet):
     queryset = Venue.objects.all()
     serializer_class = VenueSerializer
+    cache_dependencies = ("events.venue",)
     permission_classes = [DEFAULT_WRITE_PERMISSION]
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [FullTextSearchFilter, filters.OrderingFilter]
     search_fields = ["name", "address"]
 
 
-class EventViewSet(viewsets.ModelViewSet):
-    queryset = Event.objects.select_related("venue").all().order_by("-start_date")
+class EventViewSet(CachedResponseMixin, CompiledListMixin, ExpandableQuerysetMixin, viewsets.ModelViewSet):
+    queryset = Event.objects.all().order_by("-start_date")
     serializer_class = EventSerializer
+    cache_dependencies = ("events.event", "events.venue", "registrations.registration")
+    pagination_class = EventCursorPagination
     permission_classes = [DEFAULT_WRITE_PERMISSION]
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [EventFilter, FullTextSearchFilter, filters.OrderingFilter]
     search_fields = ["title", "slug", "description"]
     ordering_fields = ["start_date", "end_date", "title"]
 
+    def get_response_cache_key(self, request):
+        key = super().get_response_cache_key(request)
+        if is_relative(request):
+            # ?upcoming= and ?ongoing= move with the clock; keep such
+            # responses for at most a minute.
+            key += f":{int(time.time() // 60)}"
+        return key
+
+    @action(detail=False, methods=["get"])
+    def upcoming(self, request):
+        """
+        The next UPCOMING_FEED_SIZE events, soonest first, with their venue.
+        Precomputed and cached for the home page; use ?upcoming=true on the
+        list for anything beyond the first page.
+        """
+        content, hit = get_upcoming_json()
+        response = HttpResponse(content, content_type="application/json")
+        response["X-Cache"] = "HIT" if hit else "MISS"
+        return response
+
     # optional: provide a custom action to list sessions for an event (if desired)
     # but we keep routes simple and RESTful (sessions belong to tracks)
 
+    @action(detail=True, methods=["get"])
+    def agenda(self, request, pk=None):
+        """
+        The whole agenda for this event (venue, tracks, sessions and
+        speakers) in one document, served from a per-event cached blob.
+        """
+        try:
+            event_id = int(pk)
+        except (TypeError, ValueError):
+            raise Http404
+        content, hit = get_agenda_json(event_id)
+        if content is None:
+            raise Http404
+        response = HttpResponse(content, content_type="application/json")
+        response["X-Cache"] = "HIT" if hit else "MISS"
+        return response
+
+    @action(detail=True, methods=["get"], permission_classes=[IsOrganizer])
+    def conflicts(self, request, pk=None):
+        """Speaker and room double-bookings across all tracks of this event."""
+        event = get_object_or_404(Event.objects.only("id"), pk=pk)
+        conflicts = event_conflicts(event.pk)
+        return Response({
+            "event": event.pk,
+            "speaker_conflicts": conflicts["speaker"],
+            "room_conflicts": conflicts["room"],
+        })
+
+    @action(detail=True, methods=["post"], url_path="sessions/import")
+    def import_sessions(self, request, pk=None):
+        """
+        Bulk-create an agenda for this event from a JSON list (or
+        {"sessions": [...]}) or an uploaded CSV file with matching columns.
+        All rows are validated in memory first; nothing is created if any
+        row is invalid.
+        """
+        event = self.get_object()
+        upload = request.FILES.get("file")
+        if upload is not None:
+            try:
+                rows = list(csv.DictReader(io.TextIOWrapper(upload, encoding="utf-8-sig")))
+            except UnicodeDecodeError:
+                return Response({"detail": "The CSV file must be UTF-8 encoded."}, status=status.HTTP_400_BAD_REQUEST)
+        elif isinstance(request.data, list):
+            rows = request.data
+        else:
+            rows = request.data.get("sessions")
+        if not isinstance(rows, list) or not rows:
+            return Response(
+                {"detail": "Provide a non-empty list of sessions or a CSV file."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        created, errors = import_sessions(event, rows)
+        if errors:
+            return Response({"errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(
+            {"created": len(created), "ids": [session.pk for session in created]},
+            status=status.HTTP_201_CREATED,
+        )
 
-class TrackViewSet(viewsets.ModelViewSet):
-    queryset = Track.objects.select_related("event").all()
+
+class TrackViewSet(CachedResponseMixin, ExpandableQuerysetMixin, viewsets.ModelViewSet):
+    queryset = Track.objects.all()
     serializer_class = TrackSerializer
+    cache_dependencies = ("events.track", "events.event", "events.venue", "registrations.registration")
     permission_classes = [DEFAULT_WRITE_PERMISSION]
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [FullTextSearchFilter, filters.OrderingFilter]
     search_fields = ["title", "description"]
 
 
-class SpeakerViewSet(viewsets.ModelViewSet):
+class SpeakerViewSet(CachedResponseMixin, ExpandableQuerysetMixin, viewsets.ModelViewSet):
     queryset = Speaker.objects.all()
     serializer_class = SpeakerSerializer
+    cache_dependencies = ("events.speaker",)
+    pagination_class = SpeakerCursorPagination
     permission_classes = [DEFAULT_WRITE_PERMISSION]
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [FullTextSearchFilter, filters.OrderingFilter]
     search_fields = ["name", "bio"]
 
 
-class SessionViewSet(viewsets.ModelViewSet):
-    queryset = Session.objects.select_related("track__event", "speaker").all()
+class SessionViewSet(CachedResponseMixin, CompiledListMixin, ExpandableQuerysetMixin, viewsets.ModelViewSet):
+    queryset = Session.objects.all()
     serializer_class = SessionSerializer
+    cache_dependencies = (
+        "events.session",
+        "events.track",
+        "events.event",
+        "events.venue",
+        "events.speaker",
+        "registrations.registration",
+    )
+    pagination_class = SessionCursorPagination
     permission_classes = [DEFAULT_WRITE_PERMISSION]
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [FullTextSearchFilter, filters.OrderingFilter]
     search_fields = ["title", "description", "room"]
 
     def get_queryset(self):
@@ -74,3 +196,51 @@ class SessionViewSet(viewsets.ModelViewSet):
         elif event_id:
             qs = qs.filter(track__event_id=event_id)
         return qs
+
+
+@require_GET
+@throttled
+def schedule_export(request, pk, fmt):
+    """
+    Stream an event's full schedule as iCalendar (``schedule.ics``) or CSV
+    (``schedule.csv``). Public like the other read endpoints.
+    """
+    event = Event.objects.filter(pk=pk).values("id", "slug", "title").first()
+    if event is None:
+        raise Http404("No Event matches the given query.")
+
+    rows = schedule_rows(event["id"])
+    if fmt == "ics":
+        content = ical_schedule(event, rows, request.get_host())
+        content_type = "text/calendar; charset=utf-8"
+    else:
+        content = csv_lines(CSV_HEADER, csv_schedule(rows))
+        content_type = "text/csv; charset=utf-8"
+
+    response = StreamingHttpResponse(buffered(content), content_type=content_type)
+    filename = f"{event['slug'] or event['id']}-schedule.{fmt}"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+@require_GET
+@throttled
+def event_availability(request, pk):
+    """
+    Seats remaining for an event, straight from the shared-cache counter.
+    Meant for ticket pages that poll: responses carry a short public
+    max-age and an ETag, so repeat polls can be answered with 304.
+    """
+    data, hit = get_availability(pk)
+    if data is None:
+        raise Http404("No Event matches the given query.")
+
+    etag = availability_etag(data)
+    if etag in parse_etags(request.headers.get("If-None-Match", "")):
+        response = HttpResponseNotModified()
+    else:
+        response = JsonResponse(data)
+    response["ETag"] = etag
+    response["X-Cache"] = "HIT" if hit else "MISS"
+    patch_cache_control(response, public=True, max_age=settings.AVAILABILITY["MAX_AGE"])
+    return response
@@ -1,3 +1,44 @@
+from django import forms
 from django.contrib import admin
 
-# Register your models here.
+from apps.core.admin import LargeTableAdmin
+from apps.events.admin import EventFilter
+from .models import Registration, WaitlistEntry
+
+
+class RegistrationAdminForm(forms.ModelForm):
+    class Meta:
+        model = Registration
+        fields = ("attendee", "event")
+
+    def clean(self):
+        cleaned_data = super().clean()
+        event = cleaned_data.get("event")
+        # Registration.save() refuses full events; report it on the form
+        # instead of as a server error.
+        if event and event.pk != self.instance.event_id and event.seats_taken >= event.capacity:
+            self.add_error("event", "Event is full")
+        return cleaned_data
+
+
+@admin.register(Registration)
+class RegistrationAdmin(LargeTableAdmin):
+    form = RegistrationAdminForm
+    list_display = ("id", "attendee", "event", "created_at")
+    list_filter = (EventFilter,)
+    list_select_related = ("attendee", "event")
+    autocomplete_fields = ("attendee", "event")
+    # Both orderings are served by the (created_at, id) and
+    # (event, created_at, id) indexes.
+    ordering = ("-created_at", "-id")
+    sortable_by = ("id", "created_at")
+    readonly_fields = ("created_at",)
+
+
+@admin.register(WaitlistEntry)
+class WaitlistEntryAdmin(LargeTableAdmin):
+    list_display = ("id", "attendee", "event", "created_at")
+    list_filter = (EventFilter,)
+    list_select_related = ("attendee", "event")
+    autocomplete_fields = ("attendee", "event")
+    readonly_fields = ("created_at",)
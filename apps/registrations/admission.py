@@ -0,0 +1,124 @@
+"""
+Admission control for registration openings.
+
+Time is cut into fixed windows per event, and each window admits at most
+``RATE`` registrations. A request that finds the current window full
+reserves a slot in the first future window with room and gets a signed
+ticket for it; presenting the ticket once that window opens admits the
+request without touching the counters again. When every window within
+``MAX_WAIT`` is taken the request is shed outright.
+
+Everything here runs against the ADMISSION_CACHE_ALIAS cache only, so
+excess load is turned away before it reaches the registration tables.
+Slots are reserved with add() and incr(), which that alias must run
+atomically and share between workers (see ``apps.core.cache.counter_cache``),
+or they could admit more than ``RATE`` per window between them. By default
+it is the database counter store, where a reservation is a conditional
+``UPDATE ... SET value = value + 1`` on the slot's row; Redis is faster. The tail key is only a hint: a stale
+value costs extra increments, never an extra admission.
+"""
+import math
+import time
+
+from django.conf import settings
+from django.core import signing
+from rest_framework import status
+from rest_framework.exceptions import Throttled
+
+from apps.core.cache import counter_cache
+
+TICKET_SALT = "registrations.admission"
+TICKET_HEADER = "HTTP_X_QUEUE_TICKET"
+
+
+class QueueFull(Throttled):
+    """429 carrying the ticket (if any) the client should come back with."""
+    status_code = status.HTTP_429_TOO_MANY_REQUESTS
+
+    def __init__(self, wait, ticket=None):
+        self.wait = math.ceil(wait)
+        detail = {
+            "detail": "Registration is busy, retry later.",
+            "retry_after": self.wait,
+        }
+        if ticket is not None:
+            detail["ticket"] = ticket
+        super(Throttled, self).__init__(detail)
+
+
+def _config():
+    return settings.REGISTRATION_ADMISSION
+
+
+def _store():
+    return counter_cache(settings.ADMISSION_CACHE_ALIAS)
+
+
+def _slot_key(event_id, window):
+    return f"admission:{event_id}:{window}"
+
+
+def _tail_key(event_id):
+    # Earliest window that may still have room; lets callers skip windows
+    # already known to be full instead of re-incrementing each of them.
+    return f"admission:{event_id}:tail"
+
+
+def _reserve(event_id, now):
+    config = _config()
+    length = config["WINDOW"]
+    current = int(now // length)
+    last = current + config["MAX_WAIT"] // length
+    timeout = config["MAX_WAIT"] + 2 * length
+    store = _store()
+
+    start = max(current, store.get(_tail_key(event_id), current))
+    for window in range(start, last + 1):
+        key = _slot_key(event_id, window)
+        store.add(key, 0, timeout)
+        if store.incr(key) <= config["RATE"]:
+            if window > start:
+                store.set(_tail_key(event_id), window, timeout)
+            return window
+    store.set(_tail_key(event_id), last + 1, timeout)
+    return None
+
+
+def issue_ticket(user_id, event_id, window):
+    return signing.dumps({"u": user_id, "e": event_id, "w": window}, salt=TICKET_SALT)
+
+
+def read_ticket(ticket, user_id, event_id):
+    """Return the reserved window, or None for a missing/foreign/stale ticket."""
+    if not ticket:
+        return None
+    config = _config()
+    try:
+        data = signing.loads(ticket, salt=TICKET_SALT, max_age=config["MAX_WAIT"] + config["WINDOW"])
+    except signing.BadSignature:
+        return None
+    if data.get("u") != user_id or data.get("e") != event_id:
+        return None
+    return data.get("w")
+
+
+def admit(request, event_id):
+    """
+    Raise QueueFull unless the request may go ahead now. The ticket is read
+    from the ``X-Queue-Ticket`` header.
+    """
+    config = _config()
+    if not config["ENABLED"]:
+        return
+    now = time.time()
+    length = config["WINDOW"]
+    user_id = request.user.pk
+
+    window = read_ticket(request.META.get(TICKET_HEADER), user_id, event_id)
+    if window is None:
+        window = _reserve(event_id, now)
+        if window is None:
+            raise QueueFull(config["MAX_WAIT"])
+    opens_at = window * length
+    if opens_at > now:
+        raise QueueFull(opens_at - now, issue_ticket(user_id, event_id, window))
@@ -0,0 +1,24 @@
+from django.db import migrations
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_seats_taken(apps, schema_editor):
+    Event = apps.get_model('events', 'Event')
+    Registration = apps.get_model('registrations', 'Registration')
+    counts = Registration.objects.filter(event=OuterRef('pk')).order_by().values('event').annotate(
+        n=Count('pk')
+    ).values('n')
+    Event.objects.update(seats_taken=Coalesce(Subquery(counts), Value(0)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_event_seats_taken'),
+        ('registrations', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_seats_taken, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0004_pagination_indexes'),
+        ('registrations', '0003_backfill_event_seats_taken'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='registration',
+            index=models.Index(fields=['created_at', 'id'], name='registration_created_id_idx'),
+        ),
+    ]
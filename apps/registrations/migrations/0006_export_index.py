@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0005_search_indexes'),
+        ('registrations', '0005_waitlistentry'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='registration',
+            index=models.Index(fields=['event', 'created_at', 'id'], name='registration_event_created_idx'),
+        ),
+    ]
@@ -1,10 +1,14 @@
-from django.db import models, transaction
+from django.db import IntegrityError, models, transaction
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from apps.events.models import Event
 
 User = settings.AUTH_USER_MODEL
 
+
+class EventFull(ValidationError):
+    """Raised when a registration cannot claim a seat on its event."""
+
 class Registration(models.Model):
     attendee = models.ForeignKey(User, on_delete=models.CASCADE, related_name='registration')
     event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='registrations')
@@ -12,13 +16,117 @@ class Registration(models.Model):
 
     class Meta:
         unique_together = ('attendee', 'event')
-
-    def clean(self):
-        current_count = Registration.objects.filter(event=self.event).exclude(pk=self.pk).count()
-        if current_count >= self.event.capacity:
-            raise ValidationError("Event is full")
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='registration_created_id_idx'),
+            models.Index(fields=['event', 'created_at', 'id'], name='registration_event_created_idx'),
+        ]
 
     def save(self, *args, **kwargs):
+        """
+        Seats are admitted through Event.claim_seat(), a single conditional
+        UPDATE on the event row, so the cost does not grow with the number
+        of registrants and concurrent signups cannot oversell. Releasing the
+        seat on delete, and promoting the waitlist into it, is handled by the
+        post_delete signal.
+        """
         with transaction.atomic():
-            self.clean()
+            if self._state.adding:
+                previous_event_id = None
+            else:
+                previous_event_id = Registration.objects.filter(pk=self.pk).values_list(
+                    'event_id', flat=True
+                ).first()
+
+            if previous_event_id != self.event_id:
+                if not Event.claim_seat(self.event_id):
+                    raise EventFull("Event is full")
+                if previous_event_id is not None:
+                    Event.release_seat(previous_event_id)
             super().save(*args, **kwargs)
+            if previous_event_id is not None and previous_event_id != self.event_id:
+                promote_waitlist(previous_event_id)
+
+
+class WaitlistEntry(models.Model):
+    """
+    FIFO queue of attendees waiting for a seat on a full event. Queue order
+    is the auto-increment id, so the head and a member's position are both
+    answered from the (event, id) index.
+    """
+    attendee = models.ForeignKey(User, on_delete=models.CASCADE, related_name='waitlist_entries')
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='waitlist_entries')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ('attendee', 'event')
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['event', 'id'], name='waitlist_event_id_idx'),
+        ]
+
+    @property
+    def position(self):
+        """1-based place in the queue, for a single entry; lists use with_positions()."""
+        return WaitlistEntry.objects.filter(event_id=self.event_id, id__lte=self.id).count()
+
+    @classmethod
+    def with_positions(cls, queryset):
+        """
+        Annotate ``queue_position`` in the same query. A correlated count
+        rather than a window function, so the place stays queue-wide when
+        ``queryset`` is filtered down to one attendee's entries.
+        """
+        ahead = (
+            cls.objects.filter(event_id=models.OuterRef('event_id'), id__lte=models.OuterRef('id'))
+            .order_by()
+            .values('event_id')
+            .annotate(count=models.Count('id'))
+            .values('count')
+        )
+        return queryset.annotate(queue_position=models.Subquery(ahead, output_field=models.IntegerField()))
+
+    @classmethod
+    def enqueue(cls, attendee_id, event_id):
+        """
+        Add the attendee to the event's queue, then run a promotion pass so
+        a seat released between the failed claim and the insert is not left
+        empty. Returns ``(entry, registration)``; exactly one is not None.
+        """
+        with transaction.atomic():
+            entry, _ = cls.objects.get_or_create(attendee_id=attendee_id, event_id=event_id)
+            for registration in promote_waitlist(event_id):
+                if registration.attendee_id == attendee_id:
+                    return None, registration
+        return entry, None
+
+
+def promote_waitlist(event_id):
+    """
+    Move entries from the head of the event's queue into free seats until
+    the event is full again or the queue is empty. The head row is locked
+    so concurrent promoters serve the queue strictly in order.
+    """
+    promoted = []
+    with transaction.atomic():
+        while True:
+            entry = (
+                WaitlistEntry.objects.select_for_update()
+                .filter(event_id=event_id)
+                .order_by('id')
+                .first()
+            )
+            if entry is None:
+                break
+            registration = Registration(attendee_id=entry.attendee_id, event_id=event_id)
+            try:
+                with transaction.atomic():
+                    registration.save()
+            except EventFull:
+                break
+            except IntegrityError:
+                # Already registered by another path; the entry is stale.
+                registration = None
+            entry.delete()
+            if registration is not None:
+                promoted.append(registration)
+    return promoted
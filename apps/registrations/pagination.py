@@ -0,0 +1,5 @@
+from apps.core.pagination import CursorPagination
+
+
+class RegistrationCursorPagination(CursorPagination):
+    ordering = ("created_at", "id")
@@ -1,11 +1,21 @@
 from rest_framework import serializers
 from django.core.exceptions import ValidationError
-from .models import Registration
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema_field
+from .models import EventFull, Registration, WaitlistEntry
+
+
+class CurrentUserIdDefault(serializers.CurrentUserDefault):
+    """The requesting user's pk; token users are not model instances."""
+
+    def __call__(self, serializer_field):
+        return super().__call__(serializer_field).pk
+
 
 class RegistrationSerializer(serializers.ModelSerializer):
     attendee = serializers.PrimaryKeyRelatedField(
         read_only=True,
-        default=serializers.CurrentUserDefault()
+        default=CurrentUserIdDefault()
     )
 
     class Meta:
@@ -14,13 +24,31 @@ class RegistrationSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'attendee', 'created_at']
 
     def create(self, validated_data):
-        user = self.context['request'].user
-        validated_data['attendee'] = user
+        validated_data.pop('attendee', None)
+        validated_data['attendee_id'] = self.context['request'].user.pk
 
         reg = Registration(**validated_data)
         try:
             reg.save()
+        except EventFull:
+            # Let the view put the attendee on the waitlist.
+            raise
         except ValidationError as e:
             # Convert Django ValidationError menjadi DRF ValidationError agar jadi HTTP 400
             raise serializers.ValidationError(e.message_dict if hasattr(e, 'message_dict') else e.messages)
         return reg
+
+
+class WaitlistEntrySerializer(serializers.ModelSerializer):
+    position = serializers.SerializerMethodField()
+
+    class Meta:
+        model = WaitlistEntry
+        fields = ['id', 'attendee', 'event', 'position', 'created_at']
+        read_only_fields = fields
+
+    @extend_schema_field(OpenApiTypes.INT)
+    def get_position(self, entry):
+        # Annotated by WaitlistEntry.with_positions() on list querysets.
+        position = getattr(entry, 'queue_position', None)
+        return entry.position if position is None else position
@@ -0,0 +1,34 @@
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.core.cache import bump_cache_generation
+from apps.events.models import Event
+from .models import Registration, promote_waitlist
+
+post_save.connect(bump_cache_generation, sender=Registration, dispatch_uid="cache-registration-save")
+post_delete.connect(bump_cache_generation, sender=Registration, dispatch_uid="cache-registration-delete")
+
+
+def _deleting_event(origin):
+    if isinstance(origin, QuerySet):
+        return origin.model is Event
+    return isinstance(origin, Event)
+
+
+@receiver(post_delete, sender=Registration)
+def release_event_seat(sender, instance, origin=None, **kwargs):
+    # post_delete runs inside the deletion transaction, so the seat is
+    # released and handed to the head of the waitlist atomically with the
+    # row, including queryset and cascade deletes. When the event itself is
+    # being deleted there is nothing to promote into.
+    Event.release_seat(instance.event_id)
+    if not _deleting_event(origin):
+        promote_waitlist(instance.event_id)
+
+
+@receiver(post_save, sender=Event)
+def promote_on_capacity_change(sender, instance, created, raw=False, **kwargs):
+    # Raising an event's capacity frees seats for anyone already queued.
+    if not created and not raw:
+        promote_waitlist(instance.pk)
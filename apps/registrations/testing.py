@@ -0,0 +1,104 @@
+"""
+Bulk seeding of a synthetic catalog with registrations, for benchmarks
+and local performance work.
+
+Objects are built with the factories in apps.users.testing and
+apps.events.testing and written with bulk_create, so volumes in the
+hundreds of thousands stay practical. Validation in Session.save()/
+Registration.save() is bypassed; the generated schedule is valid by
+construction (sessions in a track never overlap, seats_taken matches the
+registrations).
+"""
+from datetime import timedelta
+
+import factory
+from django.contrib.auth import get_user_model
+
+from apps.events.models import Venue, Event, Track, Speaker, Session
+from apps.events.testing import EventFactory, SessionFactory, SpeakerFactory, TrackFactory, VenueFactory
+from apps.users.testing import UserFactory
+from .models import Registration
+
+SESSION_LENGTH = timedelta(minutes=30)
+TRACKS_PER_EVENT = 4
+BATCH_SIZE = 5000
+
+
+def seed_dataset(events=100, sessions=1000, registrations=5000, speakers=None, venues=10):
+    """
+    Insert a synthetic catalog and return a dict with the created counts.
+
+    ``sessions`` and ``registrations`` are spread evenly over the events;
+    one user is created per registration slot of the busiest event.
+    """
+    speakers = speakers if speakers is not None else max(1, sessions // 5)
+    venue_objs = Venue.objects.bulk_create(VenueFactory.build_batch(venues), batch_size=BATCH_SIZE)
+    speaker_objs = Speaker.objects.bulk_create(SpeakerFactory.build_batch(speakers), batch_size=BATCH_SIZE)
+
+    sessions_per_event = -(-sessions // events) if events else 0
+    sessions_per_track = -(-sessions_per_event // TRACKS_PER_EVENT)
+    event_length = max(timedelta(days=1), SESSION_LENGTH * sessions_per_track)
+    registrations_per_event = -(-registrations // events) if events else 0
+
+    event_objs = Event.objects.bulk_create(
+        [
+            EventFactory.build(
+                venue=venue_objs[i % len(venue_objs)],
+                end_date=factory.LazyAttribute(lambda event: event.start_date + event_length),
+            )
+            for i in range(events)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    track_objs = Track.objects.bulk_create(
+        [
+            TrackFactory.build(event=event, title=f"Track {t + 1}")
+            for event in event_objs
+            for t in range(TRACKS_PER_EVENT)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+
+    session_objs = []
+    remaining = sessions
+    for e, event in enumerate(event_objs):
+        count = min(sessions_per_event, remaining)
+        remaining -= count
+        tracks = track_objs[e * TRACKS_PER_EVENT:(e + 1) * TRACKS_PER_EVENT]
+        for i in range(count):
+            start = event.start_date + SESSION_LENGTH * (i // TRACKS_PER_EVENT)
+            session_objs.append(SessionFactory.build(
+                track=tracks[i % TRACKS_PER_EVENT],
+                speaker=speaker_objs[(e * sessions_per_event + i) % len(speaker_objs)],
+                start_time=start,
+                end_time=start + SESSION_LENGTH,
+            ))
+        if len(session_objs) >= BATCH_SIZE:
+            Session.objects.bulk_create(session_objs, batch_size=BATCH_SIZE)
+            session_objs = []
+    Session.objects.bulk_create(session_objs, batch_size=BATCH_SIZE)
+
+    User = get_user_model()
+    user_objs = User.objects.bulk_create(UserFactory.build_batch(registrations_per_event), batch_size=BATCH_SIZE)
+
+    registration_objs = []
+    remaining = registrations
+    for event in event_objs:
+        count = min(registrations_per_event, remaining)
+        remaining -= count
+        registration_objs.extend(Registration(attendee=user, event=event) for user in user_objs[:count])
+        if len(registration_objs) >= BATCH_SIZE:
+            Registration.objects.bulk_create(registration_objs, batch_size=BATCH_SIZE)
+            registration_objs = []
+        Event.objects.filter(pk=event.pk).update(seats_taken=count)
+    Registration.objects.bulk_create(registration_objs, batch_size=BATCH_SIZE)
+
+    return {
+        "venues": len(venue_objs),
+        "events": len(event_objs),
+        "tracks": len(track_objs),
+        "speakers": len(speaker_objs),
+        "sessions": sessions,
+        "users": len(user_objs),
+        "registrations": registrations,
+    }
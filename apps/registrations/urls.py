@@ -1,8 +1,18 @@
-from django.urls import path, include
+from django.urls import path, include, re_path
 from rest_framework.routers import DefaultRouter
-from .views import RegistrationViewSet
+from .views import AttendeeExportView, RegistrationViewSet, WaitlistViewSet
 
 router = DefaultRouter()
+# Registered before the catch-all registration routes so "waitlist/" is not
+# captured as a registration pk.
+router.register('waitlist', WaitlistViewSet, basename='waitlist')
 router.register('', RegistrationViewSet, basename='registration')
 
-urlpatterns = [path('', include(router.urls))]
\ No newline at end of file
+urlpatterns = [
+    re_path(
+        r'^export/(?P<event_id>[0-9]+)\.(?P<fmt>csv|jsonl)$',
+        AttendeeExportView.as_view(),
+        name='registration-export',
+    ),
+    path('', include(router.urls)),
+]
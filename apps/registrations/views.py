@@ -1,16 +1,121 @@
-from rest_framework import viewsets, permissions
-from .models import Registration
-from .serializers import RegistrationSerializer
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils.dateparse import parse_datetime
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+from rest_framework import mixins, status, viewsets, permissions
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.core.permissions import IsOrganizer
+from apps.core.streaming import buffered, csv_lines
+from apps.events.models import Event
+from .exports import CSV_HEADER, attendee_rows, csv_attendees, jsonl_attendees
+from .admission import admit
+from .models import EventFull, Registration, WaitlistEntry
+from .pagination import RegistrationCursorPagination
+from .serializers import RegistrationSerializer, WaitlistEntrySerializer
 
 class RegistrationViewSet(viewsets.ModelViewSet):
     serializer_class = RegistrationSerializer
+    pagination_class = RegistrationCursorPagination
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
         user = self.request.user
         if getattr(user, 'is_organizer', False):
             return Registration.objects.all()
-        return Registration.objects.filter(attendee=user)
+        return Registration.objects.filter(attendee_id=user.pk)
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if self.action == 'create':
+            # Admission runs on the raw payload, before the serializer looks
+            # the event up, so shed requests never reach the database.
+            try:
+                event_id = int(request.data.get('event'))
+            except (TypeError, ValueError):
+                return
+            admit(request, event_id)
+
+    def create(self, request, *args, **kwargs):
+        """
+        Full events queue the attendee instead of rejecting them: the
+        response is 202 with the waitlist entry and its position, so clients
+        poll the entry rather than retrying the signup.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            self.perform_create(serializer)
+        except EventFull:
+            event = serializer.validated_data['event']
+            entry, registration = WaitlistEntry.enqueue(request.user.pk, event.id)
+            if registration is None:
+                data = WaitlistEntrySerializer(entry, context=self.get_serializer_context()).data
+                return Response(data, status=status.HTTP_202_ACCEPTED)
+            serializer = self.get_serializer(registration)
+        headers = self.get_success_headers(serializer.data)
+        return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
     
     def perform_create(self, serializer):
         serializer.save()
+
+
+class WaitlistViewSet(mixins.ListModelMixin,
+                      mixins.RetrieveModelMixin,
+                      mixins.DestroyModelMixin,
+                      viewsets.GenericViewSet):
+    """Waitlist entries; attendees see and leave their own queues."""
+    serializer_class = WaitlistEntrySerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        user = self.request.user
+        if getattr(user, 'is_organizer', False):
+            queryset = WaitlistEntry.objects.all()
+        else:
+            queryset = WaitlistEntry.objects.filter(attendee_id=user.pk)
+        return WaitlistEntry.with_positions(queryset)
+
+
+class AttendeeExportView(APIView):
+    """
+    Stream an event's registrants with their attendee details as CSV or
+    JSON lines. ``?since=`` (inclusive) and ``?until=`` (exclusive) take
+    ISO datetimes and bound ``registered_at`` for incremental exports.
+    """
+    permission_classes = [IsOrganizer]
+
+    def perform_content_negotiation(self, request, force=False):
+        # The body is not produced by a renderer; only errors are.
+        return super().perform_content_negotiation(request, force=True)
+
+    def _datetime_param(self, request, name):
+        value = request.query_params.get(name)
+        if not value:
+            return None
+        parsed = parse_datetime(value)
+        if parsed is None:
+            raise ValidationError({name: "Enter a valid ISO 8601 datetime."})
+        return parsed
+
+    @extend_schema(responses={(200, "text/csv"): OpenApiTypes.BINARY, (200, "application/x-ndjson"): OpenApiTypes.BINARY})
+    def get(self, request, event_id, fmt):
+        event = get_object_or_404(Event.objects.only("id", "slug"), pk=event_id)
+        rows = attendee_rows(
+            event.id,
+            since=self._datetime_param(request, "since"),
+            until=self._datetime_param(request, "until"),
+        )
+        if fmt == "jsonl":
+            content = jsonl_attendees(rows)
+            content_type = "application/x-ndjson"
+        else:
+            content = csv_lines(CSV_HEADER, csv_attendees(rows))
+            content_type = "text/csv; charset=utf-8"
+
+        response = StreamingHttpResponse(buffered(content), content_type=content_type)
+        response["Content-Disposition"] = f'attachment; filename="{event.slug or event.id}-attendees.{fmt}"'
+        return response
@@ -1,3 +1,15 @@
 from django.contrib import admin
+from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 
-# Register your models here.
+from apps.core.admin import EstimatedCountPaginator
+from .models import User
+
+
+@admin.register(User)
+class UserAdmin(BaseUserAdmin):
+    list_display = ("username", "email", "is_organizer", "is_speaker", "is_staff")
+    list_filter = ("is_organizer", "is_speaker", "is_staff", "is_superuser", "is_active")
+    fieldsets = BaseUserAdmin.fieldsets + (("Roles", {"fields": ("is_organizer", "is_speaker")}),)
+    add_fieldsets = BaseUserAdmin.add_fieldsets + (("Roles", {"fields": ("is_organizer", "is_speaker")}),)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
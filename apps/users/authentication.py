@@ -0,0 +1,84 @@
+"""
+Stateless JWT authentication.
+
+Access tokens issued by the token endpoints carry the user's role flags
+(``is_organizer``/``is_speaker``, plus ``is_staff``/``is_superuser`` for
+IsAdminUser and friends), so permission checks and queryset scoping can
+run from the token alone instead of loading the ``User`` row on every
+request. Code that needs the real model instance goes through
+``ClaimsUser.user``, which reads from a short-TTL cache.
+"""
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+# TokenUser reads is_staff/is_superuser from the claims and defaults them
+# to False, so they must be in the token for admins to be recognised.
+ROLE_CLAIMS = ("is_organizer", "is_speaker", "is_staff", "is_superuser")
+
+
+def _user_cache_key(user_id):
+    return f"auth:user:{user_id}"
+
+
+def get_cached_user(user_id):
+    """Return the user for ``user_id`` (or None), cached for AUTH_USER_CACHE_TIMEOUT."""
+    timeout = settings.AUTH_USER_CACHE_TIMEOUT
+    if timeout:
+        user = cache.get(_user_cache_key(user_id))
+        if user is not None:
+            return user
+    user = get_user_model().objects.filter(pk=user_id).first()
+    if user is not None and timeout:
+        cache.set(_user_cache_key(user_id), user, timeout)
+    return user
+
+
+def forget_user(user_id):
+    cache.delete(_user_cache_key(user_id))
+
+
+def role_claims(user):
+    return {claim: getattr(user, claim) for claim in ROLE_CLAIMS}
+
+
+class ClaimsUser(TokenUser):
+    """Token-backed user; role flags come from the claims."""
+
+    @cached_property
+    def id(self):
+        # The claim is a string; compare and filter with the model's pk type.
+        return get_user_model()._meta.pk.to_python(self.token[api_settings.USER_ID_CLAIM])
+
+    @cached_property
+    def user(self):
+        return get_cached_user(self.id)
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    Authenticate from the token claims when they carry the role flags.
+    Tokens minted before the claims existed fall back to the cached user.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        if all(claim in validated_token for claim in ROLE_CLAIMS):
+            return ClaimsUser(validated_token)
+
+        user = get_cached_user(user_id)
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
@@ -0,0 +1,9 @@
+"""
+drf-spectacular extensions for the users app.
+"""
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+
+
+class ClaimsJWTScheme(SimpleJWTScheme):
+    """Document ClaimsJWTAuthentication as the same bearer scheme as SimpleJWT."""
+    target_class = "apps.users.authentication.ClaimsJWTAuthentication"
@@ -1,8 +1,39 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .authentication import get_cached_user, role_claims
+
 User = get_user_model()
 
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
-        fields = ['id','username','email','first_name','last_name','is_organizer','is_speaker']
\ No newline at end of file
+        fields = ['id','username','email','first_name','last_name','is_organizer','is_speaker']
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Embed the role flags in the tokens so requests can skip the user lookup."""
+
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        for claim, value in role_claims(user).items():
+            token[claim] = value
+        return token
+
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    """Re-read the role flags on refresh so role changes reach new access tokens."""
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        access = AccessToken(data["access"])
+        user = get_cached_user(access[api_settings.USER_ID_CLAIM])
+        if user is not None:
+            for claim, value in role_claims(user).items():
+                access[claim] = value
+            data["access"] = str(access)
+        return data
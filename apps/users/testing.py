@@ -0,0 +1,19 @@
+"""
+Test and benchmark factories for users (factory-boy/faker).
+"""
+from uuid import uuid4
+
+import factory
+from django.contrib.auth import get_user_model
+from factory.django import DjangoModelFactory
+
+
+class UserFactory(DjangoModelFactory):
+    class Meta:
+        model = get_user_model()
+
+    username = factory.LazyFunction(lambda: f"user-{uuid4().hex[:12]}")
+    email = factory.LazyAttribute(lambda user: f"{user.username}@example.com")
+    first_name = factory.Faker("first_name")
+    last_name = factory.Faker("last_name")
+    password = "!"  # unusable; hashing real passwords would dominate seeding
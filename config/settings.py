@@ -40,6 +40,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'apps.core.middleware.QueryInstrumentationMiddleware',
+    'apps.core.db_router.ReplicaRoutingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -50,6 +52,11 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Per-request SQL instrumentation: requests slower than this are written to
+# the "apps.slow_requests" log; statements repeated N_PLUS_ONE_THRESHOLD
+# times within one request are flagged as likely N+1 queries.
+SLOW_REQUEST_THRESHOLD_MS = env.int('SLOW_REQUEST_THRESHOLD_MS', default=500)
+N_PLUS_ONE_THRESHOLD = env.int('N_PLUS_ONE_THRESHOLD', default=5)
 
 ROOT_URLCONF = 'config.urls'
 WSGI_APPLICATION = 'config.wsgi.application'
@@ -69,25 +76,115 @@ TEMPLATES = [
     },
 ]
 
+# Connection reuse. By default every request opens its own connection:
+# persistent connections (DATABASE_CONN_MAX_AGE > 0) are only safe under
+# WSGI, since under ASGI each request may run on a new thread and leak one.
+# DATABASE_POOL=True switches to psycopg 3's connection pool instead, which
+# is the way to reuse connections when serving ASGI (Django forbids
+# combining the two). Either way a reused connection is health-checked
+# before it is handed out. The backend
+# is stock PostgreSQL plus checkout metrics (apps.core.db_metrics).
+DATABASE_POOL = env.bool('DATABASE_POOL', default=False)
+
+
+def database_connection_settings():
+    if DATABASE_POOL:
+        return {
+            'CONN_MAX_AGE': 0,
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {
+                'pool': {
+                    'min_size': env.int('DATABASE_POOL_MIN_SIZE', default=2),
+                    'max_size': env.int('DATABASE_POOL_MAX_SIZE', default=10),
+                    # Seconds a request waits for a free connection before failing.
+                    'timeout': env.float('DATABASE_POOL_TIMEOUT', default=10.0),
+                },
+            },
+        }
+    return {
+        'CONN_MAX_AGE': env.int('DATABASE_CONN_MAX_AGE', default=0),
+        'CONN_HEALTH_CHECKS': True,
+    }
+
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql',
+        'ENGINE': 'apps.core.db_backends.postgresql',
         'NAME': os.getenv("DATABASE_NAME"),
         'USER': os.getenv("DATABASE_USER"),
         'PASSWORD': os.getenv("DATABASE_PASSWORD"),
         'HOST': os.getenv("DATABASE_HOST"),
         'PORT': os.getenv("DATABASE_PORT"),
+        **database_connection_settings(),
+    }
+}
+
+# Read replicas: one alias per host in DATABASE_REPLICA_HOSTS ("host" or
+# "host:port"), same credentials as the primary. Safe-method requests read
+# from a replica unless the user wrote within READ_YOUR_WRITES_SECONDS.
+DATABASE_REPLICAS = []
+for index, replica in enumerate(env.list('DATABASE_REPLICA_HOSTS', default=[]), start=1):
+    host, _, port = replica.partition(':')
+    alias = f'replica_{index}'
+    DATABASES[alias] = {
+        **DATABASES['default'],
+        'HOST': host,
+        'PORT': port or DATABASES['default']['PORT'],
+        # Every alias gets its own pool.
+        **database_connection_settings(),
+        'TEST': {'MIRROR': 'default'},
     }
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ['apps.core.db_router.PrimaryReplicaRouter']
+READ_YOUR_WRITES_SECONDS = env.int('READ_YOUR_WRITES_SECONDS', default=5)
+
+
+def counter_cache_config(var, location):
+    if env(var, default=None):
+        return env.cache(var)
+    return {'BACKEND': 'apps.core.cache_backends.DatabaseCounterCache', 'LOCATION': location}
+
+
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://default?max_entries=5000'),
+    # State that has to be consistent across workers (response cache
+    # generations, read-your-writes pins, seat counts), read and written on
+    # every registration and routed read, so it must be a fast store, never
+    # the file backend (whose set() scans its directory). Only get, set and
+    # add. The default is per process, which check --deploy warns about;
+    # docker-compose points SHARED_CACHE_URL at its Redis service.
+    'shared': env.cache('SHARED_CACHE_URL', default='locmemcache://shared?max_entries=100000'),
+    # Rate-limit counters need an atomic incr(), which the file backend
+    # lacks (a system check refuses it). Without THROTTLE_CACHE_URL they
+    # count per process (check --deploy warns); docker-compose points it at
+    # its Redis service.
+    'throttle': env.cache('THROTTLE_CACHE_URL', default='locmemcache://throttle?max_entries=100000'),
+    # Registration admission slots, under the same rules as 'throttle'. By
+    # default they are rows of the primary database, which every worker
+    # shares (apps.core.cache_backends); ADMISSION_CACHE_URL may point at
+    # Redis instead.
+    'admission': counter_cache_config('ADMISSION_CACHE_URL', 'admission'),
 }
 
+SHARED_CACHE_ALIAS = 'shared'
+THROTTLE_CACHE_ALIAS = 'throttle'
+ADMISSION_CACHE_ALIAS = 'admission'
+
+# Response cache for the read-only actions of the catalog viewsets. The
+# payloads may stay per process: their keys embed generations kept in the
+# shared cache, so a write in one worker invalidates them in all of them.
+API_CACHE_ALIAS = 'default'
+API_CACHE_TIMEOUT = env.int('API_CACHE_TIMEOUT', default=300)
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.users.authentication.ClaimsJWTAuthentication',
     ),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_THROTTLE_CLASSES': [
-        'rest_framework.throttling.AnonRateThrottle',
-        'rest_framework.throttling.UserRateThrottle',
+        'apps.core.throttling.AnonRateThrottle',
+        'apps.core.throttling.UserRateThrottle',
     ],
     'DEFAULT_THROTTLE_RATES': {
         'anon': '100/day',
@@ -96,14 +193,56 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticatedOrReadOnly'
     ],
+    'DEFAULT_PAGINATION_CLASS': 'apps.core.pagination.CursorPagination',
+    'PAGE_SIZE': env.int('API_PAGE_SIZE', default=50),
+}
+
+# Upper bound for the ?page_size= query parameter on paginated endpoints.
+API_MAX_PAGE_SIZE = env.int('API_MAX_PAGE_SIZE', default=200)
+
+# Events in the cached home-page feed (/events/upcoming/).
+UPCOMING_FEED_SIZE = env.int('UPCOMING_FEED_SIZE', default=20)
+
+# Reject session writes that double-book a speaker or a room within the
+# event (the per-track overlap check always applies).
+SCHEDULE_STRICT_CONFLICTS = env.bool('SCHEDULE_STRICT_CONFLICTS', default=False)
+
+# Admission control for registration openings: each event admits RATE
+# signups per WINDOW seconds; later arrivals get a ticket for a future
+# window, and anything beyond MAX_WAIT seconds is shed with 429.
+REGISTRATION_ADMISSION = {
+    'ENABLED': env.bool('REGISTRATION_ADMISSION_ENABLED', default=True),
+    'RATE': env.int('REGISTRATION_ADMISSION_RATE', default=50),
+    'WINDOW': env.int('REGISTRATION_ADMISSION_WINDOW', default=1),
+    'MAX_WAIT': env.int('REGISTRATION_ADMISSION_MAX_WAIT', default=300),
+}
+
+# Seats-remaining endpoint and stream. The counter is cached in the shared
+# cache for CACHE_TIMEOUT seconds (and retired on every seat change);
+# pollers may reuse a response for MAX_AGE seconds. The server-sent event
+# stream (ASGI only) checks for changes every POLL_INTERVAL seconds per
+# event and worker, sends a keepalive comment every KEEPALIVE seconds and
+# closes after STREAM_TIMEOUT seconds so clients reconnect.
+AVAILABILITY = {
+    'CACHE_TIMEOUT': env.int('AVAILABILITY_CACHE_TIMEOUT', default=30),
+    'MAX_AGE': env.int('AVAILABILITY_MAX_AGE', default=2),
+    'POLL_INTERVAL': env.float('AVAILABILITY_POLL_INTERVAL', default=1.0),
+    'KEEPALIVE': env.int('AVAILABILITY_KEEPALIVE', default=15),
+    'STREAM_TIMEOUT': env.int('AVAILABILITY_STREAM_TIMEOUT', default=300),
 }
 
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=60),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
     'AUTH_HEADER_TYPES': ('Bearer',),
+    # Embed is_organizer/is_speaker in the tokens (see apps.users.authentication).
+    'TOKEN_OBTAIN_SERIALIZER': 'apps.users.serializers.ClaimsTokenObtainPairSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'apps.users.serializers.ClaimsTokenRefreshSerializer',
 }
 
+# Seconds a full User row stays cached for token users that need it; 0 disables.
+AUTH_USER_CACHE_TIMEOUT = env.int('AUTH_USER_CACHE_TIMEOUT', default=60)
+
 SPECTACULAR_SETTINGS = {
     'TITLE': 'Event Management API',
     'DESCRIPTION': 'API for managing technical events and conferences',
@@ -132,3 +271,18 @@ MEDIA_ROOT = BASE_DIR / 'media'
 AUTH_USER_MODEL = 'users.User'
 
 CORS_ALLOW_ALL_ORIGINS = True
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'apps.slow_requests': {
+            'handlers': ['console'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
+    },
+}
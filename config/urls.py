@@ -17,6 +17,7 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
+from apps.core.views import DatabaseMetricsView
 from .views import home
 
 urlpatterns = [
@@ -28,4 +29,5 @@ urlpatterns = [
     path('api/v1/auth/', include('apps.users.urls')),
     path('api/v1/events/', include('apps.events.urls')),
     path('api/v1/registrations/', include('apps.registrations.urls')),
+    path('api/v1/metrics/db/', DatabaseMetricsView.as_view(), name='db-metrics'),
 ]
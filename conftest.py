@@ -0,0 +1,26 @@
+import pytest
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
+
+from apps.core.cache_backends import DatabaseCounterCache
+
+# A second alias on the test database, for routing tests that need real
+# replica connections (see tests/test_db_router.py).
+TEST_REPLICA = "test_replica"
+
+
+@pytest.fixture(scope="session")
+def django_db_modify_db_settings(django_db_modify_db_settings_parallel_suffix):
+    primary = connections["default"].settings_dict
+    settings.DATABASES[TEST_REPLICA] = {**primary, "TEST": {**primary["TEST"], "MIRROR": "default"}}
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Caches outlive the per-test database rollback; start every test empty."""
+    for cache in caches.all():
+        # Except the one kept in the database, which rolls back with it.
+        if not isinstance(cache, DatabaseCounterCache):
+            cache.clear()
+    yield
@@ -0,0 +1,76 @@
+"""
+Timing and query-count helpers shared by the benchmark tests.
+
+Volumes and iteration counts come from the environment so the same suite
+runs as a quick budget check in CI and as a load benchmark locally, e.g.::
+
+    BENCH_EVENTS=1000 BENCH_SESSIONS=50000 BENCH_REGISTRATIONS=1000000 \\
+    BENCH_ITERATIONS=50 BENCH_ASSERT_TIMINGS=1 BENCH_REPORT=bench.json pytest tests/benchmarks -s
+
+Wall-clock comparisons vary with the machine and its load, so they are
+only asserted with BENCH_ASSERT_TIMINGS=1; the default run checks query
+counts.
+"""
+import json
+import math
+import os
+import statistics
+import time
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def env_int(name, default):
+    return int(os.environ.get(name, default))
+
+
+ITERATIONS = env_int("BENCH_ITERATIONS", 5)
+ASSERT_TIMINGS = bool(env_int("BENCH_ASSERT_TIMINGS", 0))
+VOLUMES = {
+    "events": env_int("BENCH_EVENTS", 20),
+    "sessions": env_int("BENCH_SESSIONS", 400),
+    "registrations": env_int("BENCH_REGISTRATIONS", 2000),
+}
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def measure(call, iterations=ITERATIONS, before=None):
+    """
+    Run ``call`` ``iterations`` times and return latency percentiles (ms)
+    and the worst-case number of SQL queries of a single run.
+    """
+    timings = []
+    queries = 0
+    response = None
+    for _ in range(iterations):
+        if before is not None:
+            before()
+        with CaptureQueriesContext(connection) as ctx:
+            start = time.perf_counter()
+            response = call()
+            timings.append((time.perf_counter() - start) * 1000)
+        queries = max(queries, len(ctx.captured_queries))
+    return {
+        "status": getattr(response, "status_code", None),
+        "p50_ms": round(statistics.median(timings), 3),
+        "p99_ms": round(percentile(timings, 99), 3),
+        "queries": queries,
+    }
+
+
+def write_report(title, results):
+    """Print a table of ``results`` and append it to $BENCH_REPORT as JSON lines."""
+    print(f"\n{title} (volumes={VOLUMES}, iterations={ITERATIONS})")
+    print(f"{'name':<48} {'status':>6} {'p50 ms':>10} {'p99 ms':>10} {'queries':>8}")
+    for name, result in results.items():
+        print(f"{name:<48} {result['status']!s:>6} {result['p50_ms']:>10} {result['p99_ms']:>10} {result['queries']:>8}")
+
+    path = os.environ.get("BENCH_REPORT")
+    if path:
+        with open(path, "a") as report:
+            report.write(json.dumps({"suite": title, "volumes": VOLUMES, "results": results}) + "\n")
@@ -0,0 +1,80 @@
+import asyncio
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.core.cache import caches
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.views import APIView
+
+from apps.registrations.testing import seed_dataset
+from apps.events.models import Event, Session, Speaker
+from .harness import VOLUMES, env_int, measure, write_report
+
+CONCURRENCY = env_int("BENCH_CONCURRENCY", 20)
+
+
+class AsyncReadPathBenchmark(TestCase):
+    """
+    Sync DRF viewsets vs. the native async endpoints, one request at a time
+    and CONCURRENCY requests in flight. In-process numbers only show the
+    per-request overhead; the concurrency win needs a real ASGI server with
+    slow clients.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_dataset(**VOLUMES)
+        cls.event = Event.objects.order_by("pk").first()
+        cls.session = Session.objects.order_by("pk").first()
+        cls.speaker = Speaker.objects.order_by("pk").first()
+
+    def _pairs(self):
+        return {
+            "event list": (reverse("event-list"), reverse("async-event-list")),
+            "event detail": (
+                reverse("event-detail", args=[self.event.pk]),
+                reverse("async-event-detail", args=[self.event.pk]),
+            ),
+            "session list ?expand": (
+                reverse("session-list") + "?expand=track,speaker",
+                reverse("async-session-list") + "?expand=track,speaker",
+            ),
+            "session detail": (
+                reverse("session-detail", args=[self.session.pk]),
+                reverse("async-session-detail", args=[self.session.pk]),
+            ),
+            "speaker list": (reverse("speaker-list"), reverse("async-speaker-list")),
+            "speaker detail": (
+                reverse("speaker-detail", args=[self.speaker.pk]),
+                reverse("async-speaker-detail", args=[self.speaker.pk]),
+            ),
+        }
+
+    def test_sync_vs_async(self):
+        async def fan_out(url):
+            return (await asyncio.gather(*(self.async_client.get(url) for _ in range(CONCURRENCY))))[-1]
+
+        clear = caches["default"].clear
+
+        def uncached_get(url):
+            # The async endpoints are not cached, so compare against cold sync responses.
+            clear()
+            return self.client.get(url)
+
+        def sequential(url):
+            return [uncached_get(url) for _ in range(CONCURRENCY)][-1]
+
+        results = {}
+        with mock.patch.object(APIView, "get_throttles", return_value=[]), \
+                mock.patch("apps.core.throttling._throttle_response", return_value=None):
+            for name, (sync_url, async_url) in self._pairs().items():
+                results[f"{name} (sync)"] = measure(lambda: uncached_get(sync_url))
+                results[f"{name} (async)"] = measure(lambda: async_to_sync(self.async_client.get)(async_url))
+                results[f"{name} x{CONCURRENCY} (sync)"] = measure(lambda: sequential(sync_url))
+                results[f"{name} x{CONCURRENCY} (async)"] = measure(lambda: async_to_sync(fan_out)(async_url))
+        write_report("sync vs async read path", results)
+
+        for name, result in results.items():
+            with self.subTest(endpoint=name):
+                self.assertEqual(result["status"], 200)
@@ -0,0 +1,71 @@
+from unittest import skipUnless
+
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+
+from apps.core.compiled import compile_serializer
+from apps.registrations.testing import seed_dataset
+from apps.events.models import Event, Session
+from apps.events.serializers import EventSerializer, SessionSerializer
+from .harness import ASSERT_TIMINGS, ITERATIONS, env_int, measure, write_report
+
+ROWS = env_int("BENCH_SERIALIZER_ROWS", 10000)
+
+
+class CompiledSerializerBenchmark(TestCase):
+    """
+    Render ROWS sessions (and the events) to JSON through the regular
+    ModelSerializer and through the compiled values() path, including the
+    query. Both must produce the same bytes.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_dataset(events=max(ROWS // 100, 1), sessions=ROWS, registrations=0)
+
+    def _paths(self, serializer_class, queryset, expand, related):
+        def regular():
+            serializer = serializer_class(queryset.select_related(*related).all(), many=True, expand=expand)
+            return JSONRenderer().render(serializer.data)
+
+        compiled = compile_serializer(serializer_class(expand=expand))
+
+        def fast():
+            rows = queryset.values(*compiled.columns)
+            return JSONRenderer().render(compiled.render_many(rows))
+
+        return regular, fast
+
+    def _cases(self):
+        return {
+            "sessions": (SessionSerializer, Session.objects.order_by("id"), {}, ()),
+            "sessions ?expand=track.event.venue,speaker": (
+                SessionSerializer,
+                Session.objects.order_by("id"),
+                {"track": {"event": {"venue": {}}}, "speaker": {}},
+                ("track__event__venue", "speaker"),
+            ),
+            "events ?expand=venue": (EventSerializer, Event.objects.order_by("id"), {"venue": {}}, ("venue",)),
+        }
+
+    def _run(self, iterations):
+        results = {}
+        for name, (serializer_class, queryset, expand, related) in self._cases().items():
+            regular, fast = self._paths(serializer_class, queryset, expand, related)
+            self.assertEqual(regular(), fast(), name)
+            results[f"{name} (serializer)"] = measure(regular, iterations)
+            results[f"{name} (compiled)"] = measure(fast, iterations)
+        write_report(f"Compiled serializers ({ROWS} sessions)", results)
+        return results
+
+    def test_compiled_path_is_identical_in_one_query(self):
+        for name, result in self._run(iterations=1).items():
+            with self.subTest(case=name):
+                self.assertEqual(result["queries"], 1)
+
+    @skipUnless(ASSERT_TIMINGS, "set BENCH_ASSERT_TIMINGS=1 to compare timings")
+    def test_compiled_path_is_faster(self):
+        results = self._run(ITERATIONS)
+        for name in self._cases():
+            with self.subTest(case=name):
+                self.assertLess(results[f"{name} (compiled)"]["p50_ms"], results[f"{name} (serializer)"]["p50_ms"])
@@ -0,0 +1,219 @@
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.urls import URLResolver, get_resolver, reverse
+from rest_framework.test import APIClient
+from rest_framework.views import APIView
+
+from apps.events.models import Event, Session, Speaker, Track, Venue
+from apps.registrations.models import Registration, WaitlistEntry
+from apps.registrations.testing import seed_dataset
+from apps.users.serializers import ClaimsTokenObtainPairSerializer
+from apps.users.testing import UserFactory
+from .harness import VOLUMES, measure, write_report
+
+# Maximum SQL queries per request, keyed by URL name (plus a variant after
+# "?" or " ("). Every GET route needs at least one entry; listings must
+# stay constant in the number of rows, so a budget failure usually means a
+# new N+1.
+QUERY_BUDGETS = {
+    "home": 0,
+    "schema": 0,
+    "swagger-ui": 0,
+    "redoc": 0,
+    "admin:login": 0,
+    "api-root": 0,
+    "venue-list": 1,
+    "venue-detail": 1,
+    "event-list": 1,
+    "event-list?expand=venue": 1,
+    "event-list?search": 1,
+    "event-upcoming": 1,
+    "event-detail": 1,
+    "event-agenda": 3,
+    "event-conflicts": 2,
+    "event-availability": 1,
+    "event-availability-stream": 1,
+    "event-schedule-export?fmt=ics": 2,
+    "event-schedule-export?fmt=csv": 2,
+    "track-list?expand=event.venue": 1,
+    "track-detail": 1,
+    "speaker-list": 1,
+    "speaker-detail": 1,
+    "session-list": 1,
+    "session-list?event": 1,
+    "session-list?expand=track.event.venue,speaker": 1,
+    "session-detail": 1,
+    "async-event-list": 1,
+    "async-event-detail": 1,
+    "async-session-list": 1,
+    "async-session-detail": 1,
+    "async-speaker-list": 1,
+    "async-speaker-detail": 1,
+    "registration-list (organizer)": 1,
+    "registration-list (attendee)": 1,
+    "registration-detail": 1,
+    "registration-export?fmt=csv": 2,
+    "registration-export?fmt=jsonl": 2,
+    "waitlist-list": 1,
+    "waitlist-detail": 1,
+    "db-metrics": 0,
+}
+
+# Admin changelists have their own query-count tests (tests/test_admin.py).
+EXEMPT_NAMESPACES = ("admin",)
+
+
+def get_route_names(patterns=None, namespace=None):
+    """URL names of every route that answers GET."""
+    names = set()
+    for pattern in get_resolver().url_patterns if patterns is None else patterns:
+        if isinstance(pattern, URLResolver):
+            inner = ":".join(filter(None, [namespace, pattern.namespace])) or None
+            names |= get_route_names(pattern.url_patterns, inner)
+            continue
+        if pattern.name is None or namespace in EXEMPT_NAMESPACES:
+            continue
+        callback = pattern.callback
+        actions = getattr(callback, "actions", None)
+        view_class = getattr(callback, "view_class", None) or getattr(callback, "cls", None)
+        if actions is not None:
+            answers_get = "get" in actions
+        elif view_class is not None:
+            answers_get = hasattr(view_class, "get")
+        else:
+            # Plain function views here are all read-only.
+            answers_get = True
+        if answers_get:
+            names.add(f"{namespace}:{pattern.name}" if namespace else pattern.name)
+    return names
+
+
+def route_name(budget_key):
+    return budget_key.split("?")[0].split(" (")[0]
+
+
+class EndpointBudgetBenchmark(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seed_dataset(**VOLUMES)
+        cls.organizer = UserFactory(is_organizer=True)
+        cls.attendee = UserFactory()
+        cls.staff = UserFactory(is_staff=True)
+        cls.event = Event.objects.order_by("pk").first()
+        cls.venue = Venue.objects.order_by("pk").first()
+        cls.track = Track.objects.order_by("pk").first()
+        cls.speaker = Speaker.objects.order_by("pk").first()
+        cls.session = Session.objects.order_by("pk").first()
+        cls.registration = Registration.objects.order_by("pk").first()
+        cls.waitlist_entry = WaitlistEntry.objects.create(attendee=cls.attendee, event=cls.event)
+
+    def _client(self, user=None):
+        client = APIClient()
+        if user is not None:
+            token = ClaimsTokenObtainPairSerializer.get_token(user).access_token
+            client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        return client
+
+    def _get(self, client, url):
+        response = client.get(url)
+        if response.streaming:
+            # Exports run their queries while the body is produced.
+            b"".join(response.streaming_content)
+        return response
+
+    async def _async_get(self, url):
+        response = await self.async_client.get(url)
+        if response.streaming:
+            [chunk async for chunk in response.streaming_content]
+        return response
+
+    def _endpoints(self):
+        anon = self._client()
+        organizer = self._client(self.organizer)
+        attendee = self._client(self.attendee)
+        event, session, speaker = self.event.pk, self.session.pk, self.speaker.pk
+        paths = {
+            "home": (anon, reverse("home")),
+            "schema": (anon, reverse("schema")),
+            "swagger-ui": (anon, reverse("swagger-ui")),
+            "redoc": (anon, reverse("redoc")),
+            "admin:login": (anon, reverse("admin:login")),
+            # The registrations router's root is shadowed by registration-list.
+            "api-root": (anon, "/api/v1/events/"),
+            "venue-list": (anon, reverse("venue-list")),
+            "venue-detail": (anon, reverse("venue-detail", args=[self.venue.pk])),
+            "event-list": (anon, reverse("event-list")),
+            "event-list?expand=venue": (anon, reverse("event-list") + "?expand=venue"),
+            "event-list?search": (anon, reverse("event-list") + "?search=the"),
+            "event-upcoming": (anon, reverse("event-upcoming")),
+            "event-detail": (anon, reverse("event-detail", args=[event])),
+            "event-agenda": (anon, reverse("event-agenda", args=[event])),
+            "event-conflicts": (organizer, reverse("event-conflicts", args=[event])),
+            "event-availability": (anon, reverse("event-availability", args=[event])),
+            "event-schedule-export?fmt=ics": (anon, reverse("event-schedule-export", args=[event, "ics"])),
+            "event-schedule-export?fmt=csv": (anon, reverse("event-schedule-export", args=[event, "csv"])),
+            "track-list?expand=event.venue": (anon, reverse("track-list") + "?expand=event.venue"),
+            "track-detail": (anon, reverse("track-detail", args=[self.track.pk])),
+            "speaker-list": (anon, reverse("speaker-list")),
+            "speaker-detail": (anon, reverse("speaker-detail", args=[speaker])),
+            "session-list": (anon, reverse("session-list")),
+            "session-list?event": (anon, reverse("session-list") + f"?event={event}"),
+            "session-list?expand=track.event.venue,speaker": (
+                anon, reverse("session-list") + "?expand=track.event.venue,speaker"
+            ),
+            "session-detail": (anon, reverse("session-detail", args=[session])),
+            "registration-list (organizer)": (organizer, reverse("registration-list")),
+            "registration-list (attendee)": (attendee, reverse("registration-list")),
+            "registration-detail": (organizer, reverse("registration-detail", args=[self.registration.pk])),
+            "registration-export?fmt=csv": (organizer, reverse("registration-export", args=[event, "csv"])),
+            "registration-export?fmt=jsonl": (organizer, reverse("registration-export", args=[event, "jsonl"])),
+            "waitlist-list": (organizer, reverse("waitlist-list")),
+            "waitlist-detail": (attendee, reverse("waitlist-detail", args=[self.waitlist_entry.pk])),
+            "db-metrics": (self._client(self.staff), reverse("db-metrics")),
+        }
+        endpoints = {name: (lambda client=client, url=url: self._get(client, url)) for name, (client, url) in paths.items()}
+
+        async_paths = {
+            "async-event-list": reverse("async-event-list"),
+            "async-event-detail": reverse("async-event-detail", args=[event]),
+            "async-session-list": reverse("async-session-list"),
+            "async-session-detail": reverse("async-session-detail", args=[session]),
+            "async-speaker-list": reverse("async-speaker-list"),
+            "async-speaker-detail": reverse("async-speaker-detail", args=[speaker]),
+            "event-availability-stream": reverse("event-availability-stream", args=[event]),
+        }
+        for name, url in async_paths.items():
+            endpoints[name] = lambda url=url: async_to_sync(self._async_get)(url)
+        return endpoints
+
+    def test_every_get_route_has_a_budget(self):
+        missing = get_route_names() - {route_name(key) for key in QUERY_BUDGETS}
+        self.assertFalse(missing, f"GET routes without a query budget: {sorted(missing)}")
+
+    # The stream closes right after its first message.
+    @override_settings(AVAILABILITY={**settings.AVAILABILITY, "STREAM_TIMEOUT": 0})
+    def test_endpoint_latency_and_query_budgets(self):
+        def clear():
+            for cache in caches.all():
+                cache.clear()
+
+        endpoints = self._endpoints()
+        self.assertEqual(set(endpoints), set(QUERY_BUDGETS))
+        results = {}
+        # Measure the uncached path: the response caches would otherwise hide
+        # the queries after the first iteration, and throttling would cut
+        # the run short.
+        with mock.patch.object(APIView, "get_throttles", return_value=[]), \
+                mock.patch("apps.core.throttling._throttle_response", return_value=None):
+            for name, call in endpoints.items():
+                results[name] = measure(call, before=clear)
+        write_report("endpoint budgets", results)
+
+        for name, result in results.items():
+            with self.subTest(endpoint=name):
+                self.assertEqual(result["status"], 200)
+                self.assertLessEqual(result["queries"], QUERY_BUDGETS[name])
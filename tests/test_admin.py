@@ -0,0 +1,88 @@
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.core.admin import EstimatedCountPaginator
+from apps.events.models import Event, Session, Speaker, Track, Venue
+from apps.registrations.models import Registration
+from apps.users.models import User
+
+
+class AdminChangelistTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser(username="admin", password="pass", email="admin@example.com")
+        self.client.force_login(self.admin)
+        self.venue = Venue.objects.create(name="Hall", capacity=100)
+        self.speaker = Speaker.objects.create(name="Ada")
+        self.events = []
+
+    def add_event(self, index):
+        event = Event.objects.create(
+            title=f"Event {index}", slug=f"event-{index}", venue=self.venue, capacity=10,
+            start_date=f"2025-11-{index + 1:02d}T09:00:00Z", end_date=f"2025-11-{index + 1:02d}T17:00:00Z",
+        )
+        event.refresh_from_db()
+        track = Track.objects.create(event=event, title="Main")
+        Session.objects.create(
+            track=track, speaker=self.speaker, title=f"Talk {index}",
+            start_time=f"2025-11-{index + 1:02d}T10:00:00Z", end_time=f"2025-11-{index + 1:02d}T11:00:00Z",
+        )
+        attendee = User.objects.create_user(username=f"attendee{index}", password="pass")
+        Registration.objects.create(attendee=attendee, event=event)
+        self.events.append(event)
+        return event
+
+    def changelist_queries(self, name, params=None):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse(f"admin:{name}_changelist"), params or {})
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_query_count_does_not_grow_with_rows(self):
+        names = ["events_event", "events_track", "events_session", "registrations_registration", "users_user"]
+        for index in range(2):
+            self.add_event(index)
+        small = {name: self.changelist_queries(name) for name in names}
+        for index in range(2, 8):
+            self.add_event(index)
+        large = {name: self.changelist_queries(name) for name in names}
+        self.assertEqual(small, large)
+
+    def test_registrations_filtered_by_event(self):
+        first, second = self.add_event(0), self.add_event(1)
+        response = self.client.get(reverse("admin:registrations_registration_changelist"), {"event": second.pk})
+        self.assertEqual([r.event_id for r in response.context["cl"].result_list], [second.pk])
+        self.assertEqual(response.context["cl"].result_count, 1)
+
+    def test_full_event_rejected_on_form(self):
+        event = self.add_event(0)
+        Event.objects.filter(pk=event.pk).update(capacity=1)
+        attendee = User.objects.create_user(username="late", password="pass")
+        response = self.client.post(
+            reverse("admin:registrations_registration_add"), {"attendee": attendee.pk, "event": event.pk}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Event is full", response.context["adminform"].form.errors["event"])
+
+
+class EstimatedCountPaginatorTests(TestCase):
+    def setUp(self):
+        venue = Venue.objects.create(name="Hall", capacity=100)
+        Venue.objects.create(name="Annex", capacity=50)
+        self.venues = Venue.objects.order_by("pk")
+        self.filtered = Venue.objects.filter(pk=venue.pk).order_by("pk")
+
+    def test_exact_count_without_estimate(self):
+        self.assertEqual(EstimatedCountPaginator(self.venues, 10).count, 2)
+
+    def test_unfiltered_large_table_uses_estimate(self):
+        with mock.patch("apps.core.admin.estimated_row_count", return_value=2_000_000):
+            self.assertEqual(EstimatedCountPaginator(self.venues, 10).count, 2_000_000)
+            self.assertEqual(EstimatedCountPaginator(self.filtered, 10).count, 1)
+
+    def test_small_estimate_counts_exactly(self):
+        with mock.patch("apps.core.admin.estimated_row_count", return_value=500):
+            self.assertEqual(EstimatedCountPaginator(self.venues, 10).count, 2)
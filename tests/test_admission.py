@@ -0,0 +1,92 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.core.models import Counter
+from apps.events.models import Event, Venue
+from apps.registrations.admission import _reserve, _slot_key
+from apps.registrations.models import Registration
+from apps.users.models import User
+
+ADMISSION = {'ENABLED': True, 'RATE': 1, 'WINDOW': 10, 'MAX_WAIT': 10}
+
+
+@override_settings(REGISTRATION_ADMISSION=ADMISSION)
+class AdmissionControlTests(APITestCase):
+    def setUp(self):
+        venue = Venue.objects.create(name="Hall", capacity=100)
+        self.event = Event.objects.create(
+            title="Launch", slug="launch", venue=venue, capacity=100,
+            start_date="2025-11-01T09:00:00Z", end_date="2025-11-01T17:00:00Z",
+        )
+        self.users = [User.objects.create_user(username=f"u{i}", password="pass") for i in range(3)]
+        self.url = reverse('registration-list')
+
+    def register(self, user, ticket=None):
+        self.client.force_authenticate(user=user)
+        headers = {"HTTP_X_QUEUE_TICKET": ticket} if ticket else {}
+        return self.client.post(self.url, {"event": self.event.id}, format='json', **headers)
+
+    @mock.patch("apps.registrations.admission.time.time")
+    def test_excess_requests_get_tickets_then_are_shed(self, clock):
+        clock.return_value = 1000.0
+        self.assertEqual(self.register(self.users[0]).status_code, status.HTTP_201_CREATED)
+
+        queued = self.register(self.users[1])
+        self.assertEqual(queued.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(queued["Retry-After"], "10")
+        self.assertIn("ticket", queued.data)
+
+        shed = self.register(self.users[2])
+        self.assertEqual(shed.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertNotIn("ticket", shed.data)
+        self.assertEqual(Registration.objects.count(), 1)
+
+        # The ticket is early until its window opens, and bound to its user.
+        self.assertEqual(self.register(self.users[1], queued.data["ticket"]).status_code, 429)
+        clock.return_value = 1010.0
+        self.assertEqual(self.register(self.users[2], queued.data["ticket"]).status_code, 429)
+        self.assertEqual(self.register(self.users[1], queued.data["ticket"]).status_code, 201)
+
+    def test_shed_request_only_touches_admission_counters(self):
+        with mock.patch("apps.registrations.admission.time.time", return_value=1000.0):
+            for user in self.users:
+                self.client.force_authenticate(user=user)
+                self.register(user)
+            with CaptureQueriesContext(connection) as queries:
+                response = self.register(self.users[2])
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        tables = {table for query in queries for table in ("core_counter", "registrations_") if table in query["sql"]}
+        self.assertEqual(tables, {"core_counter"})
+
+    def test_slots_are_shared_database_rows_by_default(self):
+        self.assertEqual(_reserve(self.event.id, 1000.0), 100)
+        self.assertEqual(_reserve(self.event.id, 1000.0), 101)
+        self.assertEqual(
+            Counter.objects.get(key__endswith=_slot_key(self.event.id, 100), key__startswith="admission:").value, 2
+        )
+
+    # Threads cannot share sqlite's in-memory test database; the database
+    # store gets the same guarantee from the row lock its UPDATE takes.
+    @override_settings(
+        REGISTRATION_ADMISSION={**ADMISSION, 'RATE': 5, 'MAX_WAIT': 0},
+        CACHES={**settings.CACHES, "admission": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    )
+    def test_concurrent_reservations_never_exceed_rate(self):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            windows = list(pool.map(lambda _: _reserve(self.event.id, 1000.0), range(40)))
+        self.assertEqual(windows.count(100), 5)
+        self.assertEqual(windows.count(None), 35)
+        # Slots live in their own alias, apart from the throttle and shared caches.
+        key = _slot_key(self.event.id, 100)
+        self.assertIsNotNone(caches[settings.ADMISSION_CACHE_ALIAS].get(key))
+        self.assertIsNone(caches[settings.THROTTLE_CACHE_ALIAS].get(key))
+        self.assertIsNone(caches[settings.SHARED_CACHE_ALIAS].get(key))
@@ -0,0 +1,68 @@
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from apps.core.cache import response_cache, versioned_key
+from apps.events.agenda import agenda_cache_key
+from apps.events.models import Event, Session, Speaker, Track, Venue
+
+
+class AgendaTests(APITestCase):
+    def setUp(self):
+        self.venue = Venue.objects.create(name="Hall", capacity=100)
+        self.event = Event.objects.create(
+            title="PyCon", slug="pycon", venue=self.venue, capacity=100,
+            start_date="2025-11-01T09:00:00Z", end_date="2025-11-01T17:00:00Z",
+        )
+        self.event.refresh_from_db()
+        self.speaker = Speaker.objects.create(name="Ada")
+        for title in ("Main", "Side"):
+            track = Track.objects.create(event=self.event, title=title)
+            for hour in (9, 10, 11):
+                Session.objects.create(
+                    track=track, title=f"{title} {hour}", speaker=self.speaker,
+                    start_time=f"2025-11-01T{hour:02d}:00:00Z", end_time=f"2025-11-01T{hour + 1:02d}:00:00Z",
+                )
+        self.url = reverse("event-agenda", args=[self.event.pk])
+
+    def test_agenda_tree(self):
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        data = response.json()
+        self.assertEqual(data["venue"]["name"], "Hall")
+        self.assertEqual([track["title"] for track in data["tracks"]], ["Main", "Side"])
+        self.assertEqual([s["title"] for s in data["tracks"][0]["sessions"]], ["Main 9", "Main 10", "Main 11"])
+        self.assertEqual(data["tracks"][0]["sessions"][0]["speaker"]["name"], "Ada")
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response["X-Cache"], "HIT")
+
+    def test_changes_rebuild_agenda(self):
+        self.client.get(self.url)
+        self.speaker.name = "Ada Lovelace"
+        self.speaker.save()
+        data = self.client.get(self.url).json()
+        self.assertEqual(data["tracks"][0]["sessions"][0]["speaker"]["name"], "Ada Lovelace")
+
+        session = Session.objects.get(title="Main 9")
+        session.title = "Opening"
+        session.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json()["tracks"][0]["sessions"][0]["title"], "Opening")
+
+    def test_reader_racing_a_write_cannot_cache_stale_agenda(self):
+        # A reader picks its key before the write and stores old rows after it.
+        stale_key, _ = versioned_key(agenda_cache_key(self.event.pk))
+        session = Session.objects.get(title="Main 9")
+        session.title = "Opening"
+        session.save()
+        response_cache().set(stale_key, b'{"stale": true}')
+
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json()["tracks"][0]["sessions"][0]["title"], "Opening")
+
+    def test_unknown_event_is_404(self):
+        self.assertEqual(self.client.get(reverse("event-agenda", args=[self.event.pk + 1])).status_code, 404)
@@ -0,0 +1,84 @@
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from apps.events.models import Event, Session, Speaker, Track, Venue
+from apps.users.models import User
+
+
+class AgendaImportTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='organizer', password='pass', is_organizer=True)
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+
+        venue = Venue.objects.create(name="Hall", capacity=100)
+        self.event = Event.objects.create(
+            title="PyCon",
+            slug="pycon",
+            venue=venue,
+            capacity=100,
+            start_date="2025-11-01T09:00:00Z",
+            end_date="2025-11-01T17:00:00Z"
+        )
+        self.event.refresh_from_db()
+        self.track = Track.objects.create(event=self.event, title="Main")
+        self.speaker = Speaker.objects.create(name="Ada")
+        Session.objects.create(
+            track=self.track, title="Keynote",
+            start_time="2025-11-01T09:00:00Z", end_time="2025-11-01T10:00:00Z"
+        )
+        self.url = reverse('event-import-sessions', args=[self.event.pk])
+
+    def test_import_json_rows(self):
+        rows = [
+            {"title": "Talk A", "track_id": self.track.pk, "speaker_id": self.speaker.pk,
+             "start_time": "2025-11-01T10:00:00Z", "end_time": "2025-11-01T11:00:00Z"},
+            {"title": "Talk B", "track": "Main",
+             "start_time": "2025-11-01T11:00:00Z", "end_time": "2025-11-01T12:00:00Z"},
+        ]
+        response = self.client.post(self.url, rows, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], 2)
+        self.assertEqual(Session.objects.count(), 3)
+
+    def test_import_csv_upload(self):
+        content = (
+            "title,track,speaker_id,start_time,end_time,room\n"
+            "Talk A,Main,,2025-11-01T10:00:00Z,2025-11-01T11:00:00Z,R1\n"
+        ).encode()
+        upload = SimpleUploadedFile("agenda.csv", content, content_type="text/csv")
+        response = self.client.post(self.url, {"file": upload}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Session.objects.get(title="Talk A").room, "R1")
+
+    def test_import_rejects_non_utf8_csv(self):
+        content = "title,track,start_time,end_time\nCaf\u00e9,Main,2025-11-01T10:00:00Z,2025-11-01T11:00:00Z\n".encode("latin-1")
+        upload = SimpleUploadedFile("agenda.csv", content, content_type="text/csv")
+        response = self.client.post(self.url, {"file": upload}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Session.objects.count(), 1)
+
+    def test_unknown_track_title_reported_under_track(self):
+        rows = [{"title": "Talk", "track": "Nope",
+                 "start_time": "2025-11-01T10:00:00Z", "end_time": "2025-11-01T11:00:00Z"}]
+        response = self.client.post(self.url, rows, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["errors"][0]["errors"], [{"track": "Track does not belong to this event"}])
+
+    def test_import_reports_row_errors_and_creates_nothing(self):
+        rows = [
+            {"title": "Overlaps keynote", "track_id": self.track.pk,
+             "start_time": "2025-11-01T09:30:00Z", "end_time": "2025-11-01T10:30:00Z"},
+            {"title": "Fine", "track_id": self.track.pk,
+             "start_time": "2025-11-01T13:00:00Z", "end_time": "2025-11-01T14:00:00Z"},
+            {"title": "Overlaps fine", "track_id": self.track.pk,
+             "start_time": "2025-11-01T13:30:00Z", "end_time": "2025-11-01T14:30:00Z"},
+            {"title": "Outside event", "track_id": self.track.pk,
+             "start_time": "2025-11-01T16:30:00Z", "end_time": "2025-11-01T18:00:00Z"},
+        ]
+        response = self.client.post(self.url, rows, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([error["row"] for error in response.data["errors"]], [1, 2, 3, 4])
+        self.assertEqual(Session.objects.count(), 1)
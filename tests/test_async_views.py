@@ -0,0 +1,55 @@
+from datetime import timedelta
+from unittest import mock
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from apps.core.throttling import AnonRateThrottle
+from apps.events.models import Event, Session, Speaker, Track, Venue
+
+
+class AsyncReadPathTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        venue = Venue.objects.create(name="Hall", capacity=100)
+        start = timezone.now()
+        cls.event = Event.objects.create(
+            title="Event", slug="event", venue=venue, capacity=10,
+            start_date=start, end_date=start + timedelta(days=1),
+        )
+        track = Track.objects.create(event=cls.event, title="Main")
+        speaker = Speaker.objects.create(name="Ada")
+        for i in range(5):
+            Session.objects.create(
+                track=track, speaker=speaker, title=f"Talk {i}",
+                start_time=start + timedelta(hours=i), end_time=start + timedelta(hours=i, minutes=45),
+            )
+
+    async def test_async_list_matches_sync_list(self):
+        sync_response = await self.async_client.get(reverse("session-list"), {"expand": "track,speaker"})
+        results = []
+        url = reverse("async-session-list") + "?expand=track,speaker&page_size=2"
+        while url:
+            response = await self.async_client.get(url)
+            self.assertEqual(response.status_code, 200)
+            payload = response.json()
+            self.assertLessEqual(len(payload["results"]), 2)
+            results.extend(payload["results"])
+            url = payload["next"]
+        self.assertEqual(results, sync_response.json()["results"])
+
+    async def test_async_detail(self):
+        response = await self.async_client.get(reverse("async-event-detail", args=[self.event.pk]))
+        self.assertEqual(response.json()["title"], "Event")
+        self.assertIn('desc="1 queries"', response["Server-Timing"])
+
+        response = await self.async_client.get(reverse("async-event-detail", args=[self.event.pk + 1000]))
+        self.assertEqual(response.status_code, 404)
+
+    async def test_async_views_are_throttled(self):
+        url = reverse("async-event-detail", args=[self.event.pk])
+        with mock.patch.object(AnonRateThrottle, "THROTTLE_RATES", {"anon": "2/min"}):
+            statuses = [(await self.async_client.get(url)).status_code for _ in range(3)]
+            response = await self.async_client.get(reverse("async-speaker-list"))
+        self.assertEqual(statuses, [200, 200, 429])
+        self.assertEqual(response.status_code, 429)
+        self.assertIn("Retry-After", response)
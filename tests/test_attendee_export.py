@@ -0,0 +1,58 @@
+import csv
+import io
+import json
+
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from apps.events.models import Event, Venue
+from apps.registrations.models import Registration
+from apps.users.models import User
+
+
+class AttendeeExportTests(APITestCase):
+    def setUp(self):
+        venue = Venue.objects.create(name="Hall", capacity=100)
+        self.event = Event.objects.create(
+            title="PyCon", slug="pycon", venue=venue, capacity=100,
+            start_date="2025-11-01T09:00:00Z", end_date="2025-11-01T17:00:00Z",
+        )
+        self.organizer = User.objects.create_user(username="organizer", password="pass", is_organizer=True)
+        self.registrations = [
+            Registration.objects.create(
+                attendee=User.objects.create_user(username=f"u{i}", email=f"u{i}@example.com", password="pass"),
+                event=self.event,
+            )
+            for i in range(3)
+        ]
+
+    def export(self, fmt, **params):
+        url = reverse("registration-export", kwargs={"event_id": self.event.pk, "fmt": fmt})
+        return self.client.get(url, params)
+
+    def test_csv_joins_attendee_fields(self):
+        self.client.force_authenticate(self.organizer)
+        response = self.export("csv")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        rows = list(csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode())))
+        self.assertEqual([row["username"] for row in rows], ["u0", "u1", "u2"])
+        self.assertEqual(rows[0]["email"], "u0@example.com")
+
+    def test_jsonl_incremental_range(self):
+        self.client.force_authenticate(self.organizer)
+        first = self.registrations[1].created_at.isoformat()
+        last = self.registrations[2].created_at.isoformat()
+        response = self.export("jsonl", since=first, until=last)
+        self.assertEqual(response.status_code, 200)
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        self.assertEqual([row["registration_id"] for row in rows], [self.registrations[1].pk])
+        self.assertEqual(rows[0]["registered_at"], first)
+
+    def test_invalid_range_is_rejected(self):
+        self.client.force_authenticate(self.organizer)
+        self.assertEqual(self.export("csv", since="yesterday").status_code, 400)
+
+    def test_requires_organizer(self):
+        self.client.force_authenticate(self.registrations[0].attendee)
+        self.assertEqual(self.export("csv").status_code, 403)
@@ -0,0 +1,120 @@
+import asyncio
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from apps.core.throttling import AnonRateThrottle
+from apps.events.availability import broadcaster
+from apps.events.models import Event, Venue
+from apps.registrations.models import Registration
+from apps.users.models import User
+
+STREAM_SETTINGS = {
+    "CACHE_TIMEOUT": 30, "MAX_AGE": 2, "POLL_INTERVAL": 0.01, "KEEPALIVE": 0.05, "STREAM_TIMEOUT": 0.5,
+}
+
+
+def make_event(capacity=3):
+    venue = Venue.objects.create(name="Hall", capacity=100)
+    return Event.objects.create(
+        title="PyCon", slug="pycon", venue=venue, capacity=capacity,
+        start_date="2025-11-01T09:00:00Z", end_date="2025-11-01T17:00:00Z",
+    )
+
+
+class AvailabilityEndpointTests(APITestCase):
+    def setUp(self):
+        self.event = make_event()
+        self.url = reverse("event-availability", args=[self.event.pk])
+
+    def test_served_from_cache(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(
+            response.json(), {"event": self.event.pk, "capacity": 3, "seats_taken": 0, "seats_remaining": 3}
+        )
+        self.assertIn("max-age=2", response["Cache-Control"])
+        self.assertIn("public", response["Cache-Control"])
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response["X-Cache"], "HIT")
+
+    def test_seat_changes_refresh_counter(self):
+        self.client.get(self.url)
+        user = User.objects.create_user(username="attendee", password="pass")
+        registration = Registration.objects.create(attendee=user, event=self.event)
+        self.assertEqual(self.client.get(self.url).json()["seats_remaining"], 2)
+
+        registration.delete()
+        self.assertEqual(self.client.get(self.url).json()["seats_remaining"], 3)
+
+        event = Event.objects.get(pk=self.event.pk)
+        event.capacity = 5
+        event.save()
+        self.assertEqual(self.client.get(self.url).json()["seats_remaining"], 5)
+
+    def test_conditional_get(self):
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        Event.claim_seat(self.event.pk)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_unknown_event(self):
+        self.assertEqual(self.client.get(reverse("event-availability", args=[self.event.pk + 100])).status_code, 404)
+
+    def test_throttled_like_the_api(self):
+        with mock.patch.object(AnonRateThrottle, "THROTTLE_RATES", {"anon": "2/min"}):
+            statuses = [self.client.get(self.url).status_code for _ in range(3)]
+        self.assertEqual(statuses, [200, 200, 429])
+
+
+@override_settings(AVAILABILITY=STREAM_SETTINGS)
+class AvailabilityStreamTests(TestCase):
+    def setUp(self):
+        self.event = make_event()
+        self.url = reverse("event-availability-stream", args=[self.event.pk])
+
+    def test_requires_asgi(self):
+        self.assertEqual(self.client.get(self.url).status_code, 501)
+
+    async def test_pushes_changes(self):
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+
+        events = []
+        async for chunk in response.streaming_content:
+            chunk = chunk.decode()
+            if chunk.startswith("event: availability"):
+                events.append(chunk)
+                if len(events) == 1:
+                    await sync_to_async(Event.claim_seat)(self.event.pk)
+        # The stream ends on its own after STREAM_TIMEOUT.
+        self.assertEqual(len(events), 2)
+        self.assertIn('"seats_remaining": 3', events[0])
+        self.assertIn('"seats_remaining": 2', events[1])
+        self.assertNotIn(self.event.pk, broadcaster._pollers)
+
+    async def test_unknown_event(self):
+        response = await self.async_client.get(reverse("event-availability-stream", args=[self.event.pk + 100]))
+        self.assertEqual(response.status_code, 404)
+
+    async def test_one_poller_per_event(self):
+        first = broadcaster.subscribe(self.event.pk)
+        second = broadcaster.subscribe(self.event.pk)
+        try:
+            self.assertEqual(len(broadcaster._pollers), 1)
+            data = await asyncio.wait_for(first.get(), 1)
+            self.assertEqual(await asyncio.wait_for(second.get(), 1), data)
+        finally:
+            broadcaster.unsubscribe(self.event.pk, first)
+            broadcaster.unsubscribe(self.event.pk, second)
+        self.assertEqual(broadcaster._pollers, {})
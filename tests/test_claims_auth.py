@@ -0,0 +1,70 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.test import APIRequestFactory
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from apps.users.authentication import ClaimsJWTAuthentication
+from apps.users.models import User
+
+
+class ClaimsAuthenticationTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='organizer', password='password123', is_organizer=True)
+
+    def obtain(self):
+        response = self.client.post(
+            reverse('token_obtain_pair'), {"username": "organizer", "password": "password123"}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def user_queries(self, token):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse('registration-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [q["sql"] for q in ctx.captured_queries if '"users_user"' in q["sql"]]
+
+    def test_tokens_carry_role_claims(self):
+        access = AccessToken(self.obtain()["access"])
+        self.assertIs(access["is_organizer"], True)
+        self.assertIs(access["is_speaker"], False)
+
+    def test_admin_flags_survive_token_authentication(self):
+        """IsAdminUser reads is_staff from the token user; it must not default to False."""
+        admin = User.objects.create_user(username='admin', password='password123', is_staff=True, is_superuser=True)
+        for user, expected in ((admin, True), (self.user, False)):
+            response = self.client.post(
+                reverse('token_obtain_pair'), {"username": user.username, "password": "password123"}, format='json'
+            )
+            request = APIRequestFactory().get('/', HTTP_AUTHORIZATION=f'Bearer {response.data["access"]}')
+            token_user, _ = ClaimsJWTAuthentication().authenticate(request)
+            request.user = token_user
+            with self.subTest(user=user.username):
+                self.assertIs(token_user.is_staff, expected)
+                self.assertIs(token_user.is_superuser, expected)
+                self.assertIs(IsAdminUser().has_permission(request, None), expected)
+
+    def test_claims_token_skips_user_lookup(self):
+        self.assertEqual(self.user_queries(self.obtain()["access"]), [])
+
+    def test_claims_authorize_organizer_writes(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.obtain()["access"]}')
+        response = self.client.post(reverse('venue-list'), {"name": "Hall", "capacity": 10}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_legacy_token_uses_cached_user(self):
+        token = str(RefreshToken.for_user(self.user).access_token)
+        self.assertEqual(len(self.user_queries(token)), 1)
+        self.assertEqual(self.user_queries(token), [])
+
+    def test_refresh_picks_up_role_changes(self):
+        refresh = self.obtain()["refresh"]
+        self.user.is_organizer = False
+        self.user.save()
+        response = self.client.post(reverse('token_refresh'), {"refresh": refresh}, format='json')
+        self.assertIs(AccessToken(response.data["access"])["is_organizer"], False)
@@ -0,0 +1,59 @@
+from unittest import mock
+
+from django.core.cache import caches
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from apps.core.compiled import compile_serializer
+from apps.registrations.testing import seed_dataset
+from apps.events.models import Session
+from apps.events.serializers import EventSerializer, SessionSerializer
+from apps.events.views import EventViewSet, SessionViewSet
+
+
+class CompiledListTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seed_dataset(events=3, sessions=30, registrations=10, speakers=4, venues=2)
+        # Some sessions without a speaker exercise null nested relations.
+        Session.objects.filter(pk__in=Session.objects.values("pk")[:5]).update(speaker=None)
+
+    def _get(self, url):
+        for cache in caches.all():
+            cache.clear()
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, url)
+        return response.content
+
+    def test_output_is_byte_identical(self):
+        urls = [
+            reverse("event-list"),
+            reverse("event-list") + "?expand=venue",
+            reverse("event-list") + "?fields=id,title,start_date",
+            reverse("event-list") + "?ordering=title&page_size=2",
+            reverse("session-list"),
+            reverse("session-list") + "?expand=track.event.venue,speaker",
+            reverse("session-list") + "?expand=speaker&fields=id,speaker,start_time",
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                compiled = self._get(url)
+                with mock.patch.object(EventViewSet, "compiled_list", False), \
+                        mock.patch.object(SessionViewSet, "compiled_list", False):
+                    regular = self._get(url)
+                self.assertEqual(compiled, regular)
+
+    def test_catalog_serializers_compile(self):
+        compiled = compile_serializer(SessionSerializer(expand={"track": {"event": {"venue": {}}}, "speaker": {}}))
+        self.assertIn("track__event__venue__name", compiled.columns)
+        self.assertNotIn("track_id", compiled.columns)
+        self.assertIsNotNone(compile_serializer(EventSerializer()))
+
+    def test_cursor_pages_follow_on(self):
+        url = reverse("session-list") + "?page_size=7"
+        seen = []
+        while url:
+            response = self.client.get(url)
+            seen.extend(row["id"] for row in response.data["results"])
+            url = response.data["next"]
+        self.assertEqual(sorted(seen), list(Session.objects.order_by("id").values_list("id", flat=True)))
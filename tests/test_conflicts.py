@@ -0,0 +1,126 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.exceptions import ValidationError
+from django.core.management import CommandError, call_command
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from apps.events import conflicts
+from apps.events.models import Event, Session, Speaker, Track, Venue
+from apps.users.models import User
+
+
+class ConflictDetectionTests(APITestCase):
+    def setUp(self):
+        venue = Venue.objects.create(name="Hall", capacity=100)
+        self.event = Event.objects.create(
+            title="PyCon", slug="pycon", venue=venue, capacity=100,
+            start_date="2025-11-01T09:00:00Z", end_date="2025-11-01T17:00:00Z",
+        )
+        self.event.refresh_from_db()
+        self.main = Track.objects.create(event=self.event, title="Main")
+        self.side = Track.objects.create(event=self.event, title="Side")
+        self.speaker = Speaker.objects.create(name="Ada")
+        self.keynote = Session.objects.create(
+            track=self.main, title="Keynote", speaker=self.speaker, room="Hall A",
+            start_time="2025-11-01T09:00:00Z", end_time="2025-11-01T10:00:00Z",
+        )
+        self.talk = Session.objects.create(
+            track=self.side, title="Talk", speaker=self.speaker, room="Room 2",
+            start_time="2025-11-01T09:30:00Z", end_time="2025-11-01T10:30:00Z",
+        )
+        self.workshop = Session.objects.create(
+            track=self.side, title="Workshop", room=" hall a ",
+            start_time="2025-11-01T10:30:00Z", end_time="2025-11-01T11:00:00Z",
+        )
+        self.organizer = User.objects.create_user(username="organizer", password="pass", is_organizer=True)
+
+    def test_endpoint_reports_speaker_and_room_conflicts(self):
+        Session.objects.create(
+            track=self.side, title="Clash", room="HALL A",
+            start_time="2025-11-01T11:00:00Z", end_time="2025-11-01T12:00:00Z",
+        )
+        Session.objects.create(
+            track=self.main, title="Late", room="Hall A",
+            start_time="2025-11-01T11:30:00Z", end_time="2025-11-01T12:30:00Z",
+        )
+        self.client.force_authenticate(self.organizer)
+        response = self.client.get(reverse("event-conflicts", args=[self.event.pk]))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [c["sessions"] for c in response.data["speaker_conflicts"]], [[self.keynote.pk, self.talk.pk]]
+        )
+        self.assertEqual(len(response.data["room_conflicts"]), 1)
+        self.assertEqual(response.data["room_conflicts"][0]["room"], "hall a")
+
+    def test_endpoint_requires_organizer(self):
+        self.assertEqual(self.client.get(reverse("event-conflicts", args=[self.event.pk])).status_code, 401)
+
+    def test_command_reports_and_fails(self):
+        out = StringIO()
+        call_command("check_conflicts", str(self.event.pk), stdout=out)
+        self.assertIn("speaker", out.getvalue())
+        self.assertIn("1 conflict(s) found", out.getvalue())
+        with self.assertRaises(CommandError):
+            call_command("check_conflicts", "--fail", stdout=StringIO())
+
+    @override_settings(SCHEDULE_STRICT_CONFLICTS=True)
+    def test_strict_mode_matches_rooms_with_odd_whitespace(self):
+        Session.objects.filter(pk=self.talk.pk).update(room="  Room   2 ")
+        self.talk.refresh_from_db()
+        self.assertEqual(self.talk.room, "Room 2")
+        bulk = Session.objects.bulk_create([Session(
+            track=self.main, title="Bulk", room=" Hall  B ",
+            start_time="2025-11-01T12:00:00Z", end_time="2025-11-01T13:00:00Z",
+        )])[0]
+        self.assertEqual(Session.objects.get(pk=bulk.pk).room, "Hall B")
+
+        extra = Track.objects.create(event=self.event, title="Extra")
+        for room in (" Hall A ", "hall  a", "ROOM\t2"):
+            with self.subTest(room=room), self.assertRaisesMessage(ValidationError, "Room is already booked"):
+                Session.objects.create(
+                    track=extra, title="Double", room=room,
+                    start_time="2025-11-01T09:45:00Z", end_time="2025-11-01T10:00:00Z",
+                )
+
+    @override_settings(SCHEDULE_STRICT_CONFLICTS=True)
+    def test_strict_mode_rejects_double_booking(self):
+        with self.assertRaises(ValidationError):
+            Session.objects.create(
+                track=self.main, title="Double", room="room 2",
+                start_time="2025-11-01T10:00:00Z", end_time="2025-11-01T11:00:00Z",
+            )
+
+        self.client.force_authenticate(self.organizer)
+        response = self.client.post(reverse("session-list"), {
+            "title": "Double", "track_id": self.main.pk, "speaker_id": self.speaker.pk,
+            "start_time": "2025-11-01T10:00:00Z", "end_time": "2025-11-01T10:15:00Z",
+        }, format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Speaker is already presenting", str(response.data))
+
+        response = self.client.post(reverse("event-import-sessions", args=[self.event.pk]), [{
+            "title": "Imported", "track_id": self.main.pk, "room": "Room 2",
+            "start_time": "2025-11-01T10:00:00Z", "end_time": "2025-11-01T10:15:00Z",
+        }], format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("in the same room", str(response.data))
+
+    @override_settings(SCHEDULE_STRICT_CONFLICTS=True)
+    def test_strict_mode_checks_api_writes_once(self):
+        self.client.force_authenticate(self.organizer)
+        with mock.patch("apps.events.serializers.session_conflict_errors", wraps=conflicts.session_conflict_errors) as api, \
+                mock.patch("apps.events.conflicts.session_conflict_errors", wraps=conflicts.session_conflict_errors) as model:
+            response = self.client.post(reverse("session-list"), {
+                "title": "Closing", "track_id": self.main.pk, "speaker_id": self.speaker.pk,
+                "start_time": "2025-11-01T16:00:00Z", "end_time": "2025-11-01T17:00:00Z",
+            }, format="json")
+            self.assertEqual(response.status_code, 201)
+            response = self.client.patch(
+                reverse("session-detail", args=[response.data["id"]]), {"room": "Hall B"}, format="json"
+            )
+            self.assertEqual(response.status_code, 200)
+        self.assertEqual(api.call_count, 2)
+        self.assertEqual(model.call_count, 0)
@@ -0,0 +1,45 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from apps.core.cache import counter_cache
+from apps.core.cache_backends import DatabaseCounterCache
+from apps.core.models import Counter
+
+
+class DatabaseCounterCacheTests(TestCase):
+    def setUp(self):
+        self.cache = DatabaseCounterCache("counters", {})
+
+    def test_add_and_incr(self):
+        self.assertTrue(self.cache.add("k", 0, 10))
+        self.assertFalse(self.cache.add("k", 5, 10))
+        self.assertEqual(self.cache.incr("k"), 1)
+        self.assertEqual(self.cache.incr("k", 4), 5)
+        self.assertEqual(self.cache.decr("k"), 4)
+        self.assertEqual(self.cache.get("k"), 4)
+        with self.assertRaises(ValueError):
+            self.cache.incr("missing")
+
+    @mock.patch("apps.core.cache_backends.time.time")
+    def test_expired_keys_are_missing_and_reusable(self, clock):
+        clock.return_value = 1000.0
+        self.cache.add("k", 3, 10)
+        clock.return_value = 1010.0
+        self.assertIsNone(self.cache.get("k"))
+        with self.assertRaises(ValueError):
+            self.cache.incr("k")
+        self.assertTrue(self.cache.add("k", 0, 10))
+        self.assertEqual(self.cache.incr("k"), 1)
+
+    def test_locations_share_the_table_but_not_keys(self):
+        other = DatabaseCounterCache("other", {})
+        self.cache.set("k", 1, None)
+        other.set("k", 2, None)
+        self.cache.clear()
+        self.assertIsNone(self.cache.get("k"))
+        self.assertEqual(other.get("k"), 2)
+        self.assertEqual(Counter.objects.count(), 1)
+
+    def test_accepted_as_counter_cache(self):
+        self.assertIsInstance(counter_cache("admission"), DatabaseCounterCache)
@@ -0,0 +1,107 @@
+import os
+import tempfile
+from unittest import mock
+
+from django.db import connections
+from django.db.backends.sqlite3 import base as sqlite_base
+from django.db.utils import OperationalError
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from apps.core.db_metrics import InstrumentedConnectionMixin, metrics
+from apps.users.models import User
+
+
+class InstrumentedSQLiteWrapper(InstrumentedConnectionMixin, sqlite_base.DatabaseWrapper):
+    pass
+
+
+class InstrumentedConnectionTests(TestCase):
+    def setUp(self):
+        metrics.reset()
+        self.addCleanup(metrics.reset)
+
+    def wrapper(self, name=None):
+        if name is None:
+            # In-memory SQLite connections ignore close(); use a file.
+            directory = tempfile.TemporaryDirectory()
+            self.addCleanup(directory.cleanup)
+            name = os.path.join(directory.name, "db.sqlite3")
+        settings_dict = {**connections["default"].settings_dict, "NAME": name, "CONN_HEALTH_CHECKS": True}
+        wrapper = InstrumentedSQLiteWrapper(settings_dict, alias="metrics")
+        self.addCleanup(wrapper.close)
+        return wrapper
+
+    def test_checkout_is_counted_and_timed(self):
+        wrapper = self.wrapper()
+        wrapper.ensure_connection()
+        wrapper.ensure_connection()  # already open: no new checkout
+
+        stats = metrics.snapshot()["metrics"]
+        self.assertEqual(stats["checkouts"], 1)
+        self.assertEqual(stats["checkout_failures"], 0)
+        self.assertGreaterEqual(stats["wait_ms_max"], 0)
+
+    def test_failed_checkout_is_counted(self):
+        wrapper = self.wrapper("/nonexistent/directory/db.sqlite3")
+        with self.assertRaises(OperationalError):
+            wrapper.ensure_connection()
+
+        stats = metrics.snapshot()["metrics"]
+        self.assertEqual(stats["checkouts"], 0)
+        self.assertEqual(stats["checkout_failures"], 1)
+
+    def test_failed_health_check_is_counted(self):
+        wrapper = self.wrapper()
+        wrapper.ensure_connection()
+        wrapper.health_check_done = False
+
+        with mock.patch.object(wrapper, "is_usable", return_value=False):
+            wrapper.close_if_health_check_failed()
+
+        self.assertIsNone(wrapper.connection)
+        self.assertEqual(metrics.snapshot()["metrics"]["health_check_failures"], 1)
+
+    def test_healthy_connection_is_kept(self):
+        wrapper = self.wrapper()
+        wrapper.ensure_connection()
+        wrapper.health_check_done = False
+
+        wrapper.close_if_health_check_failed()
+
+        self.assertIsNotNone(wrapper.connection)
+        self.assertEqual(metrics.snapshot()["metrics"]["health_check_failures"], 0)
+
+
+class DatabaseMetricsEndpointTests(APITestCase):
+    def setUp(self):
+        self.url = reverse("db-metrics")
+        User.objects.create_user(username="attendee", password="pass")
+        User.objects.create_user(username="ops", password="pass", is_staff=True)
+
+    def login(self, username):
+        # A real token: the claims, not a force-authenticated User, decide is_staff.
+        response = self.client.post(reverse("token_obtain_pair"), {"username": username, "password": "pass"}, format="json")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+
+    def test_requires_staff(self):
+        self.login("attendee")
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+    def test_reports_every_alias(self):
+        metrics.record_checkout("default", 0.004)
+        metrics.record_checkout("default", 0.002, failed=True)
+        self.addCleanup(metrics.reset)
+        self.login("ops")
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("pid", response.data)
+        default = response.data["databases"]["default"]
+        self.assertEqual(default["checkouts"], 1)
+        self.assertEqual(default["checkout_failures"], 1)
+        self.assertEqual(default["wait_ms_avg"], 3.0)
+        self.assertIsNone(default["pool"])
+        self.assertEqual(default["mode"], "per-request")
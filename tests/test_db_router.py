@@ -0,0 +1,108 @@
+from django.contrib.auth.models import AnonymousUser
+from django.db import connections
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils.functional import SimpleLazyObject
+
+from apps.core.db_router import PrimaryReplicaRouter, ReplicaRoutingMiddleware
+from apps.events.models import Event, Venue
+from apps.users.models import User
+from conftest import TEST_REPLICA
+
+
+@override_settings(DATABASE_REPLICAS=["replica_1"], READ_YOUR_WRITES_SECONDS=5)
+class ReplicaRouterTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.router = PrimaryReplicaRouter()
+        self.user = User(pk=7, username="attendee")
+
+    def run_request(self, method, user=None, status=200, write=False):
+        """Return the alias reads were routed to while the request ran."""
+        seen = {}
+
+        def view(request):
+            # DRF authenticates inside the view and sets request.user.
+            request.user = user if user is not None else AnonymousUser()
+            if write:
+                self.router.db_for_write(Event)
+            seen["read"] = self.router.db_for_read(Event)
+            return HttpResponse(status=status)
+
+        request = getattr(self.factory, method)("/api/v1/events/")
+        request.user = SimpleLazyObject(lambda: AnonymousUser())
+        ReplicaRoutingMiddleware(view)(request)
+        return seen["read"] or "default"
+
+    def test_safe_reads_use_replica(self):
+        self.assertEqual(self.run_request("get"), "replica_1")
+        self.assertEqual(self.run_request("get", user=self.user), "replica_1")
+
+    def test_writes_and_unsafe_requests_use_primary(self):
+        self.assertEqual(self.run_request("post", user=self.user), "default")
+        self.assertEqual(self.router.db_for_write(Event), "default")
+        self.assertEqual(self.run_request("get", write=True), "default")
+
+    def test_reads_before_authentication_use_primary(self):
+        request = self.factory.get("/")
+        request.user = SimpleLazyObject(lambda: AnonymousUser())
+        seen = []
+        ReplicaRoutingMiddleware(lambda r: seen.append(self.router.db_for_read(Event)) or HttpResponse())(request)
+        self.assertEqual(seen, [None])
+
+    def test_user_sticks_to_primary_after_write(self):
+        other = User(pk=8, username="other")
+        self.run_request("post", user=self.user, status=400)
+        self.assertEqual(self.run_request("get", user=self.user), "replica_1")
+
+        self.run_request("post", user=self.user, status=201)
+        self.assertEqual(self.run_request("get", user=self.user), "default")
+        self.assertEqual(self.run_request("get", user=other), "replica_1")
+
+    @override_settings(DATABASE_REPLICAS=["replica_1", "replica_2", "replica_3"])
+    def test_one_replica_per_request(self):
+        seen = set()
+
+        def view(request):
+            request.user = AnonymousUser()
+            seen.update(self.router.db_for_read(Event) for _ in range(20))
+            return HttpResponse()
+
+        request = self.factory.get("/api/v1/events/")
+        ReplicaRoutingMiddleware(view)(request)
+        self.assertEqual(len(seen), 1)
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_no_replicas_configured(self):
+        self.assertEqual(self.run_request("get"), "default")
+
+
+@override_settings(DATABASE_REPLICAS=[TEST_REPLICA], READ_YOUR_WRITES_SECONDS=5)
+class ReplicaCacheFillTests(TransactionTestCase):
+    """Real connections: TEST_REPLICA mirrors the test database."""
+    databases = {"default", TEST_REPLICA}
+
+    def get(self, url):
+        """Return (response, queries on the primary, queries on the replica)."""
+        with CaptureQueriesContext(connections["default"]) as primary, \
+                CaptureQueriesContext(connections[TEST_REPLICA]) as replica:
+            response = self.client.get(url)
+        return response, len(primary), len(replica)
+
+    def test_cache_fill_after_recent_write_reads_primary(self):
+        Venue.objects.create(name="Hall", capacity=100)
+        response, primary, replica = self.get(reverse("venue-list"))
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json()["results"][0]["name"], "Hall")
+        self.assertGreater(primary, 0)
+        self.assertEqual(replica, 0)
+
+    def test_cache_fill_reads_replica_once_writes_settle(self):
+        Venue.objects.create(name="Hall", capacity=100)
+        with override_settings(READ_YOUR_WRITES_SECONDS=0):
+            response, primary, replica = self.get(reverse("venue-list"))
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(primary, 0)
+        self.assertGreater(replica, 0)
@@ -50,4 +50,53 @@ class EventAPITests(APITestCase):
         )
         response = self.client.get(self.event_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
\ No newline at end of file
+        self.assertEqual(len(response.data["results"]), 1)
+
+    def test_event_list_is_cursor_paginated(self):
+        """Ensure the event list walks pages by cursor without duplicates."""
+        for i in range(5):
+            Event.objects.create(
+                title=f"Event {i}",
+                slug=f"event-{i}",
+                venue=self.venue,
+                capacity=100,
+                start_date=f"2025-10-0{i + 1}T09:00:00Z",
+                end_date=f"2025-10-0{i + 1}T17:00:00Z"
+            )
+        seen = []
+        url = f"{self.event_url}?page_size=2"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn("count", response.data)
+            self.assertLessEqual(len(response.data["results"]), 2)
+            seen.extend(item["id"] for item in response.data["results"])
+            url = response.data["next"]
+        expected = list(Event.objects.order_by("-start_date", "id").values_list("id", flat=True))
+        self.assertEqual(seen, expected)
+
+    def test_search_events(self):
+        """Ensure ?search= matches on title and description."""
+        Event.objects.create(
+            title="Django Summit",
+            slug="django-summit",
+            description="Deep dive into the ORM",
+            venue=self.venue,
+            capacity=100,
+            start_date="2025-10-01T09:00:00Z",
+            end_date="2025-10-01T17:00:00Z"
+        )
+        Event.objects.create(
+            title="Frontend Days",
+            slug="frontend-days",
+            venue=self.venue,
+            capacity=100,
+            start_date="2025-10-02T09:00:00Z",
+            end_date="2025-10-02T17:00:00Z"
+        )
+        response = self.client.get(self.event_url, {"search": "djang"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([e["slug"] for e in response.data["results"]], ["django-summit"])
+
+        response = self.client.get(self.event_url, {"search": "orm"})
+        self.assertEqual([e["slug"] for e in response.data["results"]], ["django-summit"])
@@ -0,0 +1,90 @@
+from datetime import timedelta
+
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from apps.events.models import Event, Venue
+
+
+class EventFilterTests(APITestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        self.hall = Venue.objects.create(name="Hall", capacity=100)
+        self.annex = Venue.objects.create(name="Annex", capacity=100)
+        self.past = self.make_event("past", self.hall, -10, -9)
+        self.ongoing = self.make_event("ongoing", self.annex, -1, 1)
+        self.soon = self.make_event("soon", self.hall, 2, 3)
+        self.later = self.make_event("later", self.annex, 20, 21)
+        self.url = reverse("event-list")
+
+    def make_event(self, slug, venue, start_days, end_days):
+        return Event.objects.create(
+            title=slug.title(), slug=slug, venue=venue, capacity=10,
+            start_date=self.now + timedelta(days=start_days), end_date=self.now + timedelta(days=end_days),
+        )
+
+    def slugs(self, params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200, response.content)
+        return [item["slug"] for item in response.json()["results"]]
+
+    def test_upcoming_and_ongoing(self):
+        self.assertEqual(self.slugs({"upcoming": "true"}), ["later", "soon"])
+        self.assertEqual(self.slugs({"ongoing": "true"}), ["ongoing"])
+        self.assertEqual(self.slugs({"upcoming": "false"}), ["later", "soon", "ongoing", "past"])
+
+    def test_date_ranges(self):
+        start_after = (self.now + timedelta(days=1)).isoformat()
+        self.assertEqual(self.slugs({"start_after": start_after}), ["later", "soon"])
+        self.assertEqual(self.slugs({"start_after": start_after, "end_before": (self.now + timedelta(days=5)).isoformat()}), ["soon"])
+        self.assertEqual(self.slugs({"start_before": (self.now - timedelta(days=5)).date().isoformat()}), ["past"])
+
+    def test_venue(self):
+        self.assertEqual(self.slugs({"venue": self.hall.pk}), ["soon", "past"])
+        self.assertEqual(self.slugs({"venue": self.annex.pk, "upcoming": "1"}), ["later"])
+
+    def test_invalid_values(self):
+        response = self.client.get(self.url, {"start_after": "next week", "venue": "hall"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.json()), {"start_after", "venue"})
+
+
+class UpcomingFeedTests(APITestCase):
+    def setUp(self):
+        now = timezone.now()
+        self.venue = Venue.objects.create(name="Hall", capacity=100)
+        for slug, days in (("past", -3), ("later", 9), ("soon", 2)):
+            Event.objects.create(
+                title=slug.title(), slug=slug, venue=self.venue, capacity=10,
+                start_date=now + timedelta(days=days), end_date=now + timedelta(days=days, hours=8),
+            )
+        self.url = reverse("event-upcoming")
+
+    def test_feed_is_cached(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        data = response.json()
+        self.assertEqual([item["slug"] for item in data], ["soon", "later"])
+        self.assertEqual(data[0]["venue"]["name"], "Hall")
+        self.assertNotIn("registration_count", data[0])
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response["X-Cache"], "HIT")
+
+    def test_changes_rebuild_feed(self):
+        self.client.get(self.url)
+        event = Event.objects.get(slug="later")
+        event.title = "Renamed"
+        event.save()
+        self.assertEqual(self.client.get(self.url).json()[1]["title"], "Renamed")
+
+        self.venue.name = "Main Hall"
+        self.venue.save()
+        self.assertEqual(self.client.get(self.url).json()[0]["venue"]["name"], "Main Hall")
+
+    def test_feed_size(self):
+        with self.settings(UPCOMING_FEED_SIZE=1):
+            self.assertEqual([item["slug"] for item in self.client.get(self.url).json()], ["soon"])
@@ -0,0 +1,93 @@
+from datetime import timedelta
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from apps.events.models import Venue, Event, Track, Session
+from apps.registrations.models import Registration
+from apps.users.models import User
+
+
+class EventListQueryCountTests(APITestCase):
+    def _seed(self, n):
+        venue = Venue.objects.create(name="Hall", capacity=500)
+        now = timezone.now()
+        for i in range(Event.objects.count(), Event.objects.count() + n):
+            event = Event.objects.create(
+                title=f"Event {i}",
+                slug=f"event-{i}",
+                venue=venue,
+                capacity=100,
+                start_date=now + timedelta(days=i),
+                end_date=now + timedelta(days=i, hours=8),
+            )
+            track = Track.objects.create(event=event, title="Main")
+            Session.objects.create(
+                track=track,
+                title=f"Talk {i}",
+                start_time=event.start_date,
+                end_time=event.start_date + timedelta(hours=1),
+            )
+            user = User.objects.create_user(username=f"attendee-{i}", password="pass")
+            Registration.objects.create(attendee=user, event=event)
+
+    def _count_queries(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries)
+
+    def test_listings_issue_constant_queries(self):
+        urls = [
+            reverse("event-list"),
+            reverse("event-list") + "?expand=venue",
+            reverse("track-list") + "?expand=event.venue",
+            reverse("session-list"),
+            reverse("session-list") + "?expand=track.event.venue,speaker",
+        ]
+        for url in urls:
+            self._seed(2)
+            small = self._count_queries(url)
+            self._seed(6)
+            large = self._count_queries(url)
+            self.assertEqual(small, large, url)
+
+    def test_registration_count_comes_from_counter(self):
+        self._seed(1)
+        response = self.client.get(reverse("event-list"))
+        self.assertEqual(response.data["results"][0]["registration_count"], 1)
+
+
+class SparseFieldsetTests(APITestCase):
+    def setUp(self):
+        venue = Venue.objects.create(name="Hall", capacity=100)
+        now = timezone.now()
+        self.event = Event.objects.create(
+            title="Event", slug="event", venue=venue, capacity=10,
+            start_date=now, end_date=now + timedelta(hours=8),
+        )
+        self.track = Track.objects.create(event=self.event, title="Main")
+        self.session = Session.objects.create(
+            track=self.track, title="Talk",
+            start_time=self.event.start_date, end_time=self.event.start_date + timedelta(hours=1),
+        )
+
+    def test_relations_default_to_ids(self):
+        response = self.client.get(reverse("session-detail", args=[self.session.pk]))
+        self.assertEqual(response.data["track"], self.track.pk)
+        self.assertIsNone(response.data["speaker"])
+
+    def test_expand_nests_related_objects(self):
+        response = self.client.get(
+            reverse("session-detail", args=[self.session.pk]), {"expand": "track.event"}
+        )
+        self.assertEqual(response.data["track"]["title"], "Main")
+        self.assertEqual(response.data["track"]["event"]["title"], "Event")
+        self.assertEqual(response.data["track"]["event"]["venue"], self.event.venue_id)
+
+    def test_fields_limits_output(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("session-list"), {"fields": "id,title"})
+        self.assertEqual(list(response.data["results"][0]), ["id", "title"])
+        self.assertNotIn("description", ctx.captured_queries[-1]["sql"])
@@ -0,0 +1,26 @@
+import json
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from apps.events.models import Venue
+
+
+class QueryInstrumentationTests(APITestCase):
+    def setUp(self):
+        Venue.objects.create(name="Hall", capacity=100)
+
+    def test_server_timing_header(self):
+        response = self.client.get(reverse('venue-list'))
+        self.assertIn('db;dur=', response['Server-Timing'])
+        self.assertIn('desc="1 queries"', response['Server-Timing'])
+        self.assertIn('app;dur=', response['Server-Timing'])
+
+    @override_settings(SLOW_REQUEST_THRESHOLD_MS=0, N_PLUS_ONE_THRESHOLD=1)
+    def test_slow_requests_are_logged_with_statements(self):
+        with self.assertLogs('apps.slow_requests', level='WARNING') as logs:
+            self.client.get(reverse('venue-list'))
+        entry = json.loads(logs.records[0].getMessage())
+        self.assertEqual(entry['path'], reverse('venue-list'))
+        self.assertEqual(entry['queries'], 1)
+        self.assertEqual(len(entry['top_statements']), 1)
+        self.assertEqual(entry['n_plus_one'][0]['count'], 1)
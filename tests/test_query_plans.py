@@ -0,0 +1,22 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from apps.core.management.commands.audit_query_plans import Command
+from apps.events.models import Event
+
+
+class QueryPlanAuditTests(TestCase):
+    def test_viewset_queries_use_indexes(self):
+        out = StringIO()
+        call_command("audit_query_plans", "--seed", "--events", "5", "--sessions", "100", "--registrations", "50", stdout=out)
+        self.assertIn("No sequential scans found", out.getvalue())
+        self.assertIn("session track overlap check", out.getvalue())
+        # The audit runs in a transaction that is rolled back.
+        self.assertFalse(Event.objects.exists())
+
+    def test_unindexed_filter_is_reported(self):
+        command = Command()
+        self.assertEqual(command._sequential_scans('SELECT * FROM "events_venue" WHERE "name" = %s', ["Hall"]), ["events_venue"])
+        self.assertEqual(command._sequential_scans('SELECT * FROM "events_venue" WHERE "id" = %s', [1]), [])
@@ -46,3 +46,56 @@ class RegistrationTest(TestCase):
         from django.db import IntegrityError
         with self.assertRaises(IntegrityError):
             Registration.objects.create(attendee=u1, event=e)
+
+    def test_seat_counter_tracks_registrations(self):
+        v = Venue.objects.create(name='Test Venue', capacity=5)
+        now = timezone.now()
+        e = Event.objects.create(
+            title='Test Event 3',
+            slug='test-event-3',
+            venue=v,
+            capacity=2,
+            start_date=now,
+            end_date=now + timedelta(hours=3)
+        )
+
+        u1 = User.objects.create_user('u1', 'u1@example.com', 'pass')
+        u2 = User.objects.create_user('u2', 'u2@example.com', 'pass')
+        u3 = User.objects.create_user('u3', 'u3@example.com', 'pass')
+
+        r1 = Registration.objects.create(attendee=u1, event=e)
+        Registration.objects.create(attendee=u2, event=e)
+        e.refresh_from_db()
+        self.assertEqual(e.seats_taken, 2)
+
+        with self.assertRaises(ValidationError):
+            Registration.objects.create(attendee=u3, event=e)
+
+        r1.delete()
+        e.refresh_from_db()
+        self.assertEqual(e.seats_taken, 1)
+
+        Registration.objects.create(attendee=u3, event=e)
+        e.refresh_from_db()
+        self.assertEqual(e.seats_taken, 2)
+
+    def test_failed_insert_does_not_leak_seat(self):
+        v = Venue.objects.create(name='Test Venue', capacity=5)
+        now = timezone.now()
+        e = Event.objects.create(
+            title='Test Event 4',
+            slug='test-event-4',
+            venue=v,
+            capacity=2,
+            start_date=now,
+            end_date=now + timedelta(hours=3)
+        )
+        u1 = User.objects.create_user('u1', 'u1@example.com', 'pass')
+        Registration.objects.create(attendee=u1, event=e)
+
+        from django.db import IntegrityError
+        with self.assertRaises(IntegrityError):
+            Registration.objects.create(attendee=u1, event=e)
+
+        e.refresh_from_db()
+        self.assertEqual(e.seats_taken, 1)
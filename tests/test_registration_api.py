@@ -1,8 +1,10 @@
+from unittest import mock
+
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
 from apps.events.models import Event, Venue
-from apps.registrations.models import Registration
+from apps.registrations.models import EventFull, Registration, WaitlistEntry
 from apps.users.models import User
 from rest_framework_simplejwt.tokens import RefreshToken
 
@@ -51,5 +53,93 @@ class RegistrationAPITest(APITestCase):
         self.client.force_authenticate(user=u3)
         payload = {"event": self.event.id}
         response = self.client.post(self.url, payload, format='json')
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn("Event is full", str(response.data))
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["position"], 1)
+        self.assertEqual(Registration.objects.count(), 2)
+        self.assertTrue(WaitlistEntry.objects.filter(attendee=u3, event=self.event).exists())
+
+    def test_waitlist_is_promoted_in_order(self):
+        u2 = User.objects.create_user(username='user2', password='pass')
+        first = Registration.objects.create(attendee=self.user, event=self.event)
+        Registration.objects.create(attendee=u2, event=self.event)
+
+        queued = []
+        for name in ('user3', 'user4'):
+            user = User.objects.create_user(username=name, password='pass')
+            self.client.force_authenticate(user=user)
+            response = self.client.post(self.url, {"event": self.event.id}, format='json')
+            self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+            queued.append((user, response.data))
+        self.assertEqual([data["position"] for _, data in queued], [1, 2])
+
+        first.delete()
+
+        self.assertTrue(Registration.objects.filter(attendee=queued[0][0], event=self.event).exists())
+        self.assertFalse(WaitlistEntry.objects.filter(attendee=queued[0][0]).exists())
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.seats_taken, 2)
+
+        self.client.force_authenticate(user=queued[1][0])
+        response = self.client.get(reverse('waitlist-detail', args=[queued[1][1]["id"]]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["position"], 1)
+
+    def test_capacity_increase_promotes_waitlist(self):
+        u2 = User.objects.create_user(username='user2', password='pass')
+        u3 = User.objects.create_user(username='user3', password='pass')
+        Registration.objects.create(attendee=self.user, event=self.event)
+        Registration.objects.create(attendee=u2, event=self.event)
+        WaitlistEntry.objects.create(attendee=u3, event=self.event)
+        self.venue.capacity = 3
+        self.venue.save()
+
+        self.event.capacity = 3
+        self.event.save()
+
+        self.assertTrue(Registration.objects.filter(attendee=u3, event=self.event).exists())
+        self.assertEqual(WaitlistEntry.objects.count(), 0)
+
+    def test_deleting_event_with_waitlist(self):
+        u2 = User.objects.create_user(username='user2', password='pass')
+        u3 = User.objects.create_user(username='user3', password='pass')
+        Registration.objects.create(attendee=self.user, event=self.event)
+        Registration.objects.create(attendee=u2, event=self.event)
+        WaitlistEntry.objects.create(attendee=u3, event=self.event)
+
+        self.event.delete()
+
+        self.assertEqual(Registration.objects.count(), 0)
+        self.assertEqual(WaitlistEntry.objects.count(), 0)
+
+    def test_waitlist_list_positions_in_one_query(self):
+        Registration.objects.create(attendee=self.user, event=self.event)
+        Registration.objects.create(attendee=User.objects.create_user(username='user2', password='pass'), event=self.event)
+        waiting = [User.objects.create_user(username=f'queued{i}', password='pass') for i in range(5)]
+        for user in waiting:
+            WaitlistEntry.objects.create(attendee=user, event=self.event)
+
+        organizer = User.objects.create_user(username='organizer', password='pass', is_organizer=True)
+        self.client.force_authenticate(user=organizer)
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('waitlist-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([entry["position"] for entry in response.data["results"]], [1, 2, 3, 4, 5])
+
+        # An attendee's own list keeps the queue-wide place.
+        self.client.force_authenticate(user=waiting[3])
+        response = self.client.get(reverse('waitlist-list'))
+        self.assertEqual([entry["position"] for entry in response.data["results"]], [4])
+
+    def test_promotion_during_enqueue_with_claims_token(self):
+        """A seat freed between the failed claim and the enqueue registers the caller."""
+        User.objects.create_user(username='claims', password='pass')
+        token = self.client.post(
+            reverse('token_obtain_pair'), {"username": "claims", "password": "pass"}, format='json'
+        ).data["access"]
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+        with mock.patch('apps.registrations.views.RegistrationViewSet.perform_create', side_effect=EventFull("full")):
+            response = self.client.post(self.url, {"event": self.event.id}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(Registration.objects.filter(attendee__username='claims', event=self.event).exists())
+        self.assertFalse(WaitlistEntry.objects.exists())
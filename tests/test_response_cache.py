@@ -0,0 +1,62 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from apps.events.models import Event, Venue
+from apps.registrations.models import Registration
+from apps.users.models import User
+
+
+class ResponseCacheTests(APITestCase):
+    def setUp(self):
+        self.venue = Venue.objects.create(name="Hall", capacity=100)
+        self.event = Event.objects.create(
+            title="Event 1",
+            slug="event-1",
+            venue=self.venue,
+            capacity=10,
+            start_date="2025-10-01T09:00:00Z",
+            end_date="2025-10-01T17:00:00Z"
+        )
+        self.url = reverse('event-list')
+
+    def test_repeated_get_is_served_from_cache(self):
+        first = self.client.get(self.url)
+        self.assertEqual(first["X-Cache"], "MISS")
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(first.data, second.data)
+
+    def test_query_params_are_part_of_the_key(self):
+        self.client.get(self.url)
+        response = self.client.get(self.url, {"search": "nothing-matches"})
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["results"], [])
+
+    def test_writes_invalidate_dependent_entries(self):
+        self.client.get(self.url)
+        self.event.title = "Renamed"
+        self.event.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["results"][0]["title"], "Renamed")
+
+        user = User.objects.create_user(username="attendee", password="pass")
+        Registration.objects.create(attendee=user, event=self.event)
+        response = self.client.get(reverse('event-detail', args=[self.event.pk]))
+        self.assertEqual(response.data["registration_count"], 1)
+        registration = Registration.objects.get()
+        registration.delete()
+        response = self.client.get(reverse('event-detail', args=[self.event.pk]))
+        self.assertEqual(response.data["registration_count"], 0)
+
+    def test_generations_are_shared_between_workers(self):
+        """Another worker's write only reaches this one through the shared cache."""
+        self.client.get(self.url)
+        # Simulate a write handled by another worker: its per-process
+        # payload cache is separate, the generation store is not.
+        caches[settings.SHARED_CACHE_ALIAS].set("generation:events.event", 0, timeout=None)
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertIsNone(caches[settings.API_CACHE_ALIAS].get("generation:events.event"))
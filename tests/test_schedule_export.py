@@ -0,0 +1,72 @@
+import csv
+import io
+from unittest import mock
+
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from apps.core.throttling import AnonRateThrottle
+
+from apps.events.models import Event, Session, Speaker, Track, Venue
+
+
+class ScheduleExportTests(APITestCase):
+    def setUp(self):
+        venue = Venue.objects.create(name="Hall", capacity=100)
+        self.event = Event.objects.create(
+            title="PyCon",
+            slug="pycon",
+            venue=venue,
+            capacity=100,
+            start_date="2025-11-01T09:00:00Z",
+            end_date="2025-11-01T17:00:00Z"
+        )
+        self.event.refresh_from_db()
+        track = Track.objects.create(event=self.event, title="Main")
+        speaker = Speaker.objects.create(name="Ada")
+        Session.objects.create(
+            track=track, title="Talk, with comma", speaker=speaker, room="A1",
+            start_time="2025-11-01T10:00:00Z", end_time="2025-11-01T11:00:00Z",
+            description="x" * 200,
+        )
+        Session.objects.create(
+            track=track, title="Keynote",
+            start_time="2025-11-01T09:00:00Z", end_time="2025-11-01T10:00:00Z"
+        )
+
+    def export(self, fmt, pk=None):
+        return self.client.get(reverse('event-schedule-export', kwargs={"pk": pk or self.event.pk, "fmt": fmt}))
+
+    def test_csv_streams_sessions_in_order(self):
+        response = self.export("csv")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertIn('filename="pycon-schedule.csv"', response["Content-Disposition"])
+        rows = list(csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode())))
+        self.assertEqual([row["title"] for row in rows], ["Keynote", "Talk, with comma"])
+        self.assertEqual(rows[1]["speaker"], "Ada")
+        self.assertEqual(rows[1]["track"], "Main")
+
+    def test_ics_is_valid_calendar(self):
+        response = self.export("ics")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/calendar"))
+        body = b"".join(response.streaming_content).decode()
+        lines = body.split("\r\n")
+        self.assertEqual(lines[0], "BEGIN:VCALENDAR")
+        self.assertEqual(body.count("BEGIN:VEVENT"), 2)
+        self.assertIn("SUMMARY:Talk\\, with comma", lines)
+        self.assertIn("DTSTART:20251101T100000Z", lines)
+        self.assertTrue(all(len(line.encode()) <= 75 for line in lines))
+        self.assertTrue(body.endswith("END:VCALENDAR\r\n"))
+
+    def test_unknown_event_is_404(self):
+        self.assertEqual(self.export("csv", pk=self.event.pk + 1).status_code, 404)
+
+    def test_throttled_like_the_api(self):
+        with mock.patch.object(AnonRateThrottle, "THROTTLE_RATES", {"anon": "2/min"}):
+            statuses = [self.export("csv").status_code for _ in range(3)]
+            response = self.export("ics")
+        self.assertEqual(statuses, [200, 200, 429])
+        self.assertEqual(response.status_code, 429)
+        self.assertIn("Retry-After", response)
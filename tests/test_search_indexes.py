@@ -0,0 +1,19 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.test import SimpleTestCase
+
+from apps.core.search import FullTextSearchFilter, search_vector
+from apps.events.views import EventViewSet, SessionViewSet, SpeakerViewSet, TrackViewSet, VenueViewSet
+
+
+class SearchIndexTests(SimpleTestCase):
+    def test_every_full_text_search_has_a_matching_gin_index(self):
+        """Without a matching expression index every search recomputes to_tsvector per row."""
+        for viewset in (VenueViewSet, EventViewSet, TrackViewSet, SpeakerViewSet, SessionViewSet):
+            with self.subTest(viewset=viewset.__name__):
+                self.assertIn(FullTextSearchFilter, viewset.filter_backends)
+                model = viewset.queryset.model
+                expressions = [
+                    index.expressions[0] for index in model._meta.indexes
+                    if isinstance(index, GinIndex) and index.expressions
+                ]
+                self.assertIn(search_vector(*viewset.search_fields), expressions)
@@ -0,0 +1,74 @@
+from types import SimpleNamespace
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, override_settings
+
+from apps.core.checks import check_counter_caches, check_shared_cache
+from apps.core.throttling import UserRateThrottle
+
+
+class ThreePerMinute(UserRateThrottle):
+    rate = '3/min'
+
+
+class SlidingWindowThrottleTests(SimpleTestCase):
+    def setUp(self):
+        self.now = 6000.0
+        self.request = SimpleNamespace(user=SimpleNamespace(is_authenticated=True, pk=1), META={})
+
+    def allow(self):
+        throttle = ThreePerMinute()
+        throttle.timer = lambda: self.now
+        return throttle.allow_request(self.request, None), throttle
+
+    def test_limits_within_window(self):
+        self.assertEqual([self.allow()[0] for _ in range(4)], [True, True, True, False])
+
+    def test_rejections_do_not_consume_budget(self):
+        for _ in range(3):
+            self.allow()
+        for _ in range(5):
+            self.assertFalse(self.allow()[0])
+        # Half of the previous window still counts: 3 * 0.5 leaves room for one.
+        self.now += 90
+        self.assertEqual([self.allow()[0] for _ in range(3)], [True, False, False])
+
+    def test_wait_tracks_sliding_window(self):
+        for _ in range(3):
+            self.allow()
+        self.now += 60
+        allowed, throttle = self.allow()
+        self.assertFalse(allowed)
+        # One third of the previous window has to slide out first.
+        self.assertAlmostEqual(throttle.wait(), 20)
+
+
+FILE_THROTTLE_CACHE = {
+    **settings.CACHES,
+    'throttle': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': '/tmp/event-management-throttle-test',
+    },
+}
+
+
+@override_settings(CACHES=FILE_THROTTLE_CACHE)
+class ThrottleCacheConfigTests(SimpleTestCase):
+    def test_non_atomic_backend_is_refused(self):
+        with self.assertRaises(ImproperlyConfigured):
+            ThreePerMinute()
+
+    def test_system_check_reports_non_atomic_backend(self):
+        self.assertEqual([error.id for error in check_counter_caches(None)], ['core.E001'])
+
+
+class SharedCacheCheckTests(SimpleTestCase):
+    def test_per_process_shared_cache_is_reported(self):
+        self.assertEqual([warning.id for warning in check_shared_cache(None)], ['core.W002'])
+
+    @override_settings(CACHES={
+        **settings.CACHES, 'shared': {'BACKEND': 'django.core.cache.backends.redis.RedisCache'},
+    })
+    def test_redis_shared_cache_passes(self):
+        self.assertEqual(check_shared_cache(None), [])